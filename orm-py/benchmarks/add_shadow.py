@@ -0,0 +1,91 @@
+"""Copy rate of BaseModel.add_shadow() and the write rate of the primary meanwhile
+
+python benchmarks/add_shadow.py --db-type mysql --rows 200000 --shadow ormtest_m1
+
+The last `--shadow` is the one added, any other is attached from the start.
+Each run copies the table once idle and once while `--writers` threads keep
+creating and updating rows.
+"""
+
+import threading
+
+from common import Timer, connection_parser, connections, report
+from sa_orm.base_model import BaseModel
+
+
+class BenchRow(BaseModel):
+    _table_name = "bench_add_shadow"
+    _primary_key = "id"
+
+
+COLUMNS = {"name": "VARCHAR(100) NOT NULL", "age": "INTEGER"}
+
+
+def write_until(stop: threading.Event, counts: list, slot: int):
+    while not stop.is_set():
+        row = BenchRow.create(name=f"writer{slot}", age=0)
+        row.update(age=1)
+        counts[slot] += 2
+
+
+def run(label, dbs, added, args, writers):
+    BenchRow.set_database(dbs + [added])
+    BenchRow.drop_table()
+    BenchRow.set_database(dbs)
+    BenchRow.create_table(COLUMNS)
+    BenchRow.bulk_create(
+        [{"name": f"user{i}", "age": i % 100} for i in range(args.rows)]
+    )
+
+    stop = threading.Event()
+    counts = [0] * writers
+    threads = [
+        threading.Thread(target=write_until, args=(stop, counts, slot))
+        for slot in range(writers)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        with Timer() as t:
+            stats = BenchRow.add_shadow(
+                added,
+                chunk_size=args.chunk_size,
+                workers=args.workers,
+                max_rows_per_second=args.max_rows_per_second,
+                fsync=False,
+            )
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    report(label, stats["rows"], t.elapsed)
+    if writers:
+        report(f"{'':<4}writes meanwhile", sum(counts), t.elapsed, "writes")
+    print(
+        f"{'':<32} {stats['captured']} writes captured, {stats['paused']:.2f}s paused"
+    )
+
+
+if __name__ == "__main__":
+    parser = connection_parser(__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--max-rows-per-second", type=float, default=None)
+    args = parser.parse_args()
+    if not args.shadow:
+        parser.error("--shadow is required, the last one is the shadow added")
+
+    *dbs, added = connections(args)
+    for db in dbs + [added]:
+        db.enable_pool(max_size=args.workers + args.writers + 2)
+
+    try:
+        run("add_shadow() idle", dbs, added, args, 0)
+        run(f"add_shadow() {args.writers} writers", dbs, added, args, args.writers)
+    finally:
+        BenchRow.set_database(dbs + [added])
+        BenchRow.drop_table()
+        BenchRow.disconnect()
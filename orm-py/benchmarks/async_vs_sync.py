@@ -0,0 +1,121 @@
+"""Requests/sec of BaseModel on a thread pool vs AsyncBaseModel on one event loop
+
+Both sides run `--concurrency` workers doing find_by_id + update round trips;
+the sync side checks connections out of a pool of the same size.
+
+python benchmarks/async_vs_sync.py --db-type postgres --requests 20000 --concurrency 64
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from common import DEFAULTS, Timer, connection_parser, report
+from sa_orm.async_model import AsyncBaseModel
+from sa_orm.base.conn import createAsyncConnection, createConnection
+from sa_orm.base_model import BaseModel
+
+
+class SyncRow(BaseModel):
+    _table_name = "bench_async_vs_sync"
+    _primary_key = "id"
+
+
+class AsyncRow(AsyncBaseModel):
+    _table_name = "bench_async_vs_sync"
+    _primary_key = "id"
+
+
+COLUMNS = {"name": "VARCHAR(100) NOT NULL", "hits": "INTEGER"}
+
+
+def connection_kwargs(args, database=None):
+    defaults = DEFAULTS.get(args.db_type, {})
+    return dict(
+        host=args.host,
+        port=args.port or defaults.get("port"),
+        database=database or args.database,
+        user=args.user or defaults.get("user"),
+        password=args.password,
+        db_type=args.db_type,
+    )
+
+
+def run_sync(args, ids):
+    pool = {"min_size": args.concurrency, "max_size": args.concurrency}
+    SyncRow.set_database(
+        [createConnection(**connection_kwargs(args), pool=pool)]
+        + [
+            createConnection(**connection_kwargs(args, name), pool=pool)
+            for name in args.shadow
+        ]
+    )
+    SyncRow.set_shadow_fanout(parallel=True)
+
+    def request(record_id):
+        row = SyncRow.find_by_id(record_id)
+        row.update(hits=row.hits + 1)
+
+    try:
+        with Timer() as t:
+            with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+                list(executor.map(request, ids))
+        report(f"sync, {args.concurrency} threads", len(ids), t.elapsed, "requests")
+    finally:
+        SyncRow.disconnect()
+
+
+async def run_async(args, ids):
+    AsyncRow.set_database(
+        [createAsyncConnection(**connection_kwargs(args), pool_size=args.concurrency)]
+        + [
+            createAsyncConnection(
+                **connection_kwargs(args, name), pool_size=args.concurrency
+            )
+            for name in args.shadow
+        ]
+    )
+    for db in [AsyncRow._db] + AsyncRow._shadows:
+        await db.connect()
+
+    queue = asyncio.Queue()
+    for record_id in ids:
+        queue.put_nowait(record_id)
+
+    async def worker():
+        while not queue.empty():
+            row = await AsyncRow.find_by_id(queue.get_nowait())
+            await row.update(hits=row.hits + 1)
+
+    try:
+        with Timer() as t:
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        report(f"async, {args.concurrency} tasks", len(ids), t.elapsed, "requests")
+    finally:
+        await AsyncRow.disconnect()
+
+
+if __name__ == "__main__":
+    parser = connection_parser(__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    SyncRow.set_database(
+        [createConnection(**connection_kwargs(args))]
+        + [createConnection(**connection_kwargs(args, name)) for name in args.shadow]
+    )
+    SyncRow.drop_table()
+    SyncRow.create_table(COLUMNS)
+    created = SyncRow.bulk_create(
+        [{"name": f"row{i}", "hits": 0} for i in range(args.rows)]
+    )
+    SyncRow.disconnect()
+
+    ids = [created[i % len(created)].id for i in range(args.requests)]
+    run_sync(args, ids)
+    asyncio.run(run_async(args, ids))
+
+    SyncRow.set_database([createConnection(**connection_kwargs(args))])
+    SyncRow.drop_table()
+    SyncRow.disconnect()
@@ -0,0 +1,54 @@
+"""Insert throughput of BaseModel.create() in a loop vs BaseModel.bulk_create()
+
+python benchmarks/bulk_create.py --db-type mysql --rows 100000 --shadow ormtest_m1
+"""
+
+from common import Timer, connection_parser, connections, report
+from sa_orm.base_model import BaseModel
+
+
+class BenchRow(BaseModel):
+    _table_name = "bench_bulk_create"
+    _primary_key = "id"
+
+
+COLUMNS = {"name": "VARCHAR(100) NOT NULL", "email": "VARCHAR(255)", "age": "INTEGER"}
+
+
+def make_rows(count: int):
+    return [
+        {"name": f"user{i}", "email": f"user{i}@example.com", "age": i % 90}
+        for i in range(count)
+    ]
+
+
+if __name__ == "__main__":
+    parser = connection_parser(__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--loop-rows",
+        type=int,
+        default=1000,
+        help="rows inserted with create() one by one for the baseline",
+    )
+    args = parser.parse_args()
+
+    BenchRow.set_database(connections(args))
+    try:
+        BenchRow.drop_table()
+        BenchRow.create_table(COLUMNS)
+
+        rows = make_rows(args.loop_rows)
+        with Timer() as t:
+            for row in rows:
+                BenchRow.create(**row)
+        report("create() loop", len(rows), t.elapsed)
+
+        rows = make_rows(args.rows)
+        with Timer() as t:
+            BenchRow.bulk_create(rows, batch_size=args.batch_size)
+        report(f"bulk_create(batch={args.batch_size})", len(rows), t.elapsed)
+    finally:
+        BenchRow.drop_table()
+        BenchRow.disconnect()
@@ -0,0 +1,68 @@
+"""Shared command line and timing helpers for the benchmark scripts"""
+
+import argparse
+import time
+from typing import List
+
+from sa_orm.base.declare import BaseDC, DatabaseType
+from sa_orm.base.conn import createConnection
+
+# Defaults match the servers started by docker-compose.yaml
+DEFAULTS = {
+    DatabaseType.MYSQL: {"port": 10400, "user": "root"},
+    DatabaseType.POSTGRESQL: {"port": 10300, "user": "postgres"},
+}
+
+
+def connection_parser(description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--db-type",
+        type=DatabaseType,
+        default=DatabaseType.MYSQL,
+        choices=list(DatabaseType),
+        help="backend of the primary and shadow databases",
+    )
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--database", default="ormtest")
+    parser.add_argument("--user", default=None)
+    parser.add_argument("--password", default="SudoPass")
+    parser.add_argument(
+        "--shadow",
+        action="append",
+        default=[],
+        help="database name of a shadow on the same server (repeatable)",
+    )
+    return parser
+
+
+def connect(args: argparse.Namespace, database: str | None = None) -> BaseDC:
+    defaults = DEFAULTS.get(args.db_type, {})
+    return createConnection(
+        host=args.host,
+        port=args.port or defaults.get("port"),
+        database=database or args.database,
+        user=args.user or defaults.get("user"),
+        password=args.password,
+        db_type=args.db_type,
+    )
+
+
+def connections(args: argparse.Namespace) -> List[BaseDC]:
+    """Primary followed by the requested shadows"""
+    return [connect(args)] + [connect(args, name) for name in args.shadow]
+
+
+class Timer:
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.start
+
+
+def report(label: str, count: int, elapsed: float, unit: str = "rows"):
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(f"{label:<32} {count:>10} {unit} in {elapsed:8.3f}s  {rate:12.1f} {unit}/sec")
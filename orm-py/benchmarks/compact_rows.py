@@ -0,0 +1,98 @@
+"""Memory per row and hydration speed of dict-based vs __slots__ (compact) instances
+
+python benchmarks/compact_rows.py --db-type mysql --rows 200000
+
+"hydrate" builds instances from rows already fetched, so it isolates the
+instance overhead; "find_all" includes the query.
+"""
+
+import gc
+import tracemalloc
+
+from common import Timer, connection_parser, connect, report
+from sa_orm.base_model import BaseModel, OperationsFactory
+
+
+class DictRow(BaseModel):
+    _table_name = "bench_compact_rows"
+    _primary_key = "id"
+
+
+class CompactRow(DictRow):
+    _compact_rows = True
+
+
+COLUMNS = {
+    "name": "VARCHAR(100) NOT NULL",
+    "email": "VARCHAR(255)",
+    "age": "INTEGER",
+    "city": "VARCHAR(100)",
+    "score": "INTEGER",
+}
+
+
+def bytes_per_row(build, count):
+    gc.collect()
+    tracemalloc.start()
+    instances = build()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return used / count
+
+
+def run(model, records):
+    label = "compact" if model._compact_rows else "dict"
+
+    with Timer() as t:
+        instances = [model._loaded(record) for record in records]
+    report(f"{label} hydrate", len(records), t.elapsed)
+    del instances
+    size = bytes_per_row(lambda: [model._loaded(r) for r in records], len(records))
+    print(f"{'':<32} {size:10.1f} bytes per instance")
+
+    with Timer() as t:
+        instances = model.find_all()
+    report(f"{label} find_all", len(instances), t.elapsed)
+    del instances
+    size = bytes_per_row(model.find_all, len(records))
+    print(f"{'':<32} {size:10.1f} bytes per row, values included")
+
+
+if __name__ == "__main__":
+    parser = connection_parser(__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    args = parser.parse_args()
+
+    db = connect(args)
+    DictRow.set_database([db])
+    CompactRow.set_database([db])
+    try:
+        DictRow.drop_table()
+        DictRow.create_table(COLUMNS)
+        DictRow.bulk_create(
+            [
+                {
+                    "name": f"user{i}",
+                    "email": f"user{i}@example.com",
+                    "age": i % 90,
+                    "city": f"city{i % 50}",
+                    "score": i,
+                }
+                for i in range(args.rows)
+            ]
+        )
+
+        ops = OperationsFactory.get_operations(db)
+        rows = ops.execute_query(db, ops.select_sql(DictRow._table_name), fetch=True)
+        records = [
+            ops.row_to_dict(db, DictRow._table_name, rows, row)
+            for row in rows["result"]
+        ]
+        del rows
+
+        run(DictRow, records)
+        run(CompactRow, records)
+    finally:
+        DictRow.drop_table()
+        db.disconnect()
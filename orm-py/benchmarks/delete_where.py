@@ -0,0 +1,58 @@
+"""Delete throughput of delete_by_id() in a loop vs set-based delete_where()
+
+python benchmarks/delete_where.py --db-type mysql --rows 100000 --shadow ormtest_m1
+"""
+
+from common import Timer, connection_parser, connections, report
+from sa_orm.base_model import BaseModel
+
+
+class BenchRow(BaseModel):
+    _table_name = "bench_delete_where"
+    _primary_key = "id"
+
+
+COLUMNS = {"name": "VARCHAR(100) NOT NULL", "expired": "INTEGER"}
+
+
+def load(count: int):
+    BenchRow.drop_table()
+    BenchRow.create_table(COLUMNS)
+    BenchRow.bulk_create([{"name": f"user{i}", "expired": i % 2} for i in range(count)])
+
+
+if __name__ == "__main__":
+    parser = connection_parser(__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument(
+        "--loop-rows",
+        type=int,
+        default=1000,
+        help="rows deleted with delete_by_id() one by one for the baseline",
+    )
+    args = parser.parse_args()
+
+    BenchRow.set_database(connections(args))
+    try:
+        load(args.loop_rows)
+        ids = [row.id for row in BenchRow.find_all("expired = %s", (1,))]
+        with Timer() as t:
+            for record_id in ids:
+                BenchRow.delete_by_id(record_id)
+        report("delete_by_id() loop", len(ids), t.elapsed)
+
+        load(args.rows)
+        with Timer() as t:
+            count = BenchRow.delete_where("expired = %s", (1,))
+        report("delete_where()", count, t.elapsed)
+
+        load(args.rows)
+        with Timer() as t:
+            count = BenchRow.delete_where(
+                "expired = %s", (1,), chunk_size=args.chunk_size
+            )
+        report(f"delete_where(chunk={args.chunk_size})", count, t.elapsed)
+    finally:
+        BenchRow.drop_table()
+        BenchRow.disconnect()
@@ -0,0 +1,89 @@
+"""Import cost of the ORM modules, and a guard against eager driver imports
+
+Runs `python -X importtime` in a fresh interpreter, prints the slowest modules
+and exits non-zero when a database driver or a module only some features need
+is imported, when the root logger is reconfigured, or when the total exceeds
+--max-ms.
+
+python benchmarks/import_time.py --max-ms 150
+"""
+
+import argparse
+import subprocess
+import sys
+
+MODULES = ["sa_orm.base_model", "sa_orm.base.conn", "sa_orm.async_model"]
+
+# Must only be imported once a connection of that type is created
+DRIVERS = ("mysql", "psycopg", "psycopg_pool", "aiomysql")
+
+# Only imported by the features using them (add_shadow, async replication,
+# parallel fan-out, caches). Checked without async_model, asyncio imports
+# concurrent.futures itself
+SYNC_MODULES = ["sa_orm.base_model", "sa_orm.base.conn"]
+DEFERRED = (
+    "sa_orm.base.backfill",
+    "sa_orm.base.journal",
+    "concurrent.futures",
+    "shutil",
+    "tempfile",
+)
+
+CHECK_LOGGING = (
+    "import logging; "
+    "assert not logging.getLogger().handlers, 'root logger was configured on import'"
+)
+
+
+def import_times(modules):
+    code = "; ".join(f"import {m}" for m in modules) + "; " + CHECK_LOGGING
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+
+    if proc.returncode != 0:
+        raise SystemExit(proc.stderr)
+
+    # import time:       self [us] |  cumulative | imported package
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-ms", type=float, default=None)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    times = import_times(MODULES)
+
+    print(f"{'module':<48} {'self ms':>10} {'cumulative ms':>14}")
+    for name, (self_us, cumulative_us) in sorted(
+        times.items(), key=lambda item: item[1][0], reverse=True
+    )[: args.top]:
+        print(f"{name:<48} {self_us / 1000:>10.2f} {cumulative_us / 1000:>14.2f}")
+
+    total_ms = sum(times[m][1] for m in MODULES if m in times) / 1000
+    print(f"\n{'sa_orm total':<48} {'':>10} {total_ms:>14.2f}")
+
+    failures = []
+    drivers = sorted(name for name in times if name.split(".")[0] in DRIVERS)
+    if drivers:
+        failures.append(f"drivers imported eagerly: {', '.join(drivers)}")
+    sync_times = import_times(SYNC_MODULES)
+    deferred = sorted(name for name in DEFERRED if name in sync_times)
+    if deferred:
+        failures.append(f"modules imported eagerly: {', '.join(deferred)}")
+    if args.max_ms is not None and total_ms > args.max_ms:
+        failures.append(f"import took {total_ms:.1f}ms, budget is {args.max_ms}ms")
+
+    if failures:
+        raise SystemExit("FAIL: " + "; ".join(failures))
+    print("OK: no database driver or deferred module imported")
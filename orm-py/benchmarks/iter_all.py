@@ -0,0 +1,55 @@
+"""Peak Python memory of BaseModel.find_all() vs BaseModel.iter_all() over a whole table
+
+python benchmarks/iter_all.py --db-type postgresql --rows 1000000 --batch-size 2000
+"""
+
+import tracemalloc
+
+from common import Timer, connection_parser, connections, report
+from sa_orm.base_model import BaseModel
+
+
+class BenchRow(BaseModel):
+    _table_name = "bench_iter_all"
+    _primary_key = "id"
+
+
+COLUMNS = {"name": "VARCHAR(100) NOT NULL", "email": "VARCHAR(255)", "age": "INTEGER"}
+
+
+def measure(label, count_rows):
+    tracemalloc.start()
+    with Timer() as t:
+        count = count_rows()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report(label, count, t.elapsed)
+    print(f"{'':<32} peak memory {peak / 1024 / 1024:10.1f} MiB")
+
+
+if __name__ == "__main__":
+    parser = connection_parser(__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    BenchRow.set_database(connections(args)[:1])
+    try:
+        BenchRow.drop_table()
+        BenchRow.create_table(COLUMNS)
+        for start in range(0, args.rows, 10000):
+            BenchRow.bulk_create(
+                [
+                    {"name": f"user{i}", "email": f"user{i}@example.com", "age": i % 90}
+                    for i in range(start, min(start + 10000, args.rows))
+                ]
+            )
+
+        measure("find_all()", lambda: len(BenchRow.find_all()))
+        measure(
+            f"iter_all(batch={args.batch_size})",
+            lambda: sum(1 for _ in BenchRow.iter_all(batch_size=args.batch_size)),
+        )
+    finally:
+        BenchRow.drop_table()
+        BenchRow.disconnect()
@@ -0,0 +1,65 @@
+"""Latency of repeated find_by_id()/update() with and without server-side prepared statements
+
+python benchmarks/prepared.py --db-type mysql --rows 10000 --lookups 20000
+"""
+
+import random
+
+from common import Timer, connection_parser, connect, report
+from sa_orm.base.declare import DatabaseType
+from sa_orm.base_model import BaseModel
+
+
+class BenchRow(BaseModel):
+    _table_name = "bench_prepared"
+    _primary_key = "id"
+
+
+COLUMNS = {"name": "VARCHAR(100) NOT NULL", "email": "VARCHAR(255)", "age": "INTEGER"}
+
+
+def run(label, db, ids):
+    BenchRow.set_database([db])
+    with Timer() as t:
+        for record_id in ids:
+            BenchRow.find_by_id(record_id)
+    report(f"{label} find_by_id", len(ids), t.elapsed, "queries")
+
+    with Timer() as t:
+        for record_id in ids:
+            BenchRow(id=record_id, name=f"user{record_id}", age=record_id % 90).update()
+    report(f"{label} update", len(ids), t.elapsed, "queries")
+    print(f"{'':<32} {db.statement_stats()}")
+
+
+if __name__ == "__main__":
+    parser = connection_parser(__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    args = parser.parse_args()
+
+    plain, prepared = connect(args), connect(args)
+    prepared.enable_prepared_statements()
+    if args.db_type == DatabaseType.POSTGRESQL:
+        # psycopg prepares on its own after 5 runs, switch that off for the baseline
+        plain.connection.prepare_threshold = None
+
+    BenchRow.set_database([plain])
+    try:
+        BenchRow.drop_table()
+        BenchRow.create_table(COLUMNS)
+        BenchRow.bulk_create(
+            [
+                {"name": f"user{i}", "email": f"user{i}@example.com", "age": i % 90}
+                for i in range(args.rows)
+            ]
+        )
+
+        ids = [random.randint(1, args.rows) for _ in range(args.lookups)]
+        run("unprepared", plain, ids)
+        run("prepared", prepared, ids)
+    finally:
+        BenchRow.set_database([plain])
+        BenchRow.drop_table()
+        plain.disconnect()
+        prepared.disconnect()
@@ -0,0 +1,77 @@
+"""Speed and memory of find_all() for each result shape
+
+python benchmarks/result_shapes.py --db-type mysql --rows 200000
+
+"columns" is filled batch by batch from a streaming cursor; with NumPy
+installed (`pip install sa_orm[numpy]`) it returns arrays, otherwise
+array.array for numeric columns and lists for the rest.
+"""
+
+import gc
+import tracemalloc
+
+from common import Timer, connection_parser, connect, report
+from sa_orm.base.shapes import SHAPES, numpy_module
+from sa_orm.base_model import BaseModel
+
+
+class BenchRow(BaseModel):
+    _table_name = "bench_result_shapes"
+    _primary_key = "id"
+
+
+COLUMNS = {
+    "name": "VARCHAR(100) NOT NULL",
+    "age": "INTEGER",
+    "city": "VARCHAR(100)",
+    "score": "DOUBLE PRECISION",
+}
+
+
+def bytes_per_row(read, count):
+    gc.collect()
+    tracemalloc.start()
+    result = read()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return used / count
+
+
+def run(as_, count):
+    with Timer() as t:
+        result = BenchRow.find_all(as_=as_)
+    report(f"find_all as_={as_}", count, t.elapsed)
+    del result
+    size = bytes_per_row(lambda: BenchRow.find_all(as_=as_), count)
+    print(f"{'':<32} {size:10.1f} bytes per row, values included")
+
+
+if __name__ == "__main__":
+    parser = connection_parser(__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    args = parser.parse_args()
+
+    db = connect(args)
+    BenchRow.set_database([db])
+    try:
+        BenchRow.drop_table()
+        BenchRow.create_table(COLUMNS)
+        BenchRow.bulk_create(
+            [
+                {
+                    "name": f"user{i}",
+                    "age": i % 90,
+                    "city": f"city{i % 50}",
+                    "score": i / 7,
+                }
+                for i in range(args.rows)
+            ]
+        )
+
+        print("columns use", "numpy" if numpy_module() else "array.array / list")
+        for as_ in SHAPES:
+            run(as_, args.rows)
+    finally:
+        BenchRow.drop_table()
+        db.disconnect()
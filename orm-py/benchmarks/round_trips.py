@@ -0,0 +1,111 @@
+"""Round trips per create()/update() with and without the read-back of the written row
+
+python benchmarks/round_trips.py --db-type mysql --rows 2000
+
+Every driver call that waits for the server (execute, commit, rollback, ping)
+is counted on the primary connection.
+"""
+
+from common import Timer, connection_parser, connect, report
+from sa_orm.base_model import BaseModel
+
+
+class BenchRow(BaseModel):
+    _table_name = "bench_round_trips"
+    _primary_key = "id"
+
+
+COLUMNS = {"name": "VARCHAR(100) NOT NULL", "email": "VARCHAR(255)", "age": "INTEGER"}
+ROUND_TRIPS = {"execute", "executemany", "commit", "rollback", "ping", "is_connected"}
+
+
+class Counter:
+    def __init__(self):
+        self.calls = {}
+
+    def wrap(self, target):
+        return _Counted(target, self)
+
+    def total(self) -> int:
+        return sum(self.calls.values())
+
+
+class _Counted:
+    """Proxy counting the round-trip calls of a driver connection and its cursors"""
+
+    def __init__(self, target, counter: Counter):
+        self._target = target
+        self._counter = counter
+
+    def cursor(self, *args, **kwargs):
+        return _Counted(self._target.cursor(*args, **kwargs), self._counter)
+
+    def __enter__(self):
+        self._target.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._target.__exit__(*exc)
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if name not in ROUND_TRIPS:
+            return attr
+
+        def counted(*args, **kwargs):
+            calls = self._counter.calls
+            calls[name] = calls.get(name, 0) + 1
+            return attr(*args, **kwargs)
+
+        return counted
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._target, name, value)
+
+
+def run(label, counter, rows, refresh):
+    BenchRow.set_write_refresh(refresh)
+
+    counter.calls.clear()
+    with Timer() as t:
+        created = [BenchRow.create(**row) for row in rows]
+    report(f"{label} create", len(rows), t.elapsed, "queries")
+    print(f"{'':<32} {counter.total() / len(rows):.2f} round trips each {counter.calls}")
+
+    counter.calls.clear()
+    with Timer() as t:
+        for instance in created:
+            instance.update(age=instance.age + 1)
+    report(f"{label} update", len(rows), t.elapsed, "queries")
+    print(f"{'':<32} {counter.total() / len(rows):.2f} round trips each {counter.calls}")
+
+
+if __name__ == "__main__":
+    parser = connection_parser(__doc__)
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    db = connect(args)
+    counter = Counter()
+    open_connection = db.open_connection
+    db.open_connection = lambda: counter.wrap(open_connection())
+    db.connect()
+
+    BenchRow.set_database([db])
+    try:
+        BenchRow.drop_table()
+        BenchRow.create_table(COLUMNS)
+
+        rows = [
+            {"name": f"user{i}", "email": f"user{i}@example.com", "age": i % 90}
+            for i in range(args.rows)
+        ]
+        run("refresh", counter, rows, refresh=True)
+        run("no refresh", counter, rows, refresh=False)
+    finally:
+        BenchRow.set_write_refresh(True)
+        BenchRow.drop_table()
+        db.disconnect()
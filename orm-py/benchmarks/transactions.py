@@ -0,0 +1,71 @@
+"""Commits per request with one commit per statement vs BaseModel.transaction()
+
+python benchmarks/transactions.py --db-type mysql --requests 500 --shadow ormtest_m1
+
+A "request" creates `--writes` rows and updates half of them. Commits are
+counted on the driver connections of the primary and every shadow.
+"""
+
+from common import Timer, connection_parser, connections, report
+from round_trips import Counter
+from sa_orm.base_model import BaseModel
+
+
+class BenchRow(BaseModel):
+    _table_name = "bench_transactions"
+    _primary_key = "id"
+
+
+COLUMNS = {"name": "VARCHAR(100) NOT NULL", "age": "INTEGER"}
+
+
+def handle_request(request: int, writes: int):
+    rows = [BenchRow.create(name=f"user{request}_{i}", age=i) for i in range(writes)]
+    for row in rows[::2]:
+        row.update(age=row.age + 1)
+
+
+def counted(db, counter: Counter):
+    open_connection = db.open_connection
+    db.open_connection = lambda: counter.wrap(open_connection())
+
+
+def run(label, counter, requests, writes, in_transaction):
+    counter.calls.clear()
+    saved = 0
+    with Timer() as t:
+        for request in range(requests):
+            if not in_transaction:
+                handle_request(request, writes)
+                continue
+            with BenchRow.transaction() as txn:
+                handle_request(request, writes)
+            saved += txn.stats()["commits_saved"]
+    report(label, requests, t.elapsed, "requests")
+    commits = counter.calls.get("commit", 0)
+    print(f"{'':<32} {commits / requests:.2f} commits per request", end="")
+    print(f", {saved / requests:.2f} saved" if in_transaction else "")
+
+
+if __name__ == "__main__":
+    parser = connection_parser(__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--writes", type=int, default=20)
+    args = parser.parse_args()
+
+    dbs = connections(args)
+    counter = Counter()
+    for db in dbs:
+        counted(db, counter)
+        db.connect()
+
+    BenchRow.set_database(dbs)
+    try:
+        BenchRow.drop_table()
+        BenchRow.create_table(COLUMNS)
+
+        run("commit per statement", counter, args.requests, args.writes, False)
+        run("transaction()", counter, args.requests, args.writes, True)
+    finally:
+        BenchRow.drop_table()
+        BenchRow.disconnect()
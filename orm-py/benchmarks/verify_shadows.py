@@ -0,0 +1,74 @@
+"""Rows checked per second by BaseModel.verify_shadows(), on a clean and a drifted shadow
+
+python benchmarks/verify_shadows.py --db-type mysql --rows 1000000 --shadow ormtest_m1
+
+`--drift` rows of the first shadow are changed behind the ORM's back before
+the second run, which repairs them.
+"""
+
+from common import Timer, connection_parser, connections, report
+from sa_orm.base_model import BaseModel, OperationsFactory
+
+
+class BenchRow(BaseModel):
+    _table_name = "bench_verify_shadows"
+    _primary_key = "id"
+
+
+COLUMNS = {"name": "VARCHAR(100) NOT NULL", "age": "INTEGER"}
+
+
+def drift(shadow_db, rows: int, count: int):
+    ops = OperationsFactory.get_operations(shadow_db)
+    step = max(rows // count, 1)
+    for record_id in range(1, rows + 1, step)[:count]:
+        ops.execute_query(
+            shadow_db,
+            f"UPDATE {BenchRow._table_name} SET age = age + 1 WHERE id = %s",
+            (record_id,),
+        )
+
+
+def run(label, args, repair):
+    with Timer() as t:
+        stats = BenchRow.verify_shadows(
+            chunk_size=args.chunk_size, workers=args.workers, repair=repair
+        )
+    report(label, stats["rows"], t.elapsed)
+    for shadow, found in stats["shadows"].items():
+        print(
+            f"{'':<32} {shadow}: {found['chunks']} chunks, "
+            f"{found['diverged']} rows diverged, {found['repaired']} repaired"
+        )
+
+
+if __name__ == "__main__":
+    parser = connection_parser(__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--drift", type=int, default=100)
+    args = parser.parse_args()
+    if not args.shadow:
+        parser.error("--shadow is required")
+
+    dbs = connections(args)
+    for db in dbs:
+        db.enable_pool(max_size=args.workers + 2)
+
+    BenchRow.set_database(dbs)
+    try:
+        BenchRow.drop_table()
+        BenchRow.create_table(COLUMNS)
+        for start in range(0, args.rows, 10000):
+            count = min(10000, args.rows - start)
+            BenchRow.bulk_create(
+                [{"name": f"user{start + i}", "age": i % 100} for i in range(count)]
+            )
+
+        run("verify_shadows() clean", args, False)
+        drift(dbs[1], args.rows, args.drift)
+        run(f"verify_shadows() {args.drift} drifted", args, True)
+    finally:
+        BenchRow.drop_table()
+        BenchRow.disconnect()
@@ -1,6 +1,7 @@
 from sa_orm.base.declare import DatabaseType
 from sa_orm.base.conn import createConnection
 from sa_orm.base_model import BaseModel
+from sa_orm.log import setup_logging
 
 
 class User(BaseModel):
@@ -14,6 +15,8 @@ class Post(BaseModel):
 
 
 if __name__ == "__main__":
+    setup_logging()
+
     # db = createConnection(
     #     host="localhost",
     #     port=10300,
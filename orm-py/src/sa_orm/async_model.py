@@ -0,0 +1,390 @@
+import asyncio
+from typing import Dict, List, Any, Optional
+
+from .base.async_ops import AsyncBaseOperations
+from .base.declare import AsyncBaseDC, DatabaseType
+from .log import Logger
+
+Log = Logger()
+log = Log.log
+log_op = Log.log_op
+
+
+class AsyncOperationsFactory:
+    """Factory to create appropriate async database operations instance"""
+
+    _operations_cache = {}
+
+    @classmethod
+    def get_operations(cls, db: AsyncBaseDC) -> AsyncBaseOperations:
+        """Get the appropriate async operations instance for the database type"""
+        if db.db_type not in cls._operations_cache:
+            match db.db_type:
+                case DatabaseType.MYSQL:
+                    from .mysql_orm.async_ops import AsyncMySQLOperations
+
+                    cls._operations_cache[db.db_type] = AsyncMySQLOperations()
+                case DatabaseType.POSTGRESQL:
+                    from .postgres_orm.async_ops import AsyncPostgreSQLOperations
+
+                    cls._operations_cache[db.db_type] = AsyncPostgreSQLOperations()
+                case DatabaseType.SQLITE:
+                    from .sqlite_orm.async_ops import AsyncSQLiteOperations
+
+                    cls._operations_cache[db.db_type] = AsyncSQLiteOperations()
+
+        return cls._operations_cache[db.db_type]
+
+
+class AsyncBaseModel:
+    """asyncio counterpart of BaseModel
+
+    Same table declaration and multi-write semantics: the primary is written
+    first, then every shadow concurrently with `asyncio.gather`, and a write
+    raises when any shadow failed.
+    """
+
+    _db = None
+    _shadows = []
+    _table_name = None
+    _primary_key = "id"
+    _shadow_timeout: Optional[float] = None
+
+    def __init__(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    @classmethod
+    def set_database(cls, db_connections: List[AsyncBaseDC]):
+        if not db_connections:
+            raise ValueError("At least one database connection required")
+
+        cls._db = db_connections[0]
+        cls._shadows = db_connections[1:]
+
+    @classmethod
+    def set_shadow_timeout(cls, timeout: Optional[float]):
+        """Fail a shadow write that takes longer than `timeout` seconds
+
+        The write is cancelled, but a statement the server already received
+        may still apply.
+        """
+        cls._shadow_timeout = timeout
+
+    @classmethod
+    async def disconnect(cls):
+        if cls._db is None:
+            raise ValueError("No active database connection found")
+        await asyncio.gather(
+            cls._db.disconnect(), *(d.disconnect() for d in cls._shadows)
+        )
+
+    @classmethod
+    def _check_ready(cls, action: str, record_id: Any = None):
+        if not cls._table_name:
+            log_op(
+                action=action,
+                table=f"{cls._db}:{cls._table_name}",
+                record_id=record_id,
+                success=False,
+                metadata={"payload": "Table name not specified"},
+            )
+            raise ValueError("Table name not specified")
+
+        if not cls._db:
+            log_op(
+                action=action,
+                table=f"{cls._db}:{cls._table_name}",
+                record_id=record_id,
+                success=False,
+                metadata={
+                    "payload": "Database connection not set. Use set_database() first."
+                },
+            )
+            raise ValueError("Database connection not set. Use set_database() first.")
+
+    @classmethod
+    async def _fan_out(cls, operation_func) -> List[Any]:
+        """Run a write on every shadow concurrently, raising if any of them failed"""
+
+        async def run(shadow_db: AsyncBaseDC):
+            if cls._shadow_timeout is None:
+                return await operation_func(shadow_db)
+            return await asyncio.wait_for(
+                operation_func(shadow_db), cls._shadow_timeout
+            )
+
+        results = await asyncio.gather(
+            *(run(shadow_db) for shadow_db in cls._shadows), return_exceptions=True
+        )
+
+        shadow_failed = []
+        for shadow_db, result in zip(cls._shadows, results):
+            if isinstance(result, BaseException):
+                shadow_failed.append({f"{shadow_db}": result})
+                log(f"Failed to mirror operation to {shadow_db}: {result}", "ERROR")
+        if len(shadow_failed) > 0:
+            raise Exception(f"Update failed on the following shadows: {shadow_failed}")
+        return results
+
+    @classmethod
+    async def _mirror_operation(cls, operation_func, *args, **kwargs):
+        """Execute operation on primary db and mirror to shadows"""
+        primary_result = await operation_func(cls._db, *args, **kwargs)
+
+        if cls._shadows:
+            await cls._fan_out(
+                lambda shadow_db: operation_func(shadow_db, *args, **kwargs)
+            )
+
+        return primary_result
+
+    @classmethod
+    async def create_table(cls, columns: Dict[str, str], if_not_exists: bool = True):
+        cls._check_ready("create_table")
+
+        async def create_operation(db: AsyncBaseDC):
+            ops = AsyncOperationsFactory.get_operations(db)
+            query = ops.dialect.create_table_sql(
+                cls._table_name, columns, cls._primary_key, if_not_exists
+            )
+            await ops.execute_query(db, query)
+            ops.dialect.invalidate_schema(db, cls._table_name)
+
+        await cls._mirror_operation(create_operation)
+
+        log(f"Table '{cls._table_name}' created successfully on all databases", "INFO")
+        log_op(
+            action="create_table",
+            table=f"{cls._db}:{cls._table_name}",
+            metadata={"payload": f"table {cls._table_name} created"},
+        )
+
+    @classmethod
+    async def drop_table(cls, if_exists: bool = True):
+        """Drop table from all databases"""
+        cls._check_ready("drop_table")
+
+        if_exists_clause = "IF EXISTS" if if_exists else ""
+        query = f"DROP TABLE {if_exists_clause} {cls._table_name}"
+
+        async def drop_operation(db: AsyncBaseDC):
+            ops = AsyncOperationsFactory.get_operations(db)
+            await ops.execute_query(db, query)
+            ops.dialect.invalidate_schema(db, cls._table_name)
+
+        await cls._mirror_operation(drop_operation)
+
+        log(
+            f"Table '{cls._table_name}' dropped successfully from all databases", "INFO"
+        )
+        log_op(
+            action="drop_table",
+            table=f"{cls._db}:{cls._table_name}",
+            metadata={"payload": f"table {cls._table_name} dropped"},
+        )
+
+    @classmethod
+    async def create(cls, **data) -> "AsyncBaseModel":
+        """Create a new record in all databases"""
+        cls._check_ready("create")
+
+        columns, values = [], []
+        for k, v in data.items():
+            if v is not None and k != cls._primary_key:
+                columns.append(k)
+                values.append(v)
+
+        if len(columns) == 0:
+            log_op(
+                action="create",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": "No data provided for creation"},
+            )
+            raise ValueError("No data provided for creation")
+
+        ops = AsyncOperationsFactory.get_operations(cls._db)
+        query = ops.dialect.insert_sql(cls._table_name, columns)
+        result = await ops.execute_query(cls._db, query, tuple(values), fetch=True)
+        instance_data = await ops.handle_insert_result(
+            cls._db, cls._table_name, cls._primary_key, result, tuple(values)
+        )
+
+        shadow_columns = columns + [cls._primary_key]
+        shadow_values = tuple(values) + (instance_data[cls._primary_key],)
+
+        async def insert_operation(shadow_db: AsyncBaseDC):
+            shadow_ops = AsyncOperationsFactory.get_operations(shadow_db)
+            await shadow_ops.execute_query(
+                shadow_db,
+                shadow_ops.dialect.insert_sql(cls._table_name, shadow_columns),
+                shadow_values,
+            )
+
+        if cls._shadows:
+            try:
+                await cls._fan_out(insert_operation)
+            except Exception as e:
+                log_op(
+                    action="create",
+                    table=f"{cls._db}:{cls._table_name}",
+                    record_id=instance_data[cls._primary_key],
+                    success=False,
+                    metadata={"payload": f"Failed to create shadows: {e}"},
+                )
+                raise
+
+        return cls(**instance_data)
+
+    @classmethod
+    async def find_by_id(cls, record_id: Any) -> Optional["AsyncBaseModel"]:
+        """Find record by ID (reads from primary database only)"""
+        cls._check_ready("find_by_id", record_id)
+
+        ops = AsyncOperationsFactory.get_operations(cls._db)
+        query = ops.dialect.select_by_pk_sql(cls._table_name, cls._primary_key)
+        result = await ops.execute_query(cls._db, query, (record_id,), fetch=True)
+
+        if result["result"]:
+            return cls(
+                **ops.row_to_dict(cls._db, cls._table_name, result, result["result"][0])
+            )
+
+        return None
+
+    @classmethod
+    async def find_all(
+        cls, where: str = None, params: tuple = None
+    ) -> List["AsyncBaseModel"]:
+        """Find all records matching criteria (reads from primary database only)"""
+        cls._check_ready("find_all")
+
+        ops = AsyncOperationsFactory.get_operations(cls._db)
+        query = ops.dialect.select_sql(cls._table_name, where=(where,) if where else ())
+        try:
+            rows = await ops.execute_query(cls._db, query, params, fetch=True)
+        except Exception as e:
+            log_op(
+                action="find_all",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": f"Query execution error: {e}"},
+            )
+            log(f"Query execution error: {e}", "ERROR")
+            raise
+
+        return [
+            cls(**ops.row_to_dict(cls._db, cls._table_name, rows, row))
+            for row in rows["result"]
+        ]
+
+    async def save(self) -> "AsyncBaseModel":
+        """Save the current instance (create or update)"""
+        pk_value = getattr(self, self._primary_key, None)
+
+        if pk_value and await self.find_by_id(pk_value):
+            return await self.update()
+
+        data = {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        new_instance = await self.create(**data)
+        for key, value in new_instance.__dict__.items():
+            setattr(self, key, value)
+        return self
+
+    async def update(self, **data) -> "AsyncBaseModel":
+        """Update the current record in all databases"""
+        pk_value = getattr(self, self._primary_key, None)
+        self._check_ready("update", pk_value)
+        if not pk_value:
+            log_op(
+                action="update",
+                table=f"{self._db}:{self._table_name}",
+                record_id=pk_value,
+                success=False,
+                metadata={"payload": f"No {self._primary_key} value found for update"},
+            )
+            raise ValueError(f"No {self._primary_key} value found for update")
+
+        update_data = (
+            data
+            if data
+            else {
+                k: v
+                for k, v in self.__dict__.items()
+                if not k.startswith("_") and k != self._primary_key
+            }
+        )
+
+        if not update_data:
+            return self
+
+        columns = list(update_data.keys())
+        values = (*update_data.values(), pk_value)
+
+        async def update_operation(db: AsyncBaseDC):
+            ops = AsyncOperationsFactory.get_operations(db)
+            query = ops.dialect.update_sql(self._table_name, columns, self._primary_key)
+            return await ops.execute_query(db, query, values, fetch=True)
+
+        result = await self._mirror_operation(update_operation)
+        ops = AsyncOperationsFactory.get_operations(self._db)
+        instance_data = await ops.handle_update_result(
+            self._db, self._table_name, self._primary_key, pk_value, result
+        )
+
+        for key, value in instance_data.items():
+            setattr(self, key, value)
+
+        log_op(
+            action="update",
+            table=f"{self._db}:{self._table_name}",
+            record_id=pk_value,
+            success=True,
+            metadata={"payload": f"Record updated: {instance_data}"},
+        )
+        return self
+
+    async def delete(self) -> bool:
+        """Delete the current record from all databases"""
+        pk_value = getattr(self, self._primary_key, None)
+        self._check_ready("delete", pk_value)
+        if not pk_value:
+            log_op(
+                action="delete",
+                table=f"{self._db}:{self._table_name}",
+                record_id=pk_value,
+                success=False,
+                metadata={
+                    "payload": f"No {self._primary_key} value found for deletion"
+                },
+            )
+            raise ValueError(f"No {self._primary_key} value found for deletion")
+
+        return await self.delete_by_id(pk_value)
+
+    @classmethod
+    async def delete_by_id(cls, record_id: Any) -> bool:
+        """Delete record by ID from all databases"""
+        cls._check_ready("delete_by_id", record_id)
+        query = f"DELETE FROM {cls._table_name} WHERE {cls._primary_key} = %s"
+
+        async def delete_operation(db: AsyncBaseDC):
+            ops = AsyncOperationsFactory.get_operations(db)
+            return await ops.execute_query(db, query, (record_id,))
+
+        rows_affected = (await cls._mirror_operation(delete_operation))["rowcount"]
+        log_op(
+            action="delete_by_id",
+            table=f"{cls._db}:{cls._table_name}",
+            record_id=record_id,
+            success=rows_affected > 0,
+            metadata={
+                "payload": "Record deleted" if rows_affected > 0 else "No rows deleted"
+            },
+        )
+        return rows_affected > 0
+
+    def __repr__(self):
+        attrs = {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        return f"{self.__class__.__name__}({attrs})"
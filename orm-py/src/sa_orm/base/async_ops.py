@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+from .declare import AsyncBaseDC
+from .ops import BaseOperations
+
+
+class AsyncBaseOperations(ABC):
+    """Interface for database operations on asyncio connections
+
+    SQL generation is shared with the sync operations of the same database
+    (`dialect`), only executing statements differs.
+    """
+
+    dialect: BaseOperations
+
+    @abstractmethod
+    async def execute_query(
+        self,
+        db: AsyncBaseDC,
+        query: str,
+        params: tuple = (),
+        fetch: bool = False,
+    ) -> Any:
+        """Execute query on the specific database type"""
+        pass
+
+    @abstractmethod
+    async def execute_batch(
+        self, db: AsyncBaseDC, statements: List[Tuple[str, tuple]]
+    ) -> List[int]:
+        """Run statements in one transaction and commit once, returns their rowcounts"""
+        pass
+
+    @abstractmethod
+    async def handle_insert_result(
+        self,
+        db: AsyncBaseDC,
+        table_name: str,
+        primary_key: str,
+        insert_result: Any,
+        insert_params: tuple,
+    ) -> Dict[str, Any]:
+        """Handle the result of an insert operation to return the created record data"""
+        pass
+
+    @abstractmethod
+    async def handle_update_result(
+        self,
+        db: AsyncBaseDC,
+        table_name: str,
+        primary_key: str,
+        pk_value: Any,
+        update_result: Any,
+    ) -> Dict[str, Any]:
+        """Handle the result of an update operation to return the updated record data"""
+        pass
+
+    def row_to_dict(
+        self, db: AsyncBaseDC, table_name: str, result: Dict[str, Any], row: tuple
+    ) -> Dict[str, Any]:
+        """Map a row to a column dict, async results always carry their column names"""
+        self.dialect.remember_columns(db, table_name, result["columns"])
+        return dict(zip(result["columns"], row))
@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from .declare import BaseDC
+from .journal import ShadowJournal
+from .ops import Statement
+from .values import decode_value, encode_value
+
+# Sentinel: no chunk finished yet, the copy starts from the lowest key
+_START = {"$start": True}
+
+
+class CopyCheckpoint:
+    """Resume point of a chunked copy: every key below `low` has been copied
+
+    Chunks finish out of order when copied in parallel, so the checkpoint
+    only advances past a chunk once every chunk before it is done.
+    """
+
+    def __init__(self, path: str, owner: str):
+        self.path = path
+        self.owner = owner
+        self._lock = threading.Lock()
+        self._chunks: List[List[Any]] = []  # [low, high, done] in key order
+
+        state = {"owner": owner, "low": _START, "finished": False}
+        if os.path.isfile(path):
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state["owner"] != owner:
+                raise ValueError(
+                    f"Checkpoint {path} belongs to {state['owner']}, not {owner}"
+                )
+        self.finished = state["finished"]
+        self.low = None if state["low"] == _START else decode_value(state["low"])
+
+    def issue(self, low: Any, high: Any):
+        with self._lock:
+            self._chunks.append([low, high, False])
+
+    def done(self, low: Any):
+        with self._lock:
+            for chunk in self._chunks:
+                if chunk[0] == low:
+                    chunk[2] = True
+                    break
+            finished = 0
+            while finished < len(self._chunks) and self._chunks[finished][2]:
+                finished += 1
+            if not finished:
+                return
+            # The last finished chunk's upper end is where the copy resumes
+            self.low = self._chunks[finished - 1][1]
+            self.finished = self.low is None
+            del self._chunks[:finished]
+            self._save()
+
+    def _save(self):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "owner": self.owner,
+                    "low": encode_value(self.low),
+                    "finished": self.finished,
+                },
+                f,
+            )
+        os.replace(tmp, self.path)
+
+
+class Throttle:
+    """Keeps a copy under `max_rows_per_second` and backs off while the primary is slow
+
+    A chunk read slower than `max_read_seconds` is taken as load on the
+    primary, the worker then pauses for as long as that read took.
+    """
+
+    def __init__(
+        self,
+        max_rows_per_second: Optional[float] = None,
+        max_read_seconds: Optional[float] = None,
+    ):
+        self.max_rows_per_second = max_rows_per_second
+        self.max_read_seconds = max_read_seconds
+        self.paused = 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self, rows: int, read_seconds: float):
+        delay = 0.0
+        if self.max_read_seconds is not None and read_seconds > self.max_read_seconds:
+            delay = read_seconds
+        if self.max_rows_per_second:
+            with self._lock:
+                now = time.monotonic()
+                self._next = max(self._next, now) + rows / self.max_rows_per_second
+                delay = max(delay, self._next - now)
+        if delay > 0:
+            with self._lock:
+                self.paused += delay
+            time.sleep(delay)
+
+
+class ShadowBackfill:
+    """State of a shadow being added to a live model
+
+    Until the copy is done and the shadow attached, writes of the model are
+    not sent to it but captured in a journal, replayed once the copy ended.
+    `lock` is held by writers while they capture and by the attach step, so
+    every write is either captured or sent to the attached shadow, never
+    both or neither.
+    """
+
+    def __init__(
+        self,
+        shadow_db: BaseDC,
+        directory: str,
+        owner: str,
+        fsync: bool = True,
+    ):
+        self.shadow_db = shadow_db
+        self.directory = directory
+        self.journal = ShadowJournal(os.path.join(directory, "journal"), fsync=fsync)
+        self.checkpoint = CopyCheckpoint(os.path.join(directory, "copy.json"), owner)
+        self.lock = threading.Lock()
+        self.attached = False
+        self.captured = 0
+
+    def capture(self, statements: List[Statement]):
+        """Journal a write, the caller holds `lock`"""
+        self.journal.append(statements)
+        self.captured += 1
+
+    def capture_late(
+        self, statements: List[Statement], apply: Callable[[List[Statement]], Any]
+    ):
+        """Capture a write decided on before `lock` was taken (a transaction commit)
+
+        The decision to capture was made while the shadow was not attached;
+        if it has been attached since, the write is applied to it directly.
+        """
+        with self.lock:
+            if self.attached:
+                apply(statements)
+            else:
+                self.capture(statements)
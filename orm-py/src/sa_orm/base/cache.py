@@ -0,0 +1,300 @@
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+class RecordCache:
+    """Process-wide LRU of rows by (table, primary key), with a time to live
+
+    Rows are stored as column dicts and handed out as copies, so instances
+    built from them never share state. `ttl=None` keeps rows until they are
+    evicted or invalidated.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: Optional[float] = 300.0):
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive or None")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # (table, pk) -> (expiry on the monotonic clock or 0, row)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, table: str, pk: Hashable) -> Optional[Dict[str, Any]]:
+        key = (table, pk)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires, data = entry
+            if expires and expires < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(data)
+
+    def set(self, table: str, pk: Hashable, data: Dict[str, Any]):
+        expires = time.monotonic() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._entries[(table, pk)] = (expires, dict(data))
+            self._entries.move_to_end((table, pk))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, table: str, pk: Hashable):
+        with self._lock:
+            if self._entries.pop((table, pk), None) is not None:
+                self.invalidations += 1
+
+    def invalidate_table(self, table: str):
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == table]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+class TableGenerations:
+    """Write counter per (connection, table)
+
+    Cached results are keyed with the generation they were read at, so one
+    bump makes every earlier result of the table unreachable.
+    """
+
+    def __init__(self):
+        self._generations: Dict[Tuple[Any, str], int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db: Any, table_name: str) -> int:
+        return self._generations.get((db, table_name), 0)
+
+    def bump(self, db: Any, table_name: str) -> int:
+        with self._lock:
+            generation = self._generations.get((db, table_name), 0) + 1
+            self._generations[(db, table_name)] = generation
+            return generation
+
+
+table_generations = TableGenerations()
+
+
+def estimate_size(value: Any) -> int:
+    """Rough deep size in bytes of rows made of tuples, lists, dicts and scalars"""
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(estimate_size(item) for item in value)
+    elif isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    return size
+
+
+class CacheStore(ABC):
+    """Storage behind a ResultCache, e.g. a wrapper around Redis or memcached
+
+    Keys are tuples of strings, numbers and None; stores that need string keys
+    can hash their repr().
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached value, None when missing or expired"""
+        pass
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        pass
+
+    @abstractmethod
+    def delete(self, key: Hashable):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class MemoryStore(CacheStore):
+    """In-process LRU bounded by the estimated size of its values"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be a positive integer")
+        self.max_bytes = max_bytes
+        # key -> (expiry on the monotonic clock or 0, size, value)
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+        self.rejected = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires, size, value = entry
+            if expires and expires < time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            # Would flush everything else and still not fit
+            self.rejected += 1
+            return
+
+        expires = time.monotonic() + ttl if ttl else 0.0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (expires, size, value)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "rejected": self.rejected,
+            }
+
+
+class ResultCache:
+    """Query results by key with a time to live and single-flight loading
+
+    When several threads miss the same key at once, one of them runs the
+    query and the others wait for its result instead of hitting the database.
+    """
+
+    def __init__(self, store: Optional[CacheStore] = None, ttl: Optional[float] = 60.0):
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive or None")
+        self.store = store if store is not None else MemoryStore()
+        self.ttl = ttl
+        self._loading: Dict[Hashable, "Future"] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        value = self.store.get(key)
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+            return value
+
+        with self._lock:
+            loading = self._loading.get(key)
+            leader = loading is None
+            if leader:
+                # Slow to import, only needed once a cache is in use
+                from concurrent.futures import Future
+
+                loading = self._loading[key] = Future()
+                self.misses += 1
+            else:
+                self.waits += 1
+        if not leader:
+            # Another caller is loading the key, share its result (or error)
+            return loading.result()
+
+        try:
+            # The key may have been stored after our miss and before we took over
+            value = self.store.get(key)
+            if value is None:
+                value = load()
+                self.store.set(key, value, self.ttl)
+            loading.set_result(value)
+            return value
+        except BaseException as e:
+            loading.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+
+    def clear(self):
+        self.store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = {
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "loading": len(self._loading),
+            }
+        stats.update(self.store.stats())
+        return stats
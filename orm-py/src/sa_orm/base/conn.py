@@ -1,13 +1,107 @@
+from typing import Any, Dict, Optional
 from .declare import DatabaseType
-from ..mysql_orm.db import DatabaseConnection as mysqlDC
-from ..postgres_orm.db import DatabaseConnection as postgresDC
+
+
+def _given(**params) -> Dict[str, Any]:
+    # Leave out what the caller did not pass so the backend defaults apply
+    return {name: value for name, value in params.items() if value is not None}
 
 
 def createConnection(
-    host: str, port: int, database: str, user: str, password: str, db_type: DatabaseType
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    database: Optional[str] = None,
+    user: Optional[str] = None,
+    password: Optional[str] = None,
+    db_type: Optional[DatabaseType] = None,
+    pool: Optional[Dict[str, Any]] = None,
+    prepared: Optional[Dict[str, Any]] = None,
+    ping_after: Optional[float] = None,
+    **options,
 ):
+    """`pool` enables pooled mode, e.g. {"min_size": 2, "max_size": 20, "timeout": 5}
+
+    `prepared` runs repeated statements as server-side prepared statements
+    (MySQL, PostgreSQL), e.g. {"max_size": 128, "threshold": 5}.
+
+    `ping_after` (MySQL, 60 by default) pings the unpooled connection before
+    a statement once it sat idle that many seconds, and replaces it if the
+    server closed it meanwhile.
+
+    For SQLite `database` is a file path or ":memory:", host/port/user/password
+    are ignored and `options` are passed on (journal_mode, synchronous,
+    cache_size, mmap_size, busy_timeout).
+    """
+    if db_type is None:
+        raise ValueError("db_type is required")
+    if options and db_type != DatabaseType.SQLITE:
+        raise ValueError(f"Unsupported options for {db_type}: {list(options)}")
+    if prepared is not None and db_type == DatabaseType.SQLITE:
+        raise ValueError("Prepared statements are only supported on MySQL/PostgreSQL")
+    if ping_after is not None and db_type != DatabaseType.MYSQL:
+        raise ValueError("ping_after is only supported on MySQL")
+
+    params = _given(
+        host=host, port=port, database=database, user=user, password=password
+    )
+
+    # Drivers are imported on first use, so only the installed extra is needed
     match db_type:
         case DatabaseType.MYSQL:
-            return mysqlDC(host, port, database, user, password)
+            from ..mysql_orm.db import DatabaseConnection as mysqlDC
+
+            return mysqlDC(
+                **params,
+                pool=pool,
+                prepared=prepared,
+                **_given(ping_after=ping_after),
+            )
         case DatabaseType.POSTGRESQL:
-            return postgresDC(host, port, database, user, password)
+            from ..postgres_orm.db import DatabaseConnection as postgresDC
+
+            return postgresDC(**params, pool=pool, prepared=prepared)
+        case DatabaseType.SQLITE:
+            from ..sqlite_orm.db import DatabaseConnection as sqliteDC
+
+            return sqliteDC(**_given(database=database), pool=pool, **options)
+        case _:
+            raise ValueError(f"Unsupported database type: {db_type}")
+
+
+def createAsyncConnection(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    database: Optional[str] = None,
+    user: Optional[str] = None,
+    password: Optional[str] = None,
+    db_type: Optional[DatabaseType] = None,
+    pool_size: int = 1,
+    **options,
+):
+    """asyncio counterpart of createConnection, for AsyncBaseModel"""
+    if db_type is None:
+        raise ValueError("db_type is required")
+    if options and db_type != DatabaseType.SQLITE:
+        raise ValueError(f"Unsupported options for {db_type}: {list(options)}")
+
+    params = _given(
+        host=host, port=port, database=database, user=user, password=password
+    )
+
+    match db_type:
+        case DatabaseType.MYSQL:
+            from ..mysql_orm.async_db import AsyncDatabaseConnection
+
+            return AsyncDatabaseConnection(**params, pool_size=pool_size)
+        case DatabaseType.POSTGRESQL:
+            from ..postgres_orm.async_db import AsyncDatabaseConnection
+
+            return AsyncDatabaseConnection(**params, pool_size=pool_size)
+        case DatabaseType.SQLITE:
+            from ..sqlite_orm.async_db import AsyncDatabaseConnection
+
+            return AsyncDatabaseConnection(
+                **_given(database=database), pool_size=pool_size, **options
+            )
+        case _:
+            raise ValueError(f"Unsupported database type: {db_type}")
@@ -1,18 +1,36 @@
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional
 from abc import ABC, abstractmethod
+from .pool import ConnectionPool
+from .prepared import StatementCache
+from .transaction import current_transaction
+
+if TYPE_CHECKING:
+    import asyncio
 
 
 class DatabaseType(Enum):
     MYSQL = "mysql"
     POSTGRESQL = "postgresql"
+    SQLITE = "sqlite"
 
 
 class BaseDC(ABC):
     "Interface for DatabaseConnection"
 
+    # Seconds the shared connection may sit idle before it is checked with
+    # is_usable() ahead of the next statement (None: never checked)
+    ping_after: Optional[float] = None
+
     def __init__(self, db_type: DatabaseType):
         self.db_type = db_type
+        self._pool: Optional[ConnectionPool] = None
+        self._statements: Optional[StatementCache] = None
+        self._local = threading.local()
+        self._last_used = time.monotonic()
 
     @abstractmethod
     def connect(self) -> Any:
@@ -21,3 +39,272 @@ class BaseDC(ABC):
     @abstractmethod
     def disconnect(self):
         pass
+
+    @abstractmethod
+    def open_connection(self) -> Any:
+        """Open a new driver connection (used by connect() and the pool)"""
+        pass
+
+    def close_connection(self, conn: Any):
+        """Close a driver connection opened by open_connection()"""
+        conn.close()
+
+    def is_usable(self, conn: Any) -> bool:
+        """Whether a driver connection can still run statements"""
+        return not getattr(conn, "closed", False)
+
+    @property
+    @abstractmethod
+    def connection(self) -> Any:
+        pass
+
+    def enable_pool(
+        self,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_lifetime: float | None = 3600.0,
+        max_idle: float | None = 600.0,
+        reap_interval: float = 30.0,
+    ) -> ConnectionPool:
+        """Switch to pooled mode, statements then check out their own connection"""
+        if self._pool is not None:
+            self._pool.close()
+        self._pool = ConnectionPool(
+            self.open_connection,
+            self.close_connection,
+            min_size=min_size,
+            max_size=max_size,
+            timeout=timeout,
+            max_lifetime=max_lifetime,
+            max_idle=max_idle,
+            reap_interval=reap_interval,
+            name=repr(self),
+        )
+        return self._pool
+
+    @property
+    def pool(self) -> Optional[ConnectionPool]:
+        return self._pool
+
+    def pool_stats(self) -> Optional[Dict[str, Any]]:
+        return self._pool.stats() if self._pool is not None else None
+
+    def enable_prepared_statements(
+        self, max_size: int = 128, threshold: int = 5
+    ) -> StatementCache:
+        """Run repeated parameterised statements as server-side prepared statements"""
+        self._statements = StatementCache(max_size=max_size, threshold=threshold)
+        return self._statements
+
+    @property
+    def statement_cache(self) -> Optional[StatementCache]:
+        return self._statements
+
+    def statement_stats(self) -> Optional[Dict[str, Any]]:
+        return self._statements.stats() if self._statements is not None else None
+
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        """Yield a driver connection for one statement
+
+        Without a pool this is the single shared connection. Inside `pinned()`
+        the connection pinned to the current thread is reused, inside a
+        `transaction()` the one the transaction holds for this database.
+        """
+        pinned = self._pinned()
+        if pinned is not None:
+            yield pinned
+            return
+
+        with self.acquire() as conn:
+            yield conn
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """Yield the shared connection, or one from the pool, ignoring any pin"""
+        if self._pool is None:
+            conn = self._shared_connection()
+            try:
+                yield conn
+            except Exception:
+                # Dead shared connections are only noticed here, not pinged per
+                # statement; the next checkout opens a new one
+                if (
+                    not self.is_usable(conn)
+                    and getattr(self, "_connection", None) is conn
+                ):
+                    self._connection = None
+                raise
+            finally:
+                self._last_used = time.monotonic()
+            return
+
+        conn = self._pool.acquire()
+        broken = False
+        try:
+            yield conn
+        except Exception:
+            broken = not self.is_usable(conn)
+            raise
+        finally:
+            self._pool.release(conn, discard=broken)
+
+    def _shared_connection(self) -> Any:
+        """The shared connection, replaced first if it died while idle
+
+        Servers close connections idle for too long (MySQL's wait_timeout),
+        so one unused for `ping_after` seconds is checked before it is used.
+        """
+        conn = self.connection
+        if (
+            self.ping_after is not None
+            and time.monotonic() - self._last_used > self.ping_after
+            and not self.is_usable(conn)
+        ):
+            self._connection = None
+            conn = self.connection
+        return conn
+
+    def _pinned(self) -> Optional[Any]:
+        pinned = getattr(self._local, "connection", None)
+        if pinned is None:
+            transaction = current_transaction()
+            if transaction is not None:
+                pinned = transaction.connection(self)
+        return pinned
+
+    def is_pinned(self) -> bool:
+        """Whether statements of the current thread run on a pinned or transaction connection"""
+        return (
+            getattr(self._local, "connection", None) is not None
+            or current_transaction() is not None
+        )
+
+    @contextmanager
+    def streaming(self) -> Iterator[Any]:
+        """Yield a connection a long-running read can keep busy
+
+        Unlike checkout() this never hands out the shared connection, a stream
+        left open on it would block every other statement. Pooled connections
+        come from the pool, otherwise a connection is opened for the stream.
+        Inside `pinned()` or a `transaction()` the stream shares their
+        connection, so an abandoned stream must leave it usable (see is_pinned()).
+        """
+        pinned = self._pinned()
+        if pinned is not None:
+            yield pinned
+            return
+
+        if self._pool is None:
+            conn = self.open_connection()
+            try:
+                yield conn
+            finally:
+                self.close_connection(conn)
+            return
+
+        conn = self._pool.acquire()
+        broken = False
+        try:
+            yield conn
+        except BaseException:
+            # Includes GeneratorExit of a stream that was not read to the end
+            broken = not self.is_usable(conn)
+            raise
+        finally:
+            self._pool.release(conn, discard=broken)
+
+    @contextmanager
+    def pinned(self) -> Iterator[Any]:
+        """Hold one connection for every statement the current thread runs inside the block"""
+        if getattr(self._local, "connection", None) is not None:
+            yield self._local.connection
+            return
+
+        with self.checkout() as conn:
+            self._local.connection = conn
+            try:
+                yield conn
+            finally:
+                self._local.connection = None
+
+
+class AsyncBaseDC(ABC):
+    """Interface for asyncio DatabaseConnection
+
+    Holds up to `pool_size` driver connections; every statement checks one
+    out, so that many coroutines can query concurrently.
+    """
+
+    def __init__(self, db_type: DatabaseType, pool_size: int = 1):
+        if pool_size < 1:
+            raise ValueError("pool_size must be a positive integer")
+        self.db_type = db_type
+        self.pool_size = pool_size
+        self._idle: Optional["asyncio.Queue"] = None
+        self._connections: List[Any] = []
+        self._opening = 0
+
+    @abstractmethod
+    async def open_connection(self) -> Any:
+        """Open a new driver connection"""
+        pass
+
+    @abstractmethod
+    async def close_connection(self, conn: Any):
+        pass
+
+    def is_usable(self, conn: Any) -> bool:
+        return not getattr(conn, "closed", False)
+
+    async def connect(self) -> Any:
+        """Open the first connection eagerly, surfacing bad credentials early"""
+        async with self.checkout() as conn:
+            return conn
+
+    async def disconnect(self):
+        connections, self._connections = self._connections, []
+        self._idle = None
+        for conn in connections:
+            await self.close_connection(conn)
+
+    @asynccontextmanager
+    async def checkout(self) -> AsyncIterator[Any]:
+        if self._idle is None:
+            # asyncio is only imported by async users, it is slow to import
+            import asyncio
+
+            self._idle = asyncio.Queue()
+        idle = self._idle
+
+        conn = None
+        if idle.empty() and len(self._connections) + self._opening < self.pool_size:
+            freed_slot = False
+        else:
+            # None in the queue is the slot of a connection discarded as broken
+            conn = await idle.get()
+            freed_slot = conn is None
+
+        if conn is None:
+            self._opening += 1
+            try:
+                conn = await self.open_connection()
+            except Exception:
+                if freed_slot:
+                    idle.put_nowait(None)
+                raise
+            finally:
+                self._opening -= 1
+            self._connections.append(conn)
+
+        try:
+            yield conn
+        except Exception:
+            if not self.is_usable(conn):
+                self._connections.remove(conn)
+                await self.close_connection(conn)
+                conn = None
+            raise
+        finally:
+            idle.put_nowait(conn)
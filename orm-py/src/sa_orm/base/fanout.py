@@ -0,0 +1,189 @@
+import contextvars
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from .declare import BaseDC
+from .transaction import current_transaction
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+# One pool per max_workers, shared by every model asking for that size
+_executors: Dict[int, "ThreadPoolExecutor"] = {}
+_executor_lock = threading.Lock()
+
+# One slot per shadow, shared by every model writing to it
+_shadow_slots: Dict[BaseDC, "_ShadowSlot"] = {}
+
+
+def _get_executor(max_workers: Optional[int]) -> "ThreadPoolExecutor":
+    # Slow to import, only needed once a model fans out in parallel
+    from concurrent.futures import ThreadPoolExecutor
+
+    size = max_workers or 32
+    with _executor_lock:
+        executor = _executors.get(size)
+        if executor is None:
+            executor = _executors[size] = ThreadPoolExecutor(
+                max_workers=size, thread_name_prefix=f"sa_orm-fanout-{size}"
+            )
+        return executor
+
+
+class _ShadowSlot:
+    """Serializes the parallel writes to one shadow
+
+    A write that timed out keeps the slot until it really finished, and while
+    it does later writes to the shadow fail at once instead of queueing behind
+    it or sharing its connection.
+    """
+
+    def __init__(self):
+        self.changed = threading.Condition()
+        self.holder: Optional["_ShadowWrite"] = None
+        self.abandoned = False
+
+    def enter(self, write: "_ShadowWrite", shadow_db: BaseDC):
+        with self.changed:
+            while self.holder is not None and not self.abandoned:
+                self.changed.wait()
+            if self.abandoned:
+                raise RuntimeError(
+                    f"{shadow_db} is still busy with a write that timed out"
+                )
+            self.holder = write
+            write.started_at = time.monotonic()
+
+    def leave(self):
+        with self.changed:
+            self.holder = None
+            self.abandoned = False
+            self.changed.notify_all()
+
+    def abandon(self, write: "_ShadowWrite"):
+        with self.changed:
+            if self.holder is write:
+                self.abandoned = True
+                self.changed.notify_all()
+
+
+class _ShadowWrite:
+    """One shadow's part of a parallel write"""
+
+    def __init__(self, shadow_db: BaseDC):
+        with _executor_lock:
+            self.slot = _shadow_slots.setdefault(shadow_db, _ShadowSlot())
+        # Set once the write got its slot, or failed to
+        self.started = threading.Event()
+        self.started_at: Optional[float] = None
+
+    def run(self, shadow_db: BaseDC, operation_func: Callable[[BaseDC], Any]):
+        try:
+            self.slot.enter(self, shadow_db)
+        finally:
+            self.started.set()
+        try:
+            return operation_func(shadow_db)
+        finally:
+            self.slot.leave()
+
+
+class ShadowFanout:
+    """Runs one write against every shadow, one after another or concurrently
+
+    Callers run the primary first and only fan out once it succeeded, so the
+    primary-then-shadows order holds in both modes. In parallel mode writes to
+    the same shadow are still serialized (a per-shadow lock), which keeps their
+    order and stops two threads sharing a non-pooled shadow connection.
+
+    The timeout counts from the moment a write got its shadow, not the time it
+    waited for a worker or for earlier writes. A write that timed out is not
+    interrupted and may still apply; until it finished, later writes to that
+    shadow fail. Inside a `transaction()` the caller waits for it instead, so
+    it is done with the transaction's connection before that is committed or
+    rolled back.
+    """
+
+    def __init__(
+        self,
+        parallel: bool = False,
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.parallel = parallel
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+    def run(
+        self, operation_func: Callable[[BaseDC], Any], shadows: List[BaseDC]
+    ) -> Tuple[List[Any], List[Dict[str, Exception]]]:
+        """Apply `operation_func` to each shadow
+
+        Returns the results in shadow order (None for failed shadows) and the
+        failures as `[{"<shadow>": exception}]`, the shape BaseModel reports.
+        """
+        if not self.parallel or (len(shadows) < 2 and self.timeout is None):
+            return self._run_serial(operation_func, shadows)
+
+        from concurrent.futures import wait
+
+        executor = _get_executor(self.max_workers)
+        writes = [_ShadowWrite(shadow_db) for shadow_db in shadows]
+        # Each worker runs in a copy of the caller's context, so an open
+        # transaction() or session() carries over to the shadow writes
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run, write.run, shadow_db, operation_func
+            )
+            for write, shadow_db in zip(writes, shadows)
+        ]
+
+        results, failures = [], []
+        for shadow_db, write, future in zip(shadows, writes, futures):
+            if not self._finished(write, future):
+                if current_transaction() is not None:
+                    wait([future])
+                else:
+                    write.slot.abandon(write)
+                results.append(None)
+                failures.append(
+                    {
+                        f"{shadow_db}": TimeoutError(
+                            f"Shadow write did not finish within {self.timeout}s"
+                        )
+                    }
+                )
+            elif future.exception() is not None:
+                results.append(None)
+                failures.append({f"{shadow_db}": future.exception()})
+            else:
+                results.append(future.result())
+        return results, failures
+
+    def _finished(self, write: _ShadowWrite, future: Any) -> bool:
+        """Wait for `future`, at most `timeout` seconds after it got its shadow"""
+        from concurrent.futures import wait
+
+        if self.timeout is None:
+            wait([future])
+            return True
+        write.started.wait()
+        if write.started_at is None:
+            # Failed before it got the shadow
+            wait([future])
+            return True
+        remaining = write.started_at + self.timeout - time.monotonic()
+        done, _ = wait([future], timeout=max(remaining, 0))
+        return bool(done)
+
+    def _run_serial(
+        self, operation_func: Callable[[BaseDC], Any], shadows: List[BaseDC]
+    ) -> Tuple[List[Any], List[Dict[str, Exception]]]:
+        results, failures = [], []
+        for shadow_db in shadows:
+            try:
+                results.append(operation_func(shadow_db))
+            except Exception as e:
+                results.append(None)
+                failures.append({f"{shadow_db}": e})
+        return results, failures
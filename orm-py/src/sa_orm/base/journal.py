@@ -0,0 +1,481 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from .declare import BaseDC
+from .ops import Statement
+from .values import decode_value, encode_value
+
+
+class ShadowJournal:
+    """Durable append-only log of statements still owed to one shadow
+
+    Records are JSON lines spread over numbered segment files. A checkpoint
+    file remembers how far the shadow has been brought up to date; segments
+    entirely behind the checkpoint are deleted.
+    """
+
+    def __init__(
+        self, directory: str, segment_bytes: int = 64 << 20, fsync: bool = True
+    ):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        checkpoint = self._read_checkpoint()
+        self.applied_seq = checkpoint["seq"]
+        self._read_pos = (checkpoint["segment"], checkpoint["offset"])
+
+        segments = self._segments()
+        self._segment = segments[-1] if segments else max(1, self._read_pos[0])
+        self.appended_seq = self.applied_seq
+        for segment in reversed(segments):
+            # The newest segment may be empty if the process died right after a rollover
+            last_seq = self._recover(segment)
+            if last_seq:
+                self.appended_seq = max(self.applied_seq, last_seq)
+                break
+        self._writer = open(self._segment_path(self._segment), "ab")
+
+    def append(self, statements: List[Statement]) -> int:
+        """Persist statements as one record, returns its sequence number"""
+        with self._lock:
+            seq = self.appended_seq + 1
+            record = {
+                "seq": seq,
+                "ts": time.time(),
+                "statements": [[q, encode_value(list(p or ()))] for q, p in statements],
+            }
+            line = json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+            if (
+                self._writer.tell()
+                and self._writer.tell() + len(line) > self.segment_bytes
+            ):
+                self._writer.close()
+                self._segment += 1
+                self._writer = open(self._segment_path(self._segment), "ab")
+
+            self._writer.write(line)
+            self._writer.flush()
+            if self.fsync:
+                os.fsync(self._writer.fileno())
+            self.appended_seq = seq
+            return seq
+
+    def read(self, max_records: int) -> Tuple[List[Dict[str, Any]], Tuple[int, int]]:
+        """Read up to `max_records` unapplied records, returns them and the position after them"""
+        records = []
+        segment, offset = self._read_pos
+        while len(records) < max_records:
+            path = self._segment_path(segment)
+            if not os.path.exists(path):
+                break
+            with open(path, "rb") as f:
+                f.seek(offset)
+                while len(records) < max_records:
+                    line = f.readline()
+                    if not line.endswith(b"\n"):
+                        break  # end of segment or a record still being written
+                    offset += len(line)
+                    record = json.loads(line)
+                    if record["seq"] > self.applied_seq:
+                        records.append(record)
+            if len(records) >= max_records or segment >= self._segment:
+                break
+            segment, offset = segment + 1, 0
+        return records, (segment, offset)
+
+    def commit(self, seq: int, position: Tuple[int, int]):
+        """Mark everything up to `seq` as applied and drop finished segments"""
+        self.applied_seq = seq
+        self._read_pos = position
+        tmp = os.path.join(self.directory, "checkpoint.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"seq": seq, "segment": position[0], "offset": position[1]}, f)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, os.path.join(self.directory, "checkpoint"))
+
+        for segment in self._segments():
+            if segment < position[0]:
+                os.remove(self._segment_path(segment))
+
+    def close(self):
+        with self._lock:
+            self._writer.close()
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"{segment:012d}.jsonl")
+
+    def _segments(self) -> List[int]:
+        return sorted(
+            int(name[:-6])
+            for name in os.listdir(self.directory)
+            if re.fullmatch(r"\d{12}\.jsonl", name)
+        )
+
+    def _read_checkpoint(self) -> Dict[str, int]:
+        path = os.path.join(self.directory, "checkpoint")
+        if os.path.isfile(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return {"seq": 0, "segment": 1, "offset": 0}
+
+    def _recover(self, segment: int) -> int:
+        """Cut a torn last record off a segment, returns the last seq in it"""
+        path = self._segment_path(segment)
+        if not os.path.exists(path):
+            return 0
+
+        last_seq, good = 0, 0
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    last_seq = json.loads(line)["seq"]
+                except ValueError:
+                    break
+                good += len(line)
+        if good < os.path.getsize(path):
+            with open(path, "r+b") as f:
+                f.truncate(good)
+        return last_seq
+
+
+PROGRESS_TABLE = "sa_orm_journal_state"
+
+_DDL = re.compile(r"\s*(CREATE|DROP|ALTER|TRUNCATE|RENAME)\b", re.IGNORECASE)
+
+
+def is_ddl(query: str) -> bool:
+    """Whether a statement commits implicitly on MySQL"""
+    return _DDL.match(query) is not None
+
+
+class ShadowReplicator:
+    """Drains one shadow's journal on a background thread
+
+    Consecutive records are applied in one transaction per batch; a record
+    holding DDL (which commits implicitly on MySQL) gets a batch of its own,
+    so a batch never commits halfway (the DDL may run again after a crash).
+    A failing
+    batch is retried with backoff and never skipped, so the shadow receives
+    the writes in primary commit order. The last applied sequence number is
+    also stored on the shadow inside that transaction, which keeps replay
+    exactly-once when the process dies between the shadow commit and the
+    local checkpoint.
+    """
+
+    def __init__(
+        self,
+        shadow_db: BaseDC,
+        journal: ShadowJournal,
+        ops_for,
+        batch_size: int = 500,
+        max_lag: Optional[int] = None,
+        poll_interval: float = 0.5,
+    ):
+        self.shadow_db = shadow_db
+        self.journal = journal
+        self._ops_for = ops_for
+        self.batch_size = batch_size
+        self.max_lag = max_lag
+        self.poll_interval = poll_interval
+
+        self.journal_id = hashlib.sha1(
+            os.path.abspath(journal.directory).encode("utf-8")
+        ).hexdigest()
+        self.last_error: Optional[str] = None
+        self.last_error_at: Optional[float] = None
+        # Exact once the worker reads the first pending record
+        self._oldest_pending_ts: Optional[float] = time.time() if self.lag else None
+        self._cond = threading.Condition()
+        self._stop = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"sa_orm-replicator-{shadow_db}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def lag(self) -> int:
+        return self.journal.appended_seq - self.journal.applied_seq
+
+    def submit(self, statements: List[Statement]) -> int:
+        with self._cond:
+            if self.lag == 0:
+                self._oldest_pending_ts = time.time()
+            seq = self.journal.append(statements)
+            self._cond.notify_all()
+            return seq
+
+    def wait_for_capacity(self, timeout: Optional[float]):
+        """Block while the shadow is `max_lag` or more writes behind"""
+        if self.max_lag is None:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self.lag >= self.max_lag:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(
+                        f"Shadow {self.shadow_db} is {self.lag} writes behind (max_lag={self.max_lag})"
+                    )
+                self._cond.wait(remaining)
+
+    def wait_until_caught_up(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self.lag > 0:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def status(self) -> Dict[str, Any]:
+        with self._cond:
+            pending_since = self._oldest_pending_ts if self.lag else None
+            return {
+                "appended_seq": self.journal.appended_seq,
+                "applied_seq": self.journal.applied_seq,
+                "lag": self.lag,
+                "lag_seconds": time.time() - pending_since if pending_since else 0.0,
+                "last_error": self.last_error,
+                "last_error_at": self.last_error_at,
+            }
+
+    def stop(self, timeout: Optional[float] = None):
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        self.journal.close()
+
+    def _sync_progress(self):
+        """Skip records the shadow already applied according to its progress table"""
+        ops = self._ops_for(self.shadow_db)
+        # Its own statement, DDL must never run inside a replay batch
+        ops.execute_query(
+            self.shadow_db,
+            f"CREATE TABLE IF NOT EXISTS {PROGRESS_TABLE} "
+            "(journal_id VARCHAR(64) PRIMARY KEY, seq BIGINT NOT NULL)",
+        )
+        result = ops.execute_query(
+            self.shadow_db,
+            f"SELECT seq FROM {PROGRESS_TABLE} WHERE journal_id = %s",
+            (self.journal_id,),
+            fetch=True,
+        )
+        if not result["result"]:
+            ops.execute_query(
+                self.shadow_db,
+                f"INSERT INTO {PROGRESS_TABLE} (journal_id, seq) VALUES (%s, %s)",
+                (self.journal_id, self.journal.applied_seq),
+            )
+            return
+
+        shadow_seq = int(result["result"][0][0])
+        if shadow_seq > self.journal.applied_seq:
+            with self._cond:
+                records, position = self.journal.read(
+                    shadow_seq - self.journal.applied_seq
+                )
+                self.journal.commit(shadow_seq, position)
+                self._cond.notify_all()
+
+    def _backoff(self, failures: int, e: Exception):
+        with self._cond:
+            self.last_error = f"{e.__cause__ or e}"
+            self.last_error_at = time.time()
+            self._cond.wait(min(0.1 * 2**failures, 5.0))
+
+    @staticmethod
+    def _batch_length(records: List[Dict[str, Any]]) -> int:
+        """How many of the leading records can share one transaction"""
+        for i, record in enumerate(records):
+            if any(is_ddl(query) for query, _ in record["statements"]):
+                return max(i, 1)
+        return len(records)
+
+    def _run(self):
+        failures = 0
+        while not self._stop:
+            try:
+                self._sync_progress()
+                break
+            except Exception as e:
+                failures += 1
+                self._backoff(failures, e)
+
+        failures = 0
+        while True:
+            with self._cond:
+                while not self._stop and self.lag == 0:
+                    self._cond.wait(self.poll_interval)
+                if self._stop:
+                    return
+
+            records, position = self.journal.read(self.batch_size)
+            if not records:
+                time.sleep(self.poll_interval)
+                continue
+            count = self._batch_length(records)
+            if count < len(records):
+                records, position = self.journal.read(count)
+
+            with self._cond:
+                self._oldest_pending_ts = records[0]["ts"]
+
+            statements = [
+                (query, tuple(decode_value(params)))
+                for record in records
+                for query, params in record["statements"]
+            ]
+            statements.append(
+                (
+                    f"UPDATE {PROGRESS_TABLE} SET seq = %s WHERE journal_id = %s",
+                    (records[-1]["seq"], self.journal_id),
+                )
+            )
+            try:
+                ops = self._ops_for(self.shadow_db)
+                ops.execute_batch(self.shadow_db, statements)
+            except Exception as e:
+                failures += 1
+                self._backoff(failures, e)
+                continue
+
+            failures = 0
+            with self._cond:
+                self.journal.commit(records[-1]["seq"], position)
+                self.last_error = None
+                self._cond.notify_all()
+
+
+class WriteBehindReplicator:
+    """Asynchronous shadow replication through one journal per shadow"""
+
+    def __init__(
+        self,
+        directory: str,
+        ops_for,
+        batch_size: int = 500,
+        max_lag: Optional[int] = None,
+        backpressure_timeout: Optional[float] = 30.0,
+        fsync: bool = True,
+        segment_bytes: int = 64 << 20,
+    ):
+        self.directory = os.path.abspath(directory)
+        self._ops_for = ops_for
+        self.batch_size = batch_size
+        self.max_lag = max_lag
+        self.backpressure_timeout = backpressure_timeout
+        self.fsync = fsync
+        self.segment_bytes = segment_bytes
+        self._replicators: Dict[BaseDC, ShadowReplicator] = {}
+        self._journals: Dict[str, BaseDC] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def journal_name(shadow_db: BaseDC) -> str:
+        """Directory name of a shadow's journal, stable across runs
+
+        Readable, plus a digest of the full name so shadows whose names only
+        differ in characters a path cannot hold get journals of their own.
+        """
+        name = f"{shadow_db}"
+        digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:12]
+        return f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}-{digest}"
+
+    def replicator(self, shadow_db: BaseDC) -> ShadowReplicator:
+        with self._lock:
+            if shadow_db not in self._replicators:
+                name = self.journal_name(shadow_db)
+                owner = self._journals.get(name)
+                if owner is not None:
+                    raise ValueError(
+                        f"{shadow_db} and {owner} would share the journal {name} "
+                        f"in {self.directory}, use one connection per shadow "
+                        "database or another journal_dir"
+                    )
+                journal = ShadowJournal(
+                    os.path.join(self.directory, name),
+                    segment_bytes=self.segment_bytes,
+                    fsync=self.fsync,
+                )
+                self._replicators[shadow_db] = ShadowReplicator(
+                    shadow_db,
+                    journal,
+                    self._ops_for,
+                    batch_size=self.batch_size,
+                    max_lag=self.max_lag,
+                )
+                self._journals[name] = shadow_db
+            return self._replicators[shadow_db]
+
+    def wait_for_capacity(self, shadows: List[BaseDC]):
+        for shadow_db in shadows:
+            self.replicator(shadow_db).wait_for_capacity(self.backpressure_timeout)
+
+    def submit(self, shadow_db: BaseDC, statements: List[Statement]) -> int:
+        return self.replicator(shadow_db).submit(statements)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            replicators = dict(self._replicators)
+        return {f"{db}": r.status() for db, r in replicators.items()}
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every shadow has applied its journal"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            replicators = list(self._replicators.values())
+        for r in replicators:
+            remaining = (
+                None if deadline is None else max(0, deadline - time.monotonic())
+            )
+            if not r.wait_until_caught_up(remaining):
+                return False
+        return True
+
+    def close(self, timeout: Optional[float] = None):
+        """Stop the workers, whatever is left stays in the journal for the next run"""
+        with self._lock:
+            replicators = list(self._replicators.values())
+            self._replicators.clear()
+            self._journals.clear()
+        for r in replicators:
+            r.stop(timeout)
+
+
+_replicators: Dict[str, WriteBehindReplicator] = {}
+_replicators_lock = threading.Lock()
+
+
+def get_replicator(directory: str, ops_for, **options) -> WriteBehindReplicator:
+    """One replicator per journal directory, so models sharing it never race on the files
+
+    Models sharing a directory must ask for the same `options`.
+    """
+    path = os.path.abspath(directory)
+    with _replicators_lock:
+        replicator = _replicators.get(path)
+        if replicator is None:
+            replicator = _replicators[path] = WriteBehindReplicator(
+                path, ops_for, **options
+            )
+        current = {name: getattr(replicator, name) for name in options}
+        if current != options:
+            raise ValueError(
+                f"Journal directory {path} is already replicated with {current}, "
+                f"got {options}"
+            )
+        return replicator
@@ -0,0 +1,81 @@
+import base64
+import binascii
+import json
+import re
+from typing import Any, List, Sequence, Tuple, Union
+from .values import decode_value, encode_value
+
+# (column, descending)
+SortKey = Tuple[str, bool]
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def is_identifier(name: str) -> bool:
+    return bool(_IDENTIFIER.match(name))
+
+
+def parse_sort_keys(order_by: Union[str, Sequence[str], None]) -> List[SortKey]:
+    """Turn `"-created_at"`, `"created_at DESC, id"` or a list of those into sort keys"""
+    if order_by is None:
+        items = []
+    elif isinstance(order_by, str):
+        items = [item for item in order_by.split(",") if item.strip()]
+    else:
+        items = list(order_by)
+
+    order: List[SortKey] = []
+    for item in items:
+        parts = item.split()
+        column, descending = parts[0], False
+        if column.startswith("-"):
+            column, descending = column[1:], True
+        if len(parts) == 2 and parts[1].upper() in ("ASC", "DESC"):
+            descending = parts[1].upper() == "DESC"
+        elif len(parts) != 1:
+            raise ValueError(f"Invalid order_by item: {item!r}")
+        if not is_identifier(column):
+            raise ValueError(f"Invalid order_by column: {column!r}")
+        order.append((column, descending))
+    return order
+
+
+def parse_order_by(
+    order_by: Union[str, Sequence[str], None], primary_key: str
+) -> List[SortKey]:
+    """Sort keys for keyset pagination
+
+    The primary key is appended when missing so that every row has a distinct
+    position, which keyset pagination needs to never skip or repeat a row.
+    """
+    order = parse_sort_keys(order_by)
+    if primary_key not in (column for column, _ in order):
+        direction = order[-1][1] if order else False
+        order.append((primary_key, direction))
+    return order
+
+
+def encode_cursor(order: List[SortKey], values: Sequence[Any]) -> str:
+    """Opaque token for the position after a row with these sort values"""
+    payload = {
+        "o": [("-" if descending else "") + column for column, descending in order],
+        "k": encode_value(list(values)),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, order: List[SortKey]) -> List[Any]:
+    """Sort values stored in a token, checking it was made for the same ordering"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        values = decode_value(payload["k"])
+        token_order = payload["o"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid pagination cursor")
+
+    expected = [("-" if descending else "") + column for column, descending in order]
+    if token_order != expected or len(values) != len(order):
+        raise ValueError("Pagination cursor was created for a different order_by")
+    return values
@@ -1,11 +1,104 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from ..base.declare import BaseDC
+from .keyset import SortKey
+from .schema import TableSchema, schema_cache
+
+# A compiled WHERE condition: (column, lookup, number of bound values)
+Condition = Tuple[str, str, int]
+
+# A statement as run by execute_batch() or replayed on a shadow: (query, params)
+Statement = Tuple[str, tuple]
+
+_COMPARISONS = {
+    "eq": "=",
+    "ne": "<>",
+    "gt": ">",
+    "gte": ">=",
+    "lt": "<",
+    "lte": "<=",
+    "like": "LIKE",
+}
+
+
+class SQLCache:
+    """Bounded LRU of generated SQL, keyed by the shape of the statement"""
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: tuple, build: Callable[[], str]) -> str:
+        with self._lock:
+            sql = self._entries.get(key)
+            if sql is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return sql
+            self.misses += 1
+
+        sql = build()
+        with self._lock:
+            self._entries[key] = sql
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return sql
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
+def cached_sql(build: Callable[..., str]) -> Callable[..., str]:
+    """Build the SQL of a method once per distinct set of arguments
+
+    The arguments describe the statement shape (table, columns, ...), never
+    the values bound to it, so the number of entries stays small.
+    """
+
+    @wraps(build)
+    def wrapper(self, *args, **kwargs):
+        key = (
+            build.__qualname__,
+            _hashable(args),
+            _hashable(sorted(kwargs.items())),
+        )
+        return self.sql_cache.get_or_build(key, lambda: build(self, *args, **kwargs))
+
+    return wrapper
 
 
 class BaseOperations(ABC):
     """Abstract base class defining the interface for database operations"""
 
+    # Upper bound on bind parameters a single statement may carry, None = no limit
+    max_bind_params: Optional[int] = None
+    # Whether INSERT/UPDATE hand back the stored row (RETURNING) in the same round trip
+    returning = False
+
+    def __init__(self):
+        self.sql_cache = SQLCache()
+
     @abstractmethod
     def create_table_sql(
         self,
@@ -22,6 +115,263 @@ class BaseOperations(ABC):
         """Generate INSERT SQL that returns the created record"""
         pass
 
+    @cached_sql
+    def bulk_insert_sql(
+        self, table_name: str, columns: List[str], row_count: int
+    ) -> str:
+        """Generate a multi-row INSERT for `row_count` rows"""
+        row = f"({', '.join(['%s'] * len(columns))})"
+        return f"""
+        INSERT INTO {table_name} ({", ".join(columns)})
+        VALUES {", ".join([row] * row_count)}
+        """
+
+    def batch_rows(self, rows: List[tuple], column_count: int) -> List[List[tuple]]:
+        """Split rows so that no statement exceeds `max_bind_params`"""
+        if not self.max_bind_params or not rows:
+            return [rows] if rows else []
+        size = max(1, self.max_bind_params // max(1, column_count))
+        return [rows[i : i + size] for i in range(0, len(rows), size)]
+
+    def condition_sql(self, column: str, lookup: str, arity: int) -> str:
+        """SQL of one `column__lookup` condition taking `arity` values"""
+        if lookup in _COMPARISONS:
+            return f"{column} {_COMPARISONS[lookup]} %s"
+        match lookup:
+            case "ilike":
+                return f"LOWER({column}) LIKE LOWER(%s)"
+            case "in" | "not_in":
+                if arity == 0:
+                    # Nothing is IN an empty list, everything is NOT IN it
+                    return "1 = 0" if lookup == "in" else "1 = 1"
+                operator = "IN" if lookup == "in" else "NOT IN"
+                return f"{column} {operator} ({', '.join(['%s'] * arity)})"
+            case "isnull":
+                return f"{column} IS NULL"
+            case "notnull":
+                return f"{column} IS NOT NULL"
+        raise ValueError(f"Unsupported lookup: {lookup}")
+
+    def limit_sql(self, limit: bool, offset: bool) -> str:
+        """LIMIT/OFFSET clause with placeholders for the ones in use"""
+        clauses = []
+        if limit:
+            clauses.append("LIMIT %s")
+        if offset:
+            clauses.append("OFFSET %s")
+        return " ".join(clauses)
+
+    @cached_sql
+    def select_sql(
+        self,
+        table_name: str,
+        columns: Optional[Tuple[str, ...]] = None,
+        conditions: Tuple[Condition, ...] = (),
+        where: Tuple[str, ...] = (),
+        order: Tuple[SortKey, ...] = (),
+        limit: bool = False,
+        offset: bool = False,
+    ) -> str:
+        """Generate a SELECT; `where` holds raw SQL fragments ANDed with `conditions`"""
+        query = f"SELECT {', '.join(columns) if columns else '*'} FROM {table_name}"
+
+        clauses = [self.condition_sql(*condition) for condition in conditions]
+        clauses += [f"({fragment})" for fragment in where]
+        if clauses:
+            query += f" WHERE {' AND '.join(clauses)}"
+        if order:
+            query += f" ORDER BY {self.order_by_sql(list(order))}"
+        if limit or offset:
+            query += f" {self.limit_sql(limit, offset)}"
+        return query
+
+    def select_by_pk_sql(self, table_name: str, primary_key: str) -> str:
+        return self.select_sql(table_name, conditions=((primary_key, "eq", 1),))
+
+    def order_by_sql(self, order: List[SortKey]) -> str:
+        return ", ".join(
+            f"{column} {'DESC' if descending else 'ASC'}"
+            for column, descending in order
+        )
+
+    def keyset_predicate(
+        self, order: List[SortKey], values: List[Any]
+    ) -> Tuple[str, tuple]:
+        """WHERE clause selecting the rows that sort after `values`
+
+        Expanded form `a > x OR (a = x AND b > y) ...`, which handles a mix of
+        ascending and descending keys and is range-scanned by a matching index.
+        """
+        clauses, params = [], []
+        for i, (column, descending) in enumerate(order):
+            terms = [f"{prev} = %s" for prev, _ in order[:i]]
+            terms.append(f"{column} {'<' if descending else '>'} %s")
+            clauses.append(f"({' AND '.join(terms)})")
+            params.extend(values[: i + 1])
+        return f"({' OR '.join(clauses)})", tuple(params)
+
+    @abstractmethod
+    def bulk_insert(
+        self,
+        db: BaseDC,
+        table_name: str,
+        primary_key: str,
+        columns: List[str],
+        rows: List[tuple],
+    ) -> List[Dict[str, Any]]:
+        """Insert many rows letting the database assign keys, return the record data in row order"""
+        pass
+
+    @abstractmethod
+    def bulk_copy(
+        self, db: BaseDC, table_name: str, columns: List[str], rows: List[tuple]
+    ) -> int:
+        """Load rows whose keys are already known (shadow replay), return rows written"""
+        pass
+
+    @cached_sql
+    def upsert_sql(
+        self,
+        table_name: str,
+        columns: List[str],
+        conflict_on: List[str],
+        row_count: int = 1,
+    ) -> str:
+        """Generate a multi-row INSERT that updates the rows whose `conflict_on` columns exist
+
+        `conflict_on` must be the primary key or a unique index.
+        """
+        # With nothing else to set, a no-op assignment still returns the row
+        updates = [c for c in columns if c not in conflict_on] or conflict_on[:1]
+        row = f"({', '.join(['%s'] * len(columns))})"
+        return f"""
+        INSERT INTO {table_name} ({", ".join(columns)})
+        VALUES {", ".join([row] * row_count)}
+        ON CONFLICT ({", ".join(conflict_on)})
+        DO UPDATE SET {", ".join(f"{c} = excluded.{c}" for c in updates)}
+        """
+
+    @cached_sql
+    def update_where_sql(
+        self, table_name: str, columns: Tuple[str, ...], where: Tuple[str, ...]
+    ) -> str:
+        """Generate a set-based UPDATE; `where` holds raw SQL fragments ANDed together"""
+        assignments = ", ".join(f"{column} = %s" for column in columns)
+        return f"UPDATE {table_name} SET {assignments}{self._where_sql(where)}"
+
+    @cached_sql
+    def delete_where_sql(self, table_name: str, where: Tuple[str, ...]) -> str:
+        """Generate a set-based DELETE; `where` holds raw SQL fragments ANDed together"""
+        return f"DELETE FROM {table_name}{self._where_sql(where)}"
+
+    @abstractmethod
+    def row_hash_sql(self, columns: Tuple[str, ...]) -> str:
+        """SQL expression of the MD5 hex digest of a row's `columns`, NULLs included"""
+        pass
+
+    @abstractmethod
+    def hash_sum_sql(self, row_hash: str) -> str:
+        """SQL aggregate adding up the leading 60 bits of `row_hash`, 0 for no rows"""
+        pass
+
+    @cached_sql
+    def checksum_sql(
+        self, table_name: str, columns: Tuple[str, ...], where: Tuple[str, ...]
+    ) -> str:
+        """Generate a SELECT of the row count and hash sum of the matching rows"""
+        row_hash = self.row_hash_sql(columns)
+        return (
+            f"SELECT COUNT(*), {self.hash_sum_sql(row_hash)} "
+            f"FROM {table_name}{self._where_sql(where)}"
+        )
+
+    @cached_sql
+    def row_hashes_sql(
+        self,
+        table_name: str,
+        primary_key: str,
+        columns: Tuple[str, ...],
+        where: Tuple[str, ...],
+    ) -> str:
+        """Generate a SELECT of the key and row hash of each matching row"""
+        return (
+            f"SELECT {primary_key}, {self.row_hash_sql(columns)} "
+            f"FROM {table_name}{self._where_sql(where)}"
+        )
+
+    def _where_sql(self, where: Tuple[str, ...]) -> str:
+        if not where:
+            return ""
+        return f" WHERE {' AND '.join(f'({fragment})' for fragment in where)}"
+
+    @cached_sql
+    def select_by_keys_sql(
+        self, table_name: str, key_columns: List[str], key_count: int
+    ) -> str:
+        """Generate a SELECT of the rows matching any of `key_count` key tuples"""
+        if len(key_columns) == 1:
+            return self.select_sql(
+                table_name, conditions=((key_columns[0], "in", key_count),)
+            )
+        key = f"({', '.join(['%s'] * len(key_columns))})"
+        return (
+            f"SELECT * FROM {table_name} WHERE ({', '.join(key_columns)}) "
+            f"IN ({', '.join([key] * key_count)})"
+        )
+
+    def bulk_upsert(
+        self,
+        db: BaseDC,
+        table_name: str,
+        columns: List[str],
+        conflict_on: List[str],
+        rows: List[tuple],
+    ) -> List[Dict[str, Any]]:
+        """Insert or update rows by their `conflict_on` columns, return the stored records"""
+        positions = [columns.index(c) for c in conflict_on]
+        records = []
+        for batch in self.batch_rows(rows, len(columns)):
+            query = self.upsert_sql(table_name, columns, conflict_on, len(batch))
+            params = tuple(value for row in batch for value in row)
+            result = self.execute_query(db, query, params, fetch=True)
+
+            if result.get("result") and result.get("columns"):
+                records.extend(
+                    self.row_to_dict(db, table_name, result, row)
+                    for row in result["result"]
+                )
+                continue
+
+            # No RETURNING, read the rows back by their conflict columns
+            records.extend(
+                self.fetch_by_keys(
+                    db,
+                    table_name,
+                    conflict_on,
+                    [tuple(row[i] for i in positions) for row in batch],
+                )
+            )
+        return records
+
+    def fetch_by_keys(
+        self,
+        db: BaseDC,
+        table_name: str,
+        key_columns: List[str],
+        keys: List[tuple],
+    ) -> List[Dict[str, Any]]:
+        """Read the rows matching `keys`, one SELECT per `max_bind_params` worth of keys"""
+        records = []
+        for batch in self.batch_rows(keys, len(key_columns)):
+            select = self.select_by_keys_sql(table_name, key_columns, len(batch))
+            params = tuple(value for key in batch for value in key)
+            result = self.execute_query(db, select, params, fetch=True)
+            records.extend(
+                self.row_to_dict(db, table_name, result, row)
+                for row in result["result"]
+            )
+        return records
+
     @abstractmethod
     def update_sql(self, table_name: str, columns: List[str], primary_key: str) -> str:
         """Generate UPDATE SQL that returns the updated record"""
@@ -39,9 +389,62 @@ class BaseOperations(ABC):
         pass
 
     @abstractmethod
+    def iter_query(
+        self, db: BaseDC, query: str, params: tuple = (), batch_size: int = 1000
+    ) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """Stream a SELECT in batches of at most `batch_size` rows, yields (columns, rows)"""
+        pass
+
+    @abstractmethod
+    def execute_batch(
+        self, db: BaseDC, statements: List[Tuple[str, tuple]]
+    ) -> List[int]:
+        """Run statements in one transaction and commit once, returns their rowcounts"""
+        pass
+
+    @abstractmethod
+    def describe_table(self, db: BaseDC, table_name: str) -> TableSchema:
+        """Read column names, types and primary key of a table from the server"""
+        pass
+
+    def get_schema(
+        self, db: BaseDC, table_name: str, refresh: bool = False
+    ) -> TableSchema:
+        """Get the cached schema of a table, describing it on first use"""
+        schema = None if refresh else schema_cache.get(db, table_name)
+        if schema is None:
+            schema = schema_cache.set(db, self.describe_table(db, table_name))
+        return schema
+
+    def refresh_schema(self, db: BaseDC, table_name: str) -> TableSchema:
+        """Discard the cached schema of a table and describe it again"""
+        return self.get_schema(db, table_name, refresh=True)
+
+    def invalidate_schema(self, db: BaseDC, table_name: Optional[str] = None):
+        """Forget cached schema of a table (or every table) on a connection"""
+        schema_cache.invalidate(db, table_name)
+
+    def remember_columns(
+        self, db: BaseDC, table_name: str, columns: Optional[List[str]]
+    ):
+        """Seed the schema cache from the description of a `SELECT *` already run"""
+        if columns and schema_cache.get(db, table_name) is None:
+            schema_cache.set(db, TableSchema(table_name, columns))
+
     def get_column_names(self, db: BaseDC, table_name: str) -> List[str]:
         """Get column names for a table"""
-        pass
+        return self.get_schema(db, table_name).columns
+
+    def row_to_dict(
+        self, db: BaseDC, table_name: str, result: Dict[str, Any], row: tuple
+    ) -> Dict[str, Any]:
+        """Map a row of a `SELECT *`/`RETURNING *` result to a column dict"""
+        columns = result.get("columns")
+        if columns:
+            self.remember_columns(db, table_name, columns)
+        else:
+            columns = self.get_column_names(db, table_name)
+        return dict(zip(columns, row))
 
     @abstractmethod
     def handle_insert_result(
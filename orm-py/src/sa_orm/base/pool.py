@@ -0,0 +1,241 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict
+
+
+class PoolTimeout(TimeoutError):
+    "Raised when no connection could be checked out within the acquire timeout"
+
+
+class _PooledConnection:
+    __slots__ = ("raw", "created_at", "last_used")
+
+    def __init__(self, raw: Any):
+        self.raw = raw
+        self.created_at = self.last_used = time.monotonic()
+
+
+class ConnectionPool:
+    """Thread-safe pool of driver connections
+
+    Connections are handed out LIFO so the warmest ones get reused, closed once
+    older than `max_lifetime` and reaped by a background thread after sitting
+    idle for `max_idle` seconds (never below `min_size`).
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        close: Callable[[Any], None],
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_lifetime: float | None = 3600.0,
+        max_idle: float | None = 600.0,
+        reap_interval: float = 30.0,
+        name: str = "pool",
+    ):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError(
+                "Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1"
+            )
+
+        self._connect = connect
+        self._close = close
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.name = name
+
+        self._idle: deque[_PooledConnection] = deque()
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._size = 0  # idle + in use + being opened
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._waiting = 0
+        self._stats = {
+            "acquired": 0,
+            "timeouts": 0,
+            "created": 0,
+            "closed": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+        }
+
+        self._fill()
+        self._stop = threading.Event()
+        self._reaper = threading.Thread(
+            target=self._reap_loop,
+            args=(reap_interval,),
+            name=f"{name}-reaper",
+            daemon=True,
+        )
+        self._reaper.start()
+
+    def acquire(self, timeout: float | None = None) -> Any:
+        """Check a connection out, waiting up to `timeout` seconds for one to free up"""
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError(f"Connection pool {self.name} is closed")
+
+                while self._idle:
+                    pooled = self._idle.pop()
+                    if self._expired(pooled, time.monotonic()):
+                        self._discard(pooled)
+                        continue
+                    return self._hand_out(pooled, start)
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise PoolTimeout(
+                        f"No connection available in {self.name} after {timeout}s "
+                        f"({self._size} open, all in use)"
+                    )
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+        # Open the new connection outside the lock, the slot is already reserved
+        try:
+            pooled = _PooledConnection(self._connect())
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._stats["created"] += 1
+            return self._hand_out(pooled, start)
+
+    def release(self, raw: Any, discard: bool = False):
+        """Return a connection, `discard` closes it instead (e.g. after a broken socket)"""
+        with self._cond:
+            pooled = self._in_use.pop(id(raw), None)
+            if pooled is None:
+                return
+
+            now = time.monotonic()
+            if discard or self._closed or self._expired(pooled, now):
+                self._discard(pooled)
+            else:
+                pooled.last_used = now
+                self._idle.append(pooled)
+            self._cond.notify()
+
+        # Keep min_size open connections around after discarding one
+        if not self._closed and self._size < self.min_size:
+            self._fill()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool usage, for sizing the pool under load"""
+        with self._cond:
+            acquired = self._stats["acquired"]
+            return {
+                "name": self.name,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                "waiting": self._waiting,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                **self._stats,
+                "wait_time_avg": (
+                    self._stats["wait_time_total"] / acquired if acquired else 0.0
+                ),
+            }
+
+    def reap(self):
+        """Close idle connections past max_idle/max_lifetime, keeping min_size open"""
+        now = time.monotonic()
+        with self._cond:
+            keep = deque()
+            while self._idle:
+                pooled = self._idle.popleft()
+                idle_too_long = (
+                    self.max_idle is not None
+                    and now - pooled.last_used > self.max_idle
+                    and self._size > self.min_size
+                )
+                if idle_too_long or self._expired(pooled, now):
+                    self._discard(pooled)
+                else:
+                    keep.append(pooled)
+            self._idle = keep
+
+        if not self._closed:
+            self._fill()
+
+    def close(self):
+        """Close idle connections now and in-use ones as they are released"""
+        self._stop.set()
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+            self._cond.notify_all()
+
+    def _hand_out(self, pooled: _PooledConnection, start: float) -> Any:
+        waited = time.monotonic() - start
+        self._in_use[id(pooled.raw)] = pooled
+        self._stats["acquired"] += 1
+        self._stats["wait_time_total"] += waited
+        self._stats["wait_time_max"] = max(self._stats["wait_time_max"], waited)
+        return pooled.raw
+
+    def _expired(self, pooled: _PooledConnection, now: float) -> bool:
+        return (
+            self.max_lifetime is not None
+            and now - pooled.created_at > self.max_lifetime
+        )
+
+    def _discard(self, pooled: _PooledConnection):
+        # Called with the lock held
+        self._size -= 1
+        self._stats["closed"] += 1
+        try:
+            self._close(pooled.raw)
+        except Exception:
+            pass
+
+    def _fill(self):
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                pooled = _PooledConnection(self._connect())
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                return
+            with self._cond:
+                self._stats["created"] += 1
+                self._idle.appendleft(pooled)
+                self._cond.notify()
+
+    def _reap_loop(self, interval: float):
+        while not self._stop.wait(interval):
+            self.reap()
+
+    def __repr__(self) -> str:
+        return (
+            f"ConnectionPool({self.name}, size={self._size}, max_size={self.max_size})"
+        )
@@ -0,0 +1,103 @@
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class StatementCache:
+    """Bounded per-connection LRU of server-side prepared statements
+
+    A statement is only prepared once it ran `threshold` times (on any
+    connection of the database), so one-off statements do not pay for the
+    extra prepare round trip. Each connection keeps at most `max_size`
+    prepared statements and closes the least recently used one first.
+    Connections are held weakly, their entries go away with them.
+    """
+
+    def __init__(self, max_size: int = 128, threshold: int = 5):
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+        if threshold < 1:
+            raise ValueError("threshold must be a positive integer")
+        self.max_size = max_size
+        self.threshold = threshold
+        self._statements: "weakref.WeakKeyDictionary[Any, OrderedDict]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Executions of statements not yet prepared, bounded like the statements
+        self._counts: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.unprepared = 0
+
+    def get(
+        self,
+        conn: Any,
+        query: str,
+        prepare: Callable[[str], Any],
+        close: Optional[Callable[[Any], None]] = None,
+    ) -> Optional[Any]:
+        """Handle of `query` prepared on `conn`, None while it ran too rarely
+
+        `prepare(query)` creates the handle on a miss, `close(handle)` releases
+        the one evicted to make room. Both run on the caller's connection, so
+        they are called outside the lock.
+        """
+        with self._lock:
+            statements = self._statements.get(conn)
+            if statements is None:
+                statements = self._statements[conn] = OrderedDict()
+
+            handle = statements.get(query)
+            if handle is not None:
+                statements.move_to_end(query)
+                self.hits += 1
+                return handle
+
+            count = self._counts.pop(query, 0) + 1
+            self._counts[query] = count
+            if len(self._counts) > self.max_size:
+                self._counts.popitem(last=False)
+            if count < self.threshold:
+                self.unprepared += 1
+                return None
+            self.misses += 1
+
+        handle = prepare(query)
+
+        evicted = None
+        with self._lock:
+            statements[query] = handle
+            if len(statements) > self.max_size:
+                evicted = statements.popitem(last=False)[1]
+                self.evictions += 1
+        if evicted is not None and close is not None:
+            close(evicted)
+        return handle
+
+    def discard(self, conn: Any, query: str) -> Optional[Any]:
+        """Forget `query` on `conn` (e.g. after it failed), returns its handle to close"""
+        with self._lock:
+            statements = self._statements.get(conn)
+            return statements.pop(query, None) if statements else None
+
+    def forget(self, conn: Any) -> Tuple[Any, ...]:
+        """Forget every statement of `conn`, returns their handles to close"""
+        with self._lock:
+            statements = self._statements.pop(conn, None)
+            return tuple(statements.values()) if statements else ()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "connections": len(self._statements),
+                "statements": sum(len(s) for s in self._statements.values()),
+                "max_size": self.max_size,
+                "threshold": self.threshold,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "unprepared": self.unprepared,
+            }
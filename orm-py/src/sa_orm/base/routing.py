@@ -0,0 +1,186 @@
+import itertools
+import random
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from .declare import BaseDC
+
+STRATEGIES = ("primary", "round_robin", "least_latency", "weighted")
+
+
+class ShadowHealth:
+    """Which shadows may hold stale rows of a table
+
+    Keyed by (shadow, table) like the failures BaseModel reports. A shadow
+    that missed a write, or whose row count or rows differ from the primary,
+    stays stale for that table: later writes do not bring back what it
+    missed. Only verify_shadows() finding it matching (after a repair),
+    add_shadow() copying it or reset() clear that. A failed read is not
+    stale data and only lasts until the next write to the shadow succeeds.
+    """
+
+    def __init__(self):
+        # (shadow, table) -> (error, stale, position of the failure)
+        self._failed: Dict[Tuple[str, str], Tuple[str, bool, int]] = {}
+        self._positions = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        shadow: Any,
+        table_name: str,
+        error: Optional[Exception] = None,
+        stale: bool = True,
+    ):
+        """Record a failure of `shadow` (stale: it missed a write), or a write that succeeded"""
+        key = (f"{shadow}", table_name)
+        with self._lock:
+            failure = self._failed.get(key)
+            if error is None:
+                if failure is not None and not failure[1]:
+                    del self._failed[key]
+            else:
+                stale = stale or (failure is not None and failure[1])
+                self._failed[key] = (
+                    f"{error}" or repr(error),
+                    stale,
+                    next(self._positions),
+                )
+
+    def record_writes(
+        self,
+        shadows: List[BaseDC],
+        table_name: str,
+        failures: List[Dict[str, Exception]],
+    ):
+        """Mark the outcome of one mirrored write (failures as `[{"<shadow>": e}]`)"""
+        failed = {name: e for failure in failures for name, e in failure.items()}
+        for shadow_db in shadows:
+            self.record(shadow_db, table_name, failed.get(f"{shadow_db}"))
+
+    def position(self) -> int:
+        """Pass to reset() to only forget the failures recorded before this call"""
+        with self._lock:
+            return next(self._positions)
+
+    def reset(
+        self,
+        shadow: Any = None,
+        table_name: Optional[str] = None,
+        before: Optional[int] = None,
+    ):
+        """Forget the failures of `shadow` on `table_name` (None: any)"""
+        with self._lock:
+            for key, (_, _, at) in list(self._failed.items()):
+                if (
+                    (shadow is None or key[0] == f"{shadow}")
+                    and (table_name is None or key[1] == table_name)
+                    and (before is None or at < before)
+                ):
+                    del self._failed[key]
+
+    def healthy(self, shadow: Any, table_name: str) -> bool:
+        return (f"{shadow}", table_name) not in self._failed
+
+    def failures(self) -> Dict[str, str]:
+        with self._lock:
+            return {
+                f"{db}:{table}": error
+                for (db, table), (error, _, _) in self._failed.items()
+            }
+
+
+shadow_health = ShadowHealth()
+
+
+class ReadRouter:
+    """Picks the database a read runs on
+
+    "primary" always reads the primary. "round_robin" rotates over the
+    readable shadows, "least_latency" takes the one with the lowest moving
+    average read time and "weighted" picks at random by `weights` (keyed by
+    the connection or its repr, the primary included when it has a weight).
+    `include_primary` adds the primary to the rotation of the first two.
+
+    Reads of a session stay on the primary for `read_your_writes` seconds
+    after its last write. In async replication mode shadows more than
+    `max_lag` writes behind are skipped (None: any lag is fine).
+    """
+
+    # Share of least_latency reads sent to a random candidate, so a database
+    # that was slow once gets measured again
+    explore = 0.05
+    # Weight of the newest sample in the moving average
+    alpha = 0.2
+
+    def __init__(
+        self,
+        strategy: str = "primary",
+        weights: Optional[Mapping[Any, float]] = None,
+        include_primary: bool = False,
+        read_your_writes: float = 5.0,
+        max_lag: Optional[int] = None,
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(
+                f"Unknown routing strategy {strategy!r}, expected one of {STRATEGIES}"
+            )
+        if strategy == "weighted" and not weights:
+            raise ValueError("The weighted strategy needs weights")
+        if weights and any(weight < 0 for weight in weights.values()):
+            raise ValueError("Weights must not be negative")
+
+        self.strategy = strategy
+        self.weights = {f"{db}": weight for db, weight in (weights or {}).items()}
+        self.include_primary = include_primary
+        self.read_your_writes = read_your_writes
+        self.max_lag = max_lag
+        self._turn = itertools.count()
+        self._latency: Dict[str, float] = {}
+        self._reads: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def choose(self, primary: BaseDC, shadows: List[BaseDC]) -> BaseDC:
+        """Database for the next read among the primary and the readable `shadows`"""
+        if self.strategy == "primary" or not shadows:
+            return primary
+
+        if self.strategy == "weighted":
+            candidates = [
+                db for db in [primary, *shadows] if self.weights.get(f"{db}", 0) > 0
+            ]
+            if not candidates:
+                return primary
+            return random.choices(
+                candidates, [self.weights[f"{db}"] for db in candidates]
+            )[0]
+
+        candidates = [primary, *shadows] if self.include_primary else shadows
+        if self.strategy == "round_robin":
+            return candidates[next(self._turn) % len(candidates)]
+
+        if random.random() < self.explore:
+            return random.choice(candidates)
+        # Databases without a sample yet come first
+        return min(candidates, key=lambda db: self._latency.get(f"{db}", 0.0))
+
+    def observe(self, db: BaseDC, seconds: float):
+        """Record the time a read took on `db`"""
+        name = f"{db}"
+        with self._lock:
+            previous = self._latency.get(name)
+            self._latency[name] = (
+                seconds
+                if previous is None
+                else previous + self.alpha * (seconds - previous)
+            )
+            self._reads[name] = self._reads.get(name, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "strategy": self.strategy,
+                "reads": dict(self._reads),
+                "latency_ms": {
+                    name: seconds * 1000 for name, seconds in self._latency.items()
+                },
+            }
@@ -0,0 +1,50 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from .declare import BaseDC
+
+
+class TableSchema:
+    """Column metadata of one table as seen through one connection"""
+
+    def __init__(
+        self,
+        table_name: str,
+        columns: List[str],
+        types: Optional[Dict[str, Any]] = None,
+        primary_key: Optional[str] = None,
+    ):
+        self.table_name = table_name
+        self.columns = list(columns)
+        self.types = types or {}
+        self.primary_key = primary_key
+
+    def __repr__(self) -> str:
+        return f"TableSchema({self.table_name}, columns={self.columns}, primary_key={self.primary_key})"
+
+
+class SchemaCache:
+    """Process-wide cache of table schemas keyed by (connection, table)"""
+
+    def __init__(self):
+        self._entries: Dict[Tuple[BaseDC, str], TableSchema] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db: BaseDC, table_name: str) -> Optional[TableSchema]:
+        return self._entries.get((db, table_name))
+
+    def set(self, db: BaseDC, schema: TableSchema) -> TableSchema:
+        with self._lock:
+            self._entries[(db, schema.table_name)] = schema
+        return schema
+
+    def invalidate(self, db: BaseDC | None = None, table_name: str | None = None):
+        """Drop cached entries matching the given connection and/or table"""
+        with self._lock:
+            for key in list(self._entries):
+                if (db is None or key[0] is db) and (
+                    table_name is None or key[1] == table_name
+                ):
+                    del self._entries[key]
+
+
+schema_cache = SchemaCache()
@@ -0,0 +1,113 @@
+import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Result shapes of the read APIs: instances, plain rows, or one sequence per column
+SHAPES = ("models", "tuples", "dicts", "columns")
+
+_numpy = None
+
+
+def check_shape(as_: str, allowed: Sequence[str] = SHAPES):
+    if as_ not in allowed:
+        raise ValueError(f"Unknown result shape {as_!r}, expected one of {allowed}")
+
+
+def numpy_module() -> Optional[Any]:
+    """NumPy when installed (`pip install sa_orm[numpy]`), imported on first use"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+class ColumnBuilder:
+    """Collects rows batch by batch into one sequence per column
+
+    With NumPy every batch is turned into per-column arrays as it arrives and
+    the chunks are concatenated once at the end. Without it integer and float
+    columns are packed into `array.array` ("q"/"d") and the rest kept as lists;
+    a column falls back to a list as soon as a value does not fit (None,
+    Decimal, out of range).
+    """
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = list(columns)
+        self._np = numpy_module()
+        self._data: List[Any] = [None] * len(self.columns)
+
+    def add(self, rows: Sequence[tuple]):
+        if not rows:
+            return
+        for i, values in enumerate(zip(*rows)):
+            if self._np is not None:
+                if self._data[i] is None:
+                    self._data[i] = []
+                self._data[i].append(self._np.array(values))
+            else:
+                self._data[i] = _extend(self._data[i], values)
+
+    def result(self) -> Dict[str, Any]:
+        if self._np is not None:
+            return {
+                column: (self._np.concatenate(chunks) if chunks else self._np.array([]))
+                for column, chunks in zip(self.columns, self._data)
+            }
+        return {
+            column: values if values is not None else []
+            for column, values in zip(self.columns, self._data)
+        }
+
+
+def _extend(column: Any, values: Tuple[Any, ...]) -> Any:
+    if column is None:
+        # The first batch picks the storage of the column
+        if all(type(v) is int for v in values):
+            column = array.array("q")
+        elif all(type(v) is float for v in values):
+            column = array.array("d")
+        else:
+            return list(values)
+
+    if isinstance(column, array.array):
+        # "d" would silently turn Decimal and int into float
+        fits = column.typecode == "q" or all(type(v) is float for v in values)
+        if fits:
+            size = len(column)
+            try:
+                column.extend(values)
+                return column
+            except (TypeError, OverflowError):
+                # extend() keeps the values before the one that failed
+                del column[size:]
+        column = column.tolist()
+
+    column.extend(values)
+    return column
+
+
+def shape_rows(as_: str, columns: Sequence[str], rows: Sequence[tuple]) -> Any:
+    """Fetched rows as tuples, dicts or columns (`as_` other than "models")"""
+    if as_ == "tuples":
+        return [tuple(row) for row in rows]
+    if as_ == "dicts":
+        return [dict(zip(columns, row)) for row in rows]
+
+    builder = ColumnBuilder(columns)
+    builder.add(rows)
+    return builder.result()
+
+
+def collect_columns(
+    batches: Iterable[Tuple[List[str], List[tuple]]],
+) -> Optional[Dict[str, Any]]:
+    """Columns of a streamed result, None when it yielded no batch at all"""
+    builder = None
+    for columns, rows in batches:
+        if builder is None:
+            builder = ColumnBuilder(columns)
+        builder.add(rows)
+    return builder.result() if builder is not None else None
@@ -0,0 +1,184 @@
+import threading
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    from .declare import BaseDC
+
+
+class TransactionConnection:
+    """Driver connection held by a transaction
+
+    The operations keep calling commit() after every statement; here that
+    only counts the commit saved, the transaction commits once at the end.
+    A rollback (a statement failed) dooms the whole transaction.
+    """
+
+    def __init__(self, transaction: "Transaction", conn: Any):
+        self._transaction = transaction
+        self._conn = conn
+
+    def commit(self):
+        self._transaction._deferred()
+
+    def rollback(self):
+        self._transaction.failed = True
+        self._conn.rollback()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+
+class Transaction:
+    """One transaction per database touched inside a `transaction()` block
+
+    Connections are checked out on first use and held until the block ends.
+    On exit the primaries (the databases written through `written_to()`)
+    commit first, then the rest; an exception, or a statement that failed
+    inside the block, rolls back every one of them.
+    """
+
+    def __init__(self):
+        self._connections: Dict["BaseDC", TransactionConnection] = {}
+        self._primaries: List["BaseDC"] = []
+        self._after_commit: List[Callable[[], Any]] = []
+        self._on_rollback: Dict[Hashable, Callable[[], Any]] = {}
+        self._stack = ExitStack()
+        self._lock = threading.Lock()
+        self.failed = False
+        self.deferred_commits = 0
+        self.commits = 0
+
+    def connection(self, db: "BaseDC") -> TransactionConnection:
+        """Connection of `db` in this transaction, checked out on first use"""
+        if self.failed:
+            raise Exception("Transaction rolled back, a statement inside it failed")
+        with self._lock:
+            conn = self._connections.get(db)
+            if conn is None:
+                raw = self._stack.enter_context(db.acquire())
+                conn = self._connections[db] = TransactionConnection(self, raw)
+            return conn
+
+    def written_to(self, db: "BaseDC"):
+        """Mark `db` as a primary, committed before the shadows"""
+        with self._lock:
+            if db not in self._primaries:
+                self._primaries.append(db)
+
+    def after_commit(self, func: Callable[[], Any]):
+        """Run `func` once every primary committed, e.g. to journal shadow writes"""
+        with self._lock:
+            self._after_commit.append(func)
+
+    def on_rollback(self, key: Hashable, func: Callable[[], Any]):
+        """Run `func` when the transaction rolls back, once per `key`"""
+        with self._lock:
+            self._on_rollback.setdefault(key, func)
+
+    def _deferred(self):
+        with self._lock:
+            self.deferred_commits += 1
+
+    def commit(self):
+        if self.failed:
+            self.rollback()
+            raise Exception("Transaction rolled back, a statement inside it failed")
+
+        # Primaries first, the shadows only commit what their primary holds
+        order = [db for db in self._primaries if db in self._connections]
+        order += [db for db in self._connections if db not in order]
+
+        failures = []
+        for db in order:
+            try:
+                self._connections[db]._conn.commit()
+                self.commits += 1
+            except Exception as e:
+                if self.commits == 0:
+                    # Nothing is committed yet, so nothing needs to be kept
+                    self.rollback()
+                    raise Exception from e
+                failures.append({f"{db}": e})
+
+        if any(f"{db}" in failure for db in self._primaries for failure in failures):
+            self._rolled_back()
+        else:
+            # Outside the transaction, so statements the callbacks run commit
+            # on their own instead of joining the one that just ended
+            token = _current.set(None)
+            try:
+                for func in self._after_commit:
+                    func()
+            finally:
+                _current.reset(token)
+        if failures:
+            raise Exception(f"Commit failed on the following databases: {failures}")
+
+    def rollback(self):
+        errors = []
+        for conn in self._connections.values():
+            try:
+                conn._conn.rollback()
+            except Exception as e:
+                errors.append(e)
+        self._rolled_back()
+        if errors:
+            raise Exception(f"Rollback failed: {errors}")
+
+    def _rolled_back(self):
+        for func in self._on_rollback.values():
+            func()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "connections": len(self._connections),
+            "deferred_commits": self.deferred_commits,
+            "commits": self.commits,
+            "commits_saved": max(self.deferred_commits - self.commits, 0),
+        }
+
+
+_current: ContextVar[Optional[Transaction]] = ContextVar(
+    "sa_orm_transaction", default=None
+)
+
+
+def current_transaction() -> Optional[Transaction]:
+    return _current.get()
+
+
+@contextmanager
+def transaction() -> Iterator[Transaction]:
+    """Run the statements of the block in one transaction per database
+
+    A nested `transaction()` joins the one already open.
+    """
+    existing = _current.get()
+    if existing is not None:
+        yield existing
+        return
+
+    new_transaction = Transaction()
+    token = _current.set(new_transaction)
+    try:
+        # Closing the stack hands the connections back, broken ones discarded
+        with new_transaction._stack:
+            try:
+                yield new_transaction
+            except BaseException:
+                new_transaction.rollback()
+                raise
+            new_transaction.commit()
+    finally:
+        _current.reset(token)
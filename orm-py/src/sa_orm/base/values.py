@@ -0,0 +1,44 @@
+import base64
+import uuid
+from datetime import date, datetime, time as dtime
+from decimal import Decimal
+from typing import Any
+
+
+def encode_value(value: Any) -> Any:
+    """Make a query parameter JSON safe, tagging types JSON has no notion of"""
+    if isinstance(value, datetime):
+        return {"$t": "datetime", "v": value.isoformat()}
+    if isinstance(value, date):
+        return {"$t": "date", "v": value.isoformat()}
+    if isinstance(value, dtime):
+        return {"$t": "time", "v": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$t": "decimal", "v": str(value)}
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"$t": "bytes", "v": base64.b64encode(bytes(value)).decode("ascii")}
+    if isinstance(value, uuid.UUID):
+        return {"$t": "uuid", "v": str(value)}
+    if isinstance(value, (list, tuple)):
+        return [encode_value(v) for v in value]
+    return value
+
+
+def decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [decode_value(v) for v in value]
+    if isinstance(value, dict) and "$t" in value:
+        match value["$t"]:
+            case "datetime":
+                return datetime.fromisoformat(value["v"])
+            case "date":
+                return date.fromisoformat(value["v"])
+            case "time":
+                return dtime.fromisoformat(value["v"])
+            case "decimal":
+                return Decimal(value["v"])
+            case "bytes":
+                return base64.b64decode(value["v"])
+            case "uuid":
+                return uuid.UUID(value["v"])
+    return value
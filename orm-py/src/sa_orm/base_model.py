@@ -1,15 +1,73 @@
+import keyword
+import os
+import time
+from contextlib import ExitStack, contextmanager
+from functools import partial
+
+from .base.cache import (
+    CacheStore,
+    MemoryStore,
+    RecordCache,
+    ResultCache,
+    table_generations,
+)
 from .base.declare import BaseDC, DatabaseType
-from typing import Dict, List, Any, Optional
-
-from .base.ops import BaseOperations
-from .mysql_orm.ops import MySQLOperations
-from .postgres_orm.ops import PostgreSQLOperations
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Any,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .base.fanout import ShadowFanout
+from .base.keyset import decode_cursor, encode_cursor, parse_order_by
+from .base.ops import BaseOperations, Statement
+from .base.routing import ReadRouter, shadow_health
+from .base.schema import TableSchema
+from .base.shapes import SHAPES, check_shape, collect_columns, shape_rows
+from .base.transaction import Transaction, current_transaction, transaction
 from .log import Logger
+from .session import current_session
+
+if TYPE_CHECKING:
+    from .base.backfill import ShadowBackfill, Throttle
+    from .query import Query
 
 Log = Logger()
 log = Log.log
 log_op = Log.log_op
 
+_UNSET = object()
+
+
+def _restore_compact(
+    model: type, data: Dict[str, Any], dirty: Optional[set], persisted: bool
+) -> "BaseModel":
+    instance = model._loaded(data)
+    instance._dirty = dirty
+    instance._persisted = persisted
+    return instance
+
+
+def _reduce_compact(instance: "BaseModel"):
+    # Generated classes cannot be looked up by name, rebuild through the model
+    return _restore_compact, (
+        instance._model,
+        instance._fields(),
+        instance._dirty,
+        instance._persisted,
+    )
+
+
+def _no_dict(instance: "BaseModel"):
+    # Compact classes inherit the model's __dict__ slot, hide it so it is never filled
+    raise AttributeError(f"{type(instance).__name__!r} compact rows have no __dict__")
+
 
 class OperationsFactory:
     """Factory to create appropriate database operations instance"""
@@ -22,23 +80,170 @@ class OperationsFactory:
         if db.db_type not in cls._operations_cache:
             match db.db_type:
                 case DatabaseType.MYSQL:
+                    from .mysql_orm.ops import MySQLOperations
+
                     cls._operations_cache[db.db_type] = MySQLOperations()
                 case DatabaseType.POSTGRESQL:
+                    from .postgres_orm.ops import PostgreSQLOperations
+
                     cls._operations_cache[db.db_type] = PostgreSQLOperations()
+                case DatabaseType.SQLITE:
+                    from .sqlite_orm.ops import SQLiteOperations
+
+                    cls._operations_cache[db.db_type] = SQLiteOperations()
 
         return cls._operations_cache[db.db_type]
 
 
 class BaseModel:
+    __slots__ = ("_dirty", "_persisted")
+    # Instances built from a row of the table, see _loaded()
+    _persisted: bool
+    # Columns assigned since the instance was loaded or last written (None: none)
+    _dirty: Optional[set]
+
     _db = None
     _shadows = []
     _table_name = None
     _primary_key = "id"
+    _fanout = ShadowFanout()
+    _replicator = None
+    _record_cache: Optional[RecordCache] = None
+    _result_cache: Optional[ResultCache] = None
+    _read_router: Optional[ReadRouter] = None
+    # Shadows being added by add_shadow(), their writes are captured until attached
+    _backfills: Dict[BaseDC, "ShadowBackfill"] = {}
+    # Read rows back after create()/update() where the dialect has no RETURNING
+    _refresh = True
+    # Load rows into generated __slots__ classes instead of per-instance dicts
+    _compact_rows = False
+    # Set on those generated classes: the model and the columns held in slots
+    _model: Optional[type] = None
+    _slots: Tuple[str, ...] = ()
+
+    def __new__(cls, *args, **kwargs):
+        instance = object.__new__(cls)
+        _set_dirty(instance, None)
+        _set_persisted(instance, False)
+        return instance
 
     def __init__(self, **kwargs):
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    def __setattr__(self, name: str, value: Any):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+
+        if name in self._slots:
+            current = getattr(self, name, _UNSET)
+        elif self._slots and not hasattr(type(self), name):
+            raise AttributeError(
+                f"{type(self).__name__!r} compact rows only hold their columns, "
+                f"not {name!r}"
+            )
+        else:
+            current = self.__dict__.get(name, _UNSET)
+        object.__setattr__(self, name, value)
+        if current is _UNSET or current != value:
+            if self._dirty is None:
+                self._dirty = {name}
+            else:
+                self._dirty.add(name)
+
+    @classmethod
+    def _loaded(cls, data: Dict[str, Any]) -> "BaseModel":
+        """Instance of a row as stored, nothing to write back yet"""
+        compact = cls._compact_class(tuple(data)) if cls._compact_rows else None
+        if compact is not None:
+            # Straight into the slots, without __init__ and dirty tracking
+            instance = object.__new__(compact)
+            _set_dirty(instance, None)
+            _set_persisted(instance, True)
+            for set_slot, value in zip(compact._setters, data.values()):
+                set_slot(instance, value)
+            return instance
+
+        instance = cls(**data)
+        instance._mark_clean()
+        return instance
+
+    @classmethod
+    def _complete(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        """A row built from the values sent, the columns not sent as None
+
+        The columns come from the cached schema, so instances of rows written
+        without read-back have every attribute of loaded ones.
+        """
+        ops = OperationsFactory.get_operations(cls._db)
+        schema = ops.get_schema(cls._db, cls._table_name)
+        return {**dict.fromkeys(schema.columns), **data}
+
+    @classmethod
+    def _compact_class(cls, columns: Tuple[str, ...]) -> Optional[type]:
+        """Subclass of the model holding `columns` in __slots__, None when they cannot be slots
+
+        Generated once per model and column list, e.g. once for `SELECT *` and
+        once per distinct `query().select(...)`.
+        """
+        model = cls._model or cls
+        # Kept on the model itself, so they go away with it
+        generated = model.__dict__.get("_compact_classes")
+        if generated is None:
+            generated = model._compact_classes = {}
+        compact = generated.get(columns, _UNSET)
+        if compact is not _UNSET:
+            return compact
+
+        # Columns must be plain identifiers that do not shadow anything of the model
+        usable = len(set(columns)) == len(columns) and all(
+            column.isidentifier()
+            and not keyword.iskeyword(column)
+            and not column.startswith("_")
+            and not hasattr(model, column)
+            for column in columns
+        )
+        compact = None
+        if usable:
+            compact = type(
+                model.__name__,
+                (model,),
+                {
+                    "__slots__": columns,
+                    "__dict__": property(_no_dict),
+                    "__module__": model.__module__,
+                    "__qualname__": model.__qualname__,
+                    "__reduce__": _reduce_compact,
+                    "_model": model,
+                    "_slots": columns,
+                },
+            )
+            compact._setters = tuple(getattr(compact, c).__set__ for c in columns)
+        return generated.setdefault(columns, compact)
+
+    def _mark_clean(self):
+        if self._dirty is not None:
+            self._dirty = None
+        if not self._persisted:
+            self._persisted = True
+
+    def _fields(self) -> Dict[str, Any]:
+        """Column attributes of the instance, slots first"""
+        data = {}
+        for name in self._slots:
+            value = getattr(self, name, _UNSET)
+            if value is not _UNSET:
+                data[name] = value
+        state = getattr(self, "__dict__", None)
+        if state:
+            data.update((k, v) for k, v in state.items() if not k.startswith("_"))
+        return data
+
+    def dirty_fields(self) -> List[str]:
+        """Columns changed since the instance was loaded or last saved"""
+        return sorted(self._dirty or ())
+
     @classmethod
     def set_database(cls, db_connections: List[BaseDC]):
         if not db_connections:
@@ -46,6 +251,226 @@ class BaseModel:
 
         cls._db = db_connections[0]
         cls._shadows = db_connections[1:]
+        if cls._record_cache is not None:
+            cls._record_cache.clear()
+        if cls._result_cache is not None:
+            cls._result_cache.clear()
+
+    @classmethod
+    def set_shadow_fanout(
+        cls,
+        parallel: bool = True,
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """Write to the shadows concurrently (after the primary), each within `timeout` seconds
+
+        The writes run on a thread pool of `max_workers` threads (32 by
+        default), shared by the models asking for the same size. The timeout
+        starts once a write got its shadow. A write that timed out is reported
+        as failed but keeps running and may still apply; until it finished,
+        later writes to that shadow fail (inside a transaction the caller waits
+        for it instead).
+        """
+        cls._fanout = ShadowFanout(parallel, timeout, max_workers)
+
+    @classmethod
+    def set_replication(
+        cls,
+        mode: str = "sync",
+        journal_dir: str = "sa_orm_journal",
+        batch_size: int = 500,
+        max_lag: Optional[int] = None,
+        backpressure_timeout: Optional[float] = 30.0,
+        fsync: bool = True,
+    ):
+        """Choose how shadows are written
+
+        "sync" writes them inline (see set_shadow_fanout). "async" appends the
+        shadow statements to a durable journal in `journal_dir` and returns once
+        the primary committed; background workers apply the journal per shadow
+        in batched transactions. With `max_lag` set, writes block (up to
+        `backpressure_timeout` seconds) while a shadow is that many writes behind.
+        """
+        match mode:
+            case "sync":
+                cls._replicator = None
+            case "async":
+                from .base.journal import get_replicator
+
+                cls._replicator = get_replicator(
+                    journal_dir,
+                    OperationsFactory.get_operations,
+                    batch_size=batch_size,
+                    max_lag=max_lag,
+                    backpressure_timeout=backpressure_timeout,
+                    fsync=fsync,
+                )
+            case _:
+                raise ValueError(f"Unknown replication mode: {mode}")
+
+    @classmethod
+    def set_write_refresh(cls, refresh: bool = True):
+        """Whether create()/update() read the written row back on MySQL
+
+        With `refresh=False` instances are built from the values sent and the
+        generated key, saving a SELECT per write. Server-side defaults and
+        triggers are then not reflected (columns not sent are None), and such
+        rows skip the record cache.
+        PostgreSQL (and SQLite 3.35+) get the row from RETURNING either way.
+        """
+        cls._refresh = refresh
+
+    @classmethod
+    def set_read_routing(
+        cls,
+        strategy: str = "primary",
+        weights: Optional[Dict[Any, float]] = None,
+        include_primary: bool = False,
+        read_your_writes: float = 5.0,
+        max_lag: Optional[int] = None,
+    ) -> ReadRouter:
+        """Spread find_by_id()/find_all() over the shadows
+
+        `strategy` is "primary", "round_robin", "least_latency" or "weighted"
+        (see ReadRouter). Shadows that missed a mirrored write of the table
+        are skipped until verify_shadows() repaired them, and inside `sa_orm.session.session()` reads stay on the
+        primary for `read_your_writes` seconds after the session wrote.
+        """
+        cls._read_router = ReadRouter(
+            strategy,
+            weights=weights,
+            include_primary=include_primary,
+            read_your_writes=read_your_writes,
+            max_lag=max_lag,
+        )
+        return cls._read_router
+
+    @classmethod
+    def read_routing_stats(cls) -> Optional[Dict[str, Any]]:
+        """Reads and moving average latency per database, shadows currently skipped"""
+        if cls._read_router is None:
+            return None
+        stats = cls._read_router.stats()
+        stats["skipped"] = [
+            f"{db}" for db in cls._shadows if not cls._readable(db, cls._read_router)
+        ]
+        return stats
+
+    @classmethod
+    def reset_shadow_health(cls, shadow_db: Optional[BaseDC] = None):
+        """Make shadows that missed writes readable again, once they were fixed by hand
+
+        verify_shadows() and add_shadow() do this themselves for the shadows
+        they leave matching the primary.
+        """
+        shadow_health.reset(shadow_db, cls._table_name)
+
+    @classmethod
+    def replication_status(cls) -> Dict[str, Dict[str, Any]]:
+        """Per-shadow journal position, lag (writes and seconds) and last error"""
+        if cls._replicator is None:
+            return {}
+        for shadow_db in cls._shadows:
+            cls._replicator.replicator(shadow_db)
+        return cls._replicator.status()
+
+    @classmethod
+    def flush_replication(cls, timeout: Optional[float] = None) -> bool:
+        """Wait until the shadows applied every journaled write"""
+        if cls._replicator is None:
+            return True
+        return cls._replicator.flush(timeout)
+
+    @classmethod
+    def _wait_for_shadows(cls):
+        """Backpressure: block before a write while a shadow lags too far behind"""
+        if cls._replicator is not None and cls._shadows:
+            cls._replicator.wait_for_capacity(cls._shadows)
+
+    @classmethod
+    def _replicate(cls, statement_func) -> List[Dict[str, Exception]]:
+        """Send the statements built by `statement_func(shadow_db)` to every shadow
+
+        In async mode they are journaled and applied in the background,
+        otherwise they run inline through the fan-out. Returns the failures.
+        """
+        shadows = cls._capture(statement_func)
+        if cls._replicator is not None:
+            txn = current_transaction()
+            for shadow_db in shadows:
+                statements = statement_func(shadow_db)
+                if txn is None:
+                    cls._replicator.submit(shadow_db, statements)
+                else:
+                    # Journaled only once the primary committed the write
+                    txn.after_commit(
+                        partial(cls._replicator.submit, shadow_db, statements)
+                    )
+            return []
+
+        def replicate_operation(shadow_db: BaseDC):
+            ops = OperationsFactory.get_operations(shadow_db)
+            return [
+                ops.execute_query(shadow_db, query, params)
+                for query, params in statement_func(shadow_db)
+            ]
+
+        _, failed_shadows = cls._fanout.run(replicate_operation, shadows)
+        shadow_health.record_writes(shadows, cls._table_name, failed_shadows)
+        return failed_shadows
+
+    @classmethod
+    def _capture(cls, statement_func) -> List[BaseDC]:
+        """Journal a write for the shadows still being added, returns the shadows to write now
+
+        Decided under the backfill locks, so a write is either captured or
+        sent to a shadow attached meanwhile, never both. Inside a transaction
+        the capture waits for the commit.
+        """
+        backfills = [b for b in cls._backfills.values() if not b.attached]
+        if not backfills:
+            return cls._shadows
+
+        txn = current_transaction()
+        with ExitStack() as stack:
+            for backfill in backfills:
+                stack.enter_context(backfill.lock)
+            for backfill in backfills:
+                if backfill.attached:
+                    continue
+                statements = statement_func(backfill.shadow_db)
+                if txn is None:
+                    backfill.capture(statements)
+                else:
+                    txn.after_commit(
+                        partial(
+                            backfill.capture_late,
+                            statements,
+                            partial(cls._apply, backfill.shadow_db),
+                        )
+                    )
+            return list(cls._shadows)
+
+    @classmethod
+    def _apply(cls, shadow_db: BaseDC, statements: List[Statement]):
+        OperationsFactory.get_operations(shadow_db).execute_batch(shadow_db, statements)
+
+    @classmethod
+    def _raise_shadow_failures(cls, shadow_failed: List[Dict[str, Exception]]):
+        for failure in shadow_failed:
+            for shadow_db, e in failure.items():
+                log(f"Failed to mirror operation to {shadow_db}: {e}", "ERROR")
+        if len(shadow_failed) > 0:
+            raise Exception(f"Update failed on the following shadows: {shadow_failed}")
+
+    @classmethod
+    def _fan_out(cls, operation_func) -> List[Any]:
+        """Run a write on every shadow, raising if any of them failed"""
+        results, shadow_failed = cls._fanout.run(operation_func, cls._shadows)
+        shadow_health.record_writes(cls._shadows, cls._table_name, shadow_failed)
+        cls._raise_shadow_failures(shadow_failed)
+        return results
 
     @classmethod
     def disconnect(cls):
@@ -55,17 +480,656 @@ class BaseModel:
         for d in cls._shadows:
             d.disconnect()
 
-    # @classmethod
-    # def add_shadow(cls, db_connection: BaseDC):
-    #     if not db_connection:
-    #         raise ValueError("At least one database connection required")
-    #
-    #     primary_ops = OperationsFactory.get_operations(db_connection)
-    #     query = primary_ops.create_table_sql(
-    #         cls._table_name, columns, cls._primary_key, True
-    #     )
-    #     primary_ops.execute_query(cls._db, query)
-    #     cls._shadows.append(db_connection)
+    @classmethod
+    def pool_stats(cls) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Connection pool usage of the primary and each shadow (None when not pooled)"""
+        if cls._db is None:
+            raise ValueError("No active database connection found")
+        return {f"{db}": db.pool_stats() for db in [cls._db, *cls._shadows]}
+
+    @classmethod
+    def statement_stats(cls) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Prepared statement cache counters per database (None when not enabled)"""
+        if cls._db is None:
+            raise ValueError("No active database connection found")
+        return {f"{db}": db.statement_stats() for db in [cls._db, *cls._shadows]}
+
+    @classmethod
+    def enable_record_cache(
+        cls, max_entries: int = 10000, ttl: Optional[float] = 300.0
+    ) -> RecordCache:
+        """Cache this model's rows by primary key, find_by_id() then skips the primary on a hit
+
+        Rows come from find_by_id/find_all/create, update() refreshes them and
+        delete/delete_by_id/drop_table drop them. Writes made outside the ORM
+        show up once `ttl` seconds passed. Inside `sa_orm.session.session()`
+        the model also gets an identity map.
+        """
+        cls._record_cache = RecordCache(max_entries=max_entries, ttl=ttl)
+        return cls._record_cache
+
+    @classmethod
+    def disable_record_cache(cls):
+        cls._record_cache = None
+
+    @classmethod
+    def record_cache_stats(cls) -> Optional[Dict[str, Any]]:
+        """Hits, misses, evictions, expirations and size of the record cache (None when off)"""
+        return cls._record_cache.stats() if cls._record_cache is not None else None
+
+    @classmethod
+    def enable_result_cache(
+        cls,
+        ttl: Optional[float] = 60.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        store: Optional[CacheStore] = None,
+    ) -> ResultCache:
+        """Cache find_all() results by (model, SQL, params)
+
+        Every write the ORM makes to the table (create, bulk_create, update,
+        delete, delete_by_id, drop_table) bumps its generation, which retires
+        all earlier results. The in-memory store evicts least recently used
+        results beyond `max_bytes`; pass `store` to use another backend.
+        """
+        cls._result_cache = ResultCache(
+            store if store is not None else MemoryStore(max_bytes), ttl
+        )
+        return cls._result_cache
+
+    @classmethod
+    def disable_result_cache(cls):
+        cls._result_cache = None
+
+    @classmethod
+    def result_cache_stats(cls) -> Optional[Dict[str, Any]]:
+        """Hits, misses, single-flight waits and store usage of the result cache (None when off)"""
+        return cls._result_cache.stats() if cls._result_cache is not None else None
+
+    @classmethod
+    @contextmanager
+    def transaction(cls) -> Iterator[Transaction]:
+        """Run the statements of the block in one transaction per database, committed once
+
+        Primary and shadows each get a single transaction: the per-statement
+        commits of the operations are deferred to the end of the block, where
+        the primaries commit first and then the shadows. An exception rolls
+        back every database; in async replication mode the shadow writes are
+        only journaled once the primary committed. Works across models, and
+        `stats()` of the yielded transaction reports the commits saved.
+
+        Without a pool the shared connection is used, so statements of other
+        threads would join the transaction; enable a pool when threads write
+        concurrently. DDL commits implicitly on MySQL.
+        """
+        with transaction() as txn:
+            yield txn
+
+    @classmethod
+    def _written(cls):
+        """Retire every cached result of the table after a write"""
+        table_generations.bump(cls._db, cls._table_name)
+        session = current_session()
+        if session is not None:
+            session.mark_write()
+        txn = current_transaction()
+        if txn is not None:
+            txn.written_to(cls._db)
+            txn.on_rollback((cls._db, cls._table_name), cls._rolled_back)
+
+    @classmethod
+    def _rolled_back(cls):
+        """Cached rows and results may hold writes that never happened"""
+        cls._forget()
+        table_generations.bump(cls._db, cls._table_name)
+
+    @classmethod
+    def _cached(cls, record_id: Any) -> Optional["BaseModel"]:
+        model = cls._model or cls
+        session = current_session()
+        if session is not None:
+            instance = session.get(model, record_id)
+            if instance is not None:
+                return instance
+
+        data = cls._record_cache.get(cls._table_name, record_id)
+        if data is None:
+            return None
+        instance = cls._loaded(data)
+        return (
+            session.add(model, record_id, instance) if session is not None else instance
+        )
+
+    @classmethod
+    def _remember(cls, data: Dict[str, Any]) -> "BaseModel":
+        """Instance of a complete row just read or written, kept in the record cache"""
+        instance = cls._loaded(data)
+        pk_value = data.get(cls._primary_key)
+        if cls._record_cache is None or pk_value is None:
+            return instance
+
+        cls._record_cache.set(cls._table_name, pk_value, data)
+        session = current_session()
+        return (
+            session.add(cls._model or cls, pk_value, instance)
+            if session is not None
+            else instance
+        )
+
+    @classmethod
+    def _forget(cls, record_id: Any = None):
+        """Drop a record, or every record of the table, from the record cache"""
+        if cls._record_cache is None:
+            return
+
+        model = cls._model or cls
+        session = current_session()
+        if record_id is None:
+            cls._record_cache.invalidate_table(cls._table_name)
+            if session is not None:
+                session.discard_model(model)
+        else:
+            cls._record_cache.invalidate(cls._table_name, record_id)
+            if session is not None:
+                session.discard(model, record_id)
+
+    @classmethod
+    def add_shadow(
+        cls,
+        db_connection: BaseDC,
+        columns: Optional[Dict[str, str]] = None,
+        chunk_size: int = 5000,
+        workers: int = 4,
+        checkpoint_dir: Optional[str] = None,
+        max_rows_per_second: Optional[float] = None,
+        max_read_seconds: Optional[float] = None,
+        catch_up_timeout: Optional[float] = 60.0,
+        fsync: bool = True,
+    ) -> Dict[str, Any]:
+        """Attach a new shadow to the live table: create it, copy the rows, then mirror writes
+
+        Rows are copied in primary-key chunks of `chunk_size`, by `workers`
+        threads when both the primary and the shadow are pooled. Writes made
+        meanwhile are captured in a journal and replayed once the copy is
+        done; the shadow is attached when the replay caught up, without
+        blocking writers for longer than the last few replayed writes.
+
+        `columns` defaults to the column types of the primary, pass them when
+        the shadow's dialect differs or constraints matter. With
+        `checkpoint_dir` a failed or interrupted backfill resumes from the
+        last copied chunk (only safe if the table was not written while no
+        backfill was running). See backfill.Throttle for the throttling.
+        """
+        if not cls._table_name:
+            log_op(
+                action="add_shadow",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": "Table name not specified"},
+            )
+            raise ValueError("Table name not specified")
+        if not cls._db:
+            raise ValueError("Database connection not set. Use set_database() first.")
+        if not db_connection:
+            raise ValueError("At least one database connection required")
+        if db_connection is cls._db or db_connection in cls._shadows:
+            raise ValueError(f"{db_connection} is already a database of the model")
+        if db_connection in cls._backfills:
+            raise ValueError(f"{db_connection} is already being added")
+        if chunk_size < 1 or workers < 1:
+            raise ValueError("chunk_size and workers must be positive integers")
+
+        # Only needed while adding a shadow, slow to import
+        import shutil
+        import tempfile
+        from .base.backfill import ShadowBackfill, Throttle
+        from .base.journal import ShadowReplicator
+
+        started = time.monotonic()
+        since = shadow_health.position()
+        primary_ops = OperationsFactory.get_operations(cls._db)
+        shadow_ops = OperationsFactory.get_operations(db_connection)
+        if columns is None:
+            schema = primary_ops.get_schema(cls._db, cls._table_name, refresh=True)
+            columns = {
+                column: schema.types[column]
+                for column in schema.columns
+                if column != cls._primary_key
+            }
+
+        directory = checkpoint_dir or tempfile.mkdtemp(prefix="sa_orm-backfill-")
+        backfill = ShadowBackfill(
+            db_connection,
+            directory,
+            owner=f"{db_connection}:{cls._table_name}",
+            fsync=fsync,
+        )
+        replicator = None
+        try:
+            shadow_ops.execute_query(
+                db_connection,
+                shadow_ops.create_table_sql(
+                    cls._table_name, columns, cls._primary_key, True
+                ),
+            )
+            shadow_ops.invalidate_schema(db_connection, cls._table_name)
+
+            # Capture first: every write committed after this point is replayed
+            cls._backfills = {**cls._backfills, db_connection: backfill}
+            throttle = Throttle(max_rows_per_second, max_read_seconds)
+            parallel = (
+                workers > 1
+                and cls._db.pool is not None
+                and db_connection.pool is not None
+            )
+            copied = cls._copy_rows(
+                backfill, chunk_size, workers if parallel else 1, throttle
+            )
+
+            replicator = ShadowReplicator(
+                db_connection, backfill.journal, OperationsFactory.get_operations
+            )
+            # Catch up without blocking writers, then hold them for the rest
+            replicator.wait_until_caught_up(catch_up_timeout)
+            with backfill.lock:
+                if not replicator.wait_until_caught_up(catch_up_timeout):
+                    raise TimeoutError(
+                        f"Replay of the writes captured for {db_connection} did not "
+                        f"catch up within {catch_up_timeout}s: {replicator.last_error}"
+                    )
+                cls._shadows = cls._shadows + [db_connection]
+                backfill.attached = True
+            # Whatever the shadow missed before is overwritten by the copy
+            shadow_health.reset(db_connection, cls._table_name, before=since)
+        except Exception as e:
+            log_op(
+                action="add_shadow",
+                table=f"{db_connection}:{cls._table_name}",
+                success=False,
+                metadata={"payload": f"Backfill failed: {e}"},
+            )
+            log(f"Failed to add shadow {db_connection}: {e}", "ERROR")
+            raise
+        finally:
+            cls._backfills = {
+                db: b for db, b in cls._backfills.items() if db is not db_connection
+            }
+            if replicator is not None:
+                replicator.stop()
+            else:
+                backfill.journal.close()
+            if backfill.attached:
+                if checkpoint_dir is None:
+                    shutil.rmtree(directory, ignore_errors=True)
+                else:
+                    shutil.rmtree(backfill.journal.directory, ignore_errors=True)
+                    os.remove(backfill.checkpoint.path)
+
+        stats = {
+            "rows": copied,
+            "captured": backfill.captured,
+            "paused": throttle.paused,
+            "seconds": time.monotonic() - started,
+        }
+        log(f"Shadow {db_connection} added to {cls._table_name}: {stats}", "INFO")
+        log_op(
+            action="add_shadow",
+            table=f"{db_connection}:{cls._table_name}",
+            metadata={"payload": f"Shadow attached: {stats}"},
+        )
+        return stats
+
+    @classmethod
+    def _copy_rows(
+        cls,
+        backfill: "ShadowBackfill",
+        chunk_size: int,
+        workers: int,
+        throttle: "Throttle",
+    ) -> int:
+        """Copy the table to the backfilled shadow chunk by chunk, returns the rows copied"""
+        shadow_db = backfill.shadow_db
+        checkpoint = backfill.checkpoint
+        if checkpoint.finished:
+            return 0
+
+        primary_ops = OperationsFactory.get_operations(cls._db)
+        shadow_ops = OperationsFactory.get_operations(shadow_db)
+
+        def copy_chunk(low: Any, high: Any) -> int:
+            fragment, params = cls._key_range(low, high)
+            where = (fragment,) if fragment else ()
+            read_started = time.monotonic()
+            result = primary_ops.execute_query(
+                cls._db,
+                primary_ops.select_sql(cls._table_name, where=where),
+                params,
+                fetch=True,
+            )
+            read_seconds = time.monotonic() - read_started
+
+            # Replacing the whole range keeps a resumed chunk idempotent
+            shadow_ops.execute_query(
+                shadow_db, shadow_ops.delete_where_sql(cls._table_name, where), params
+            )
+            rows = [tuple(row) for row in result["result"]]
+            if rows:
+                shadow_ops.bulk_copy(
+                    shadow_db, cls._table_name, result["columns"], rows
+                )
+            checkpoint.done(low)
+            throttle.wait(len(rows), read_seconds)
+            return len(rows)
+
+        def issued() -> Iterator[Tuple[Any, Any]]:
+            for low, high in cls._key_bounds((), (), chunk_size, start=checkpoint.low):
+                checkpoint.issue(low, high)
+                yield low, high
+
+        return sum(cls._map_chunks(copy_chunk, issued(), workers, "sa_orm-backfill"))
+
+    @classmethod
+    def _map_chunks(
+        cls, func, bounds: Iterator[Tuple[Any, Any]], workers: int, name: str
+    ) -> Iterator[Any]:
+        """Run `func(low, high)` for every key range, yields the results as they finish
+
+        With more than one worker the ranges run on a thread pool, at most
+        twice `workers` of them in flight; the first failure cancels the rest.
+        """
+        if workers == 1:
+            for low, high in bounds:
+                yield func(low, high)
+            return
+
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        pending = set()
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=name
+        ) as executor:
+            try:
+                for low, high in bounds:
+                    pending.add(executor.submit(func, low, high))
+                    if len(pending) >= workers * 2:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                done, _ = wait(pending)
+                for future in done:
+                    yield future.result()
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+
+    @classmethod
+    def verify_shadows(
+        cls,
+        chunk_size: int = 100000,
+        leaf_size: int = 1000,
+        workers: int = 4,
+        repair: bool = False,
+        max_keys: int = 1000,
+    ) -> Dict[str, Any]:
+        """Check that every shadow holds the rows of the primary, optionally repairing them
+
+        The table is split into primary-key ranges of `chunk_size` rows whose
+        row count and sum of row MD5s are computed server side on the primary
+        and every shadow, by `workers` threads when all of them are pooled.
+        A range that differs is split into smaller ones until they hold at
+        most `leaf_size` rows, then the key and row hash of each are compared. Only
+        the rows `repair` copies from the primary are read into Python.
+
+        Keys still differing on a second look are reported per shadow (the
+        first `max_keys`) and, with `repair`, rewritten on the shadow from the
+        primary. Writes made while verifying can be reported or raced by a
+        repair; in async replication mode call flush_replication() first.
+        Shadows of another database type are skipped, their hashes differ.
+        """
+        if not cls._table_name:
+            log_op(
+                action="verify_shadows",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": "Table name not specified"},
+            )
+            raise ValueError("Table name not specified")
+        if not cls._db:
+            raise ValueError("Database connection not set. Use set_database() first.")
+        if cls._backfills:
+            raise ValueError(
+                "Shadows are being added, verify once add_shadow() returned"
+            )
+        if chunk_size < 1 or leaf_size < 1 or workers < 1:
+            raise ValueError(
+                "chunk_size, leaf_size and workers must be positive integers"
+            )
+
+        started = time.monotonic()
+        # Shadows found matching are readable again, unless they missed a write since
+        since = shadow_health.position()
+        shadows, skipped = [], []
+        for shadow_db in cls._shadows:
+            if shadow_db.db_type == cls._db.db_type:
+                shadows.append(shadow_db)
+            else:
+                skipped.append(f"{shadow_db}")
+                log(
+                    f"Skipping {shadow_db} in verify_shadows(), row hashes of "
+                    f"{shadow_db.db_type} and {cls._db.db_type} are not comparable",
+                    "WARNING",
+                )
+
+        primary_ops = OperationsFactory.get_operations(cls._db)
+        # The key is hashed too, moved rows change the sum
+        columns = tuple(
+            primary_ops.get_schema(cls._db, cls._table_name, refresh=True).columns
+        )
+
+        def check_chunk(low: Any, high: Any) -> Tuple[int, Dict[BaseDC, List[Any]]]:
+            expected = cls._checksum(cls._db, columns, low, high)
+            diverged = {}
+            for shadow_db in shadows:
+                found = cls._checksum(shadow_db, columns, low, high)
+                if found != expected:
+                    diverged[shadow_db] = cls._diverged_keys(
+                        shadow_db, columns, low, high, expected, found, leaf_size
+                    )
+            return expected[0], diverged
+
+        report = {
+            f"{shadow_db}": {"chunks": 0, "diverged": 0, "keys": [], "repaired": 0}
+            for shadow_db in shadows
+        }
+        stats = {"chunks": 0, "rows": 0, "shadows": report, "skipped": skipped}
+        candidates: Dict[BaseDC, List[Any]] = {shadow_db: [] for shadow_db in shadows}
+        parallel = workers > 1 and all(
+            db.pool is not None for db in [cls._db] + shadows
+        )
+        try:
+            bounds = cls._key_bounds((), (), chunk_size)
+            for rows, diverged in cls._map_chunks(
+                check_chunk, bounds, workers if parallel else 1, "sa_orm-verify"
+            ):
+                stats["chunks"] += 1
+                stats["rows"] += rows
+                for shadow_db, keys in diverged.items():
+                    report[f"{shadow_db}"]["chunks"] += 1
+                    candidates[shadow_db].extend(keys)
+
+            for shadow_db, keys in candidates.items():
+                # Rows a write changed meanwhile have caught up by now
+                keys = sorted(cls._still_diverged(shadow_db, columns, keys, leaf_size))
+                if keys:
+                    shadow_report = report[f"{shadow_db}"]
+                    shadow_report["diverged"] = len(keys)
+                    shadow_report["keys"] = keys[:max_keys]
+                    message = (
+                        f"Shadow {shadow_db} differs from the primary on {len(keys)} "
+                        f"rows of {cls._table_name}"
+                    )
+                    log(message, "WARNING")
+                    if repair:
+                        shadow_report["repaired"] = cls._repair_keys(
+                            shadow_db, keys, leaf_size
+                        )
+                    if shadow_report["repaired"] < len(keys):
+                        shadow_health.record(
+                            shadow_db, cls._table_name, Exception(message)
+                        )
+                        continue
+                shadow_health.reset(shadow_db, cls._table_name, before=since)
+        except Exception as e:
+            log_op(
+                action="verify_shadows",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": f"Verification failed: {e}"},
+            )
+            raise
+
+        stats["seconds"] = time.monotonic() - started
+        log_op(
+            action="verify_shadows",
+            table=f"{cls._db}:{cls._table_name}",
+            metadata={
+                "payload": {
+                    f"{shadow_db}": {
+                        "diverged": shadow_report["diverged"],
+                        "repaired": shadow_report["repaired"],
+                    }
+                    for shadow_db, shadow_report in report.items()
+                }
+            },
+        )
+        return stats
+
+    @classmethod
+    def _checksum(
+        cls, db: BaseDC, columns: Tuple[str, ...], low: Any, high: Any
+    ) -> Tuple[int, int]:
+        """Row count and sum of row hashes of the keys in `[low, high)` on `db`"""
+        ops = OperationsFactory.get_operations(db)
+        fragment, params = cls._key_range(low, high)
+        query = ops.checksum_sql(
+            cls._table_name, columns, (fragment,) if fragment else ()
+        )
+        count, hash_sum = ops.execute_query(db, query, params, fetch=True)["result"][0]
+        return int(count), int(hash_sum or 0)
+
+    @classmethod
+    def _diverged_keys(
+        cls,
+        shadow_db: BaseDC,
+        columns: Tuple[str, ...],
+        low: Any,
+        high: Any,
+        expected: Tuple[int, int],
+        found: Tuple[int, int],
+        leaf_size: int,
+    ) -> List[Any]:
+        """Keys in `[low, high)` whose rows differ, splitting the range down to `leaf_size` rows"""
+        if expected == found:
+            return []
+        count = max(expected[0], found[0])
+        if count <= leaf_size:
+            fragment, params = cls._key_range(low, high)
+            where = (fragment,) if fragment else ()
+            primary = cls._row_hashes(cls._db, columns, where, params)
+            mirrored = cls._row_hashes(shadow_db, columns, where, params)
+            return [
+                key
+                for key in sorted(primary.keys() | mirrored.keys())
+                if primary.get(key) != mirrored.get(key)
+            ]
+
+        # Split into up to 16 ranges on the keys of the side holding more rows,
+        # fewer levels mean fewer scans of the range when the drift is spread
+        db = cls._db if expected[0] >= found[0] else shadow_db
+        parts = min(16, -(-count // leaf_size))
+        fragment, params = cls._key_range(low, high)
+        bounds = cls._key_bounds(
+            (fragment,) if fragment else (), params, -(-count // parts), low, db
+        )
+
+        keys = []
+        for part_low, part_high in bounds:
+            part_high = high if part_high is None else part_high
+            keys += cls._diverged_keys(
+                shadow_db,
+                columns,
+                part_low,
+                part_high,
+                cls._checksum(cls._db, columns, part_low, part_high),
+                cls._checksum(shadow_db, columns, part_low, part_high),
+                leaf_size,
+            )
+        return keys
+
+    @classmethod
+    def _row_hashes(
+        cls, db: BaseDC, columns: Tuple[str, ...], where: Tuple[str, ...], params: tuple
+    ) -> Dict[Any, str]:
+        ops = OperationsFactory.get_operations(db)
+        query = ops.row_hashes_sql(cls._table_name, cls._primary_key, columns, where)
+        result = ops.execute_query(db, query, params, fetch=True)
+        return {key: row_hash for key, row_hash in result["result"]}
+
+    @classmethod
+    def _still_diverged(
+        cls,
+        shadow_db: BaseDC,
+        columns: Tuple[str, ...],
+        keys: List[Any],
+        batch_size: int,
+    ) -> List[Any]:
+        """The `keys` whose rows still differ when hashed again"""
+        ops = OperationsFactory.get_operations(cls._db)
+        diverged = []
+        for start in range(0, len(keys), batch_size):
+            batch = keys[start : start + batch_size]
+            where = (ops.condition_sql(cls._primary_key, "in", len(batch)),)
+            primary = cls._row_hashes(cls._db, columns, where, tuple(batch))
+            mirrored = cls._row_hashes(shadow_db, columns, where, tuple(batch))
+            diverged += [key for key in batch if primary.get(key) != mirrored.get(key)]
+        return diverged
+
+    @classmethod
+    def _repair_keys(cls, shadow_db: BaseDC, keys: List[Any], batch_size: int) -> int:
+        """Rewrite the rows of `keys` on a shadow from the primary, returns the keys repaired"""
+        primary_ops = OperationsFactory.get_operations(cls._db)
+        shadow_ops = OperationsFactory.get_operations(shadow_db)
+        for start in range(0, len(keys), batch_size):
+            batch = tuple(keys[start : start + batch_size])
+            condition = (cls._primary_key, "in", len(batch))
+            result = primary_ops.execute_query(
+                cls._db,
+                primary_ops.select_sql(cls._table_name, conditions=(condition,)),
+                batch,
+                fetch=True,
+            )
+            rows = [tuple(row) for row in result["result"]]
+
+            # Rows missing on the primary are only deleted, all in one transaction
+            statements = [
+                (
+                    shadow_ops.delete_where_sql(
+                        cls._table_name, (shadow_ops.condition_sql(*condition),)
+                    ),
+                    batch,
+                )
+            ]
+            statements += [
+                (
+                    shadow_ops.bulk_insert_sql(
+                        cls._table_name, result["columns"], len(rows_batch)
+                    ),
+                    tuple(value for row in rows_batch for value in row),
+                )
+                for rows_batch in shadow_ops.batch_rows(rows, len(result["columns"]))
+            ]
+            shadow_ops.execute_batch(shadow_db, statements)
+        log(f"Repaired {len(keys)} rows of {cls._table_name} on {shadow_db}", "INFO")
+        return len(keys)
 
     @classmethod
     def create_table(cls, columns: Dict[str, str], if_not_exists: bool = True):
@@ -81,19 +1145,25 @@ class BaseModel:
         if not cls._db:
             raise ValueError("Database connection not set. Use set_database() first.")
 
+        cls._wait_for_shadows()
         primary_ops = OperationsFactory.get_operations(cls._db)
         query = primary_ops.create_table_sql(
             cls._table_name, columns, cls._primary_key, if_not_exists
         )
         primary_ops.execute_query(cls._db, query)
+        primary_ops.invalidate_schema(cls._db, cls._table_name)
+        cls._written()
+
+        def create_statement(shadow_db: BaseDC) -> List[Statement]:
+            shadow_ops = OperationsFactory.get_operations(shadow_db)
+            shadow_ops.invalidate_schema(shadow_db, cls._table_name)
+            shadow_query = shadow_ops.create_table_sql(
+                cls._table_name, columns, cls._primary_key, if_not_exists
+            )
+            return [(shadow_query, ())]
 
-        if cls._shadows:
-            for shadow_db in cls._shadows:
-                shadow_ops = OperationsFactory.get_operations(shadow_db)
-                shadow_query = shadow_ops.create_table_sql(
-                    cls._table_name, columns, cls._primary_key, if_not_exists
-                )
-                shadow_ops.execute_query(shadow_db, shadow_query)
+        if cls._shadows or cls._backfills:
+            cls._raise_shadow_failures(cls._replicate(create_statement))
 
         log(f"Table '{cls._table_name}' created successfully on all databases", "INFO")
         log_op(
@@ -129,42 +1199,66 @@ class BaseModel:
         query = f"DROP TABLE {if_exists_clause} {cls._table_name}"
 
         # Drop from primary database
+        cls._wait_for_shadows()
         primary_ops = OperationsFactory.get_operations(cls._db)
         primary_ops.execute_query(cls._db, query)
+        primary_ops.invalidate_schema(cls._db, cls._table_name)
+        cls._forget()
+        cls._written()
+
+        def drop_statement(shadow_db: BaseDC) -> List[Statement]:
+            OperationsFactory.get_operations(shadow_db).invalidate_schema(
+                shadow_db, cls._table_name
+            )
+            return [(query, ())]
 
         # Mirror to shadow databases
-        if cls._shadows:
-            for shadow_db in cls._shadows:
-                shadow_ops = OperationsFactory.get_operations(shadow_db)
-                shadow_ops.execute_query(shadow_db, query)
+        if cls._shadows or cls._backfills:
+            cls._raise_shadow_failures(cls._replicate(drop_statement))
 
         log(
             f"Table '{cls._table_name}' dropped successfully from all databases", "INFO"
         )
         log_op(
-            action="update",
-            table=f"{self._db}:{self._table_name}",
-            record_id=getattr(self, self._primary_key, None),
-            success=True,
-            metadata={"payload": f"Record updated: {instance_data}"},
+            action="drop_table",
+            table=f"{cls._db}:{cls._table_name}",
+            metadata={"payload": f"table {cls._table_name} dropped"},
         )
 
     @classmethod
-    def _mirror_operation(cls, operation_func, *args, **kwargs):
-        """Execute operation on primary db and mirror to shadows"""
+    def refresh_schema(cls) -> TableSchema:
+        """Re-read the table schema on all databases, returns the primary's"""
+        if not cls._table_name:
+            raise ValueError("Table name not specified")
+
+        if not cls._db:
+            raise ValueError("Database connection not set. Use set_database() first.")
+
+        for shadow_db in cls._shadows:
+            OperationsFactory.get_operations(shadow_db).refresh_schema(
+                shadow_db, cls._table_name
+            )
+        return OperationsFactory.get_operations(cls._db).refresh_schema(
+            cls._db, cls._table_name
+        )
+
+    @classmethod
+    def _mirror_operation(cls, operation_func, *args, shadow_statement=None, **kwargs):
+        """Execute operation on primary db and mirror to shadows
+
+        `shadow_statement(db)` returns the shadow write as `[(query, params)]`
+        so it can be journaled in async replication mode; without it the
+        operation itself runs on every shadow inline.
+        """
+        cls._wait_for_shadows()
         primary_result = operation_func(cls._db, *args, **kwargs)
 
-        if cls._shadows:
-            shadow_failed = []
-            for shadow_db in cls._shadows:
-                try:
-                    operation_func(shadow_db, *args, **kwargs)
-                except Exception as e:
-                    shadow_failed.append({f"{shadow_db}": e})
-                    log(f"Failed to mirror operation to {shadow_db}: {e}", "ERROR")
-            if len(shadow_failed) > 0:
-                raise Exception(
-                    f"Update failed on the following shadows: {shadow_failed}"
+        if cls._shadows or cls._backfills:
+            if shadow_statement is not None:
+                cls._raise_shadow_failures(cls._replicate(shadow_statement))
+            else:
+                cls._fan_out(
+                    lambda shadow_db: operation_func(shadow_db, *args, **kwargs)
                 )
 
         return primary_result
@@ -207,26 +1301,34 @@ class BaseModel:
             )
             raise ValueError("No data provided for creation")
 
+        cls._wait_for_shadows()
         ops = OperationsFactory.get_operations(cls._db)
 
         query = ops.insert_sql(cls._table_name, columns)
         result = ops.execute_query(cls._db, query, tuple(values), fetch=True)
-        instance_data = ops.handle_insert_result(
-            cls._db, cls._table_name, cls._primary_key, result, tuple(values)
-        )
+        refresh = cls._refresh or ops.returning
+        if refresh:
+            instance_data = ops.handle_insert_result(
+                cls._db, cls._table_name, cls._primary_key, result, tuple(values)
+            )
+        else:
+            instance_data = cls._complete(
+                {**data, cls._primary_key: result["lastrowid"]}
+            )
+        cls._written()
 
         columns.append(cls._primary_key)
         values.append(result["lastrowid"])
 
-        failed_shadows = []
-        for shadow_db in cls._shadows:
-            try:
-                ops = OperationsFactory.get_operations(shadow_db)
-                ops.execute_query(
-                    shadow_db, ops.insert_sql(cls._table_name, columns), tuple(values)
-                )
-            except Exception as e:
-                failed_shadows.append({f"{shadow_db}": e})
+        def insert_statement(shadow_db: BaseDC) -> List[Statement]:
+            ops = OperationsFactory.get_operations(shadow_db)
+            if shadow_db in cls._backfills:
+                # The copy may already have brought the row over
+                query = ops.upsert_sql(cls._table_name, columns, [cls._primary_key])
+                return [(query, tuple(values))]
+            return [(ops.insert_sql(cls._table_name, columns), tuple(values))]
+
+        failed_shadows = cls._replicate(insert_statement)
 
         if len(failed_shadows) > 0:
             log_op(
@@ -238,11 +1340,350 @@ class BaseModel:
             )
             raise Exception(f"Failed to create shadows: {failed_shadows}")
 
-        return cls(**instance_data)
+        return cls._remember(instance_data) if refresh else cls._loaded(instance_data)
+
+    @classmethod
+    def bulk_create(
+        cls, rows: List[Dict[str, Any]], batch_size: int = 1000, refresh: bool = False
+    ) -> List["BaseModel"]:
+        """Create many records in all databases, one multi-row statement per batch
+
+        Keys missing from some rows are inserted as NULL. Shadows receive each
+        batch with the keys assigned by the primary, like `create()` does.
+        With `refresh` the stored rows are read back with one SELECT per batch
+        on MySQL, to pick up server-side defaults; otherwise columns not given
+        are None on the instances.
+        """
+        if not cls._table_name:
+            log_op(
+                action="bulk_create",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": "Table name not specified"},
+            )
+            raise ValueError("Table name not specified")
+
+        if not cls._db:
+            log_op(
+                action="bulk_create",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={
+                    "payload": "Database connection not set. Use set_database() first."
+                },
+            )
+            raise ValueError("Database connection not set. Use set_database() first.")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        columns = []
+        for row in rows:
+            for k in row:
+                if k != cls._primary_key and k not in columns:
+                    columns.append(k)
+
+        if len(columns) == 0:
+            log_op(
+                action="bulk_create",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": "No data provided for creation"},
+            )
+            raise ValueError("No data provided for creation")
+
+        ops = OperationsFactory.get_operations(cls._db)
+        shadow_columns = columns + [cls._primary_key]
+        instances = []
+
+        def copy_statement(shadow_db: BaseDC) -> List[Statement]:
+            shadow_ops = OperationsFactory.get_operations(shadow_db)
+            # Rows the copy of a shadow being added may already hold are upserted
+            upsert = shadow_db in cls._backfills
+
+            def build(row_count: int) -> str:
+                if upsert:
+                    return shadow_ops.upsert_sql(
+                        cls._table_name, shadow_columns, [cls._primary_key], row_count
+                    )
+                return shadow_ops.bulk_insert_sql(
+                    cls._table_name, shadow_columns, row_count
+                )
+
+            return [
+                (
+                    build(len(batch)),
+                    tuple(value for row in batch for value in row),
+                )
+                for batch in shadow_ops.batch_rows(shadow_rows, len(shadow_columns))
+            ]
+
+        for start in range(0, len(rows), batch_size):
+            cls._wait_for_shadows()
+            values = [
+                tuple(row.get(c) for c in columns)
+                for row in rows[start : start + batch_size]
+            ]
+            records = ops.bulk_insert(
+                cls._db, cls._table_name, cls._primary_key, columns, values
+            )
+            cls._written()
+            shadow_rows = [
+                row + (record[cls._primary_key],)
+                for row, record in zip(values, records)
+            ]
+
+            if cls._replicator is not None:
+                failed_shadows = cls._replicate(copy_statement)
+            else:
+                shadows = cls._capture(copy_statement)
+                _, failed_shadows = cls._fanout.run(
+                    lambda shadow_db: OperationsFactory.get_operations(
+                        shadow_db
+                    ).bulk_copy(
+                        shadow_db, cls._table_name, shadow_columns, shadow_rows
+                    ),
+                    shadows,
+                )
+                shadow_health.record_writes(shadows, cls._table_name, failed_shadows)
+
+            if len(failed_shadows) > 0:
+                log_op(
+                    action="bulk_create",
+                    table=f"{cls._db}:{cls._table_name}",
+                    success=False,
+                    metadata={
+                        "payload": f"Failed to create shadows for rows {start}-{start + len(values) - 1}: {failed_shadows}"
+                    },
+                )
+                raise Exception(f"Failed to create shadows: {failed_shadows}")
+
+            if not ops.returning and not refresh:
+                records = [cls._complete(record) for record in records]
+            elif not ops.returning:
+                stored = {
+                    record[cls._primary_key]: record
+                    for record in ops.fetch_by_keys(
+                        cls._db,
+                        cls._table_name,
+                        [cls._primary_key],
+                        [(record[cls._primary_key],) for record in records],
+                    )
+                }
+                records = [
+                    stored.get(record[cls._primary_key], record) for record in records
+                ]
+
+            instances.extend(cls._loaded(record) for record in records)
+
+        log_op(
+            action="bulk_create",
+            table=f"{cls._db}:{cls._table_name}",
+            metadata={"payload": f"{len(instances)} records created"},
+        )
+        return instances
+
+    @classmethod
+    def upsert(
+        cls, conflict_on: Union[str, Sequence[str], None] = None, **data
+    ) -> "BaseModel":
+        """Insert a record, or update the one with the same `conflict_on` columns, in all databases
+
+        One statement instead of find_by_id() plus INSERT or UPDATE. `conflict_on`
+        defaults to the primary key and must be covered by a unique index.
+        """
+        return cls._upsert("upsert", [data], conflict_on, batch_size=1)[0]
+
+    @classmethod
+    def bulk_upsert(
+        cls,
+        rows: List[Dict[str, Any]],
+        conflict_on: Union[str, Sequence[str], None] = None,
+        batch_size: int = 1000,
+    ) -> List["BaseModel"]:
+        """Insert or update many records in all databases, one statement per batch
+
+        Rows sharing the same `conflict_on` values are merged, the last one wins.
+        Columns missing from a row are written as NULL.
+        """
+        return cls._upsert("bulk_upsert", rows, conflict_on, batch_size)
+
+    @classmethod
+    def _upsert(
+        cls,
+        action: str,
+        rows: List[Dict[str, Any]],
+        conflict_on: Union[str, Sequence[str], None],
+        batch_size: int,
+    ) -> List["BaseModel"]:
+        if not cls._table_name:
+            log_op(
+                action=action,
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": "Table name not specified"},
+            )
+            raise ValueError("Table name not specified")
+
+        if not cls._db:
+            log_op(
+                action=action,
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={
+                    "payload": "Database connection not set. Use set_database() first."
+                },
+            )
+            raise ValueError("Database connection not set. Use set_database() first.")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        if conflict_on is None:
+            conflict_on = [cls._primary_key]
+        elif isinstance(conflict_on, str):
+            conflict_on = [conflict_on]
+        else:
+            conflict_on = list(conflict_on)
+
+        columns = []
+        for row in rows:
+            for k in row:
+                if k not in columns:
+                    columns.append(k)
+
+        if not rows or all(c in conflict_on for c in columns):
+            log_op(
+                action=action,
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": "No data provided for upsert"},
+            )
+            raise ValueError("No data provided for upsert")
+
+        # A statement may not touch the same row twice, the last row of a key wins
+        unique: Dict[tuple, tuple] = {}
+        for row in rows:
+            key = tuple(row.get(c) for c in conflict_on)
+            if None in key:
+                raise ValueError(
+                    f"Every row needs a value for {', '.join(conflict_on)}"
+                )
+            unique[key] = tuple(row.get(c) for c in columns)
+        keys, values = list(unique), list(unique.values())
+
+        ops = OperationsFactory.get_operations(cls._db)
+        instances = []
+
+        for start in range(0, len(values), batch_size):
+            cls._wait_for_shadows()
+            records = ops.bulk_upsert(
+                cls._db,
+                cls._table_name,
+                columns,
+                conflict_on,
+                values[start : start + batch_size],
+            )
+            cls._written()
+
+            # Shadows get the rows as stored on the primary, keys included
+            record_columns = list(records[0]) if records else []
+            shadow_rows = [tuple(r[c] for c in record_columns) for r in records]
+
+            def upsert_statement(shadow_db: BaseDC) -> List[Statement]:
+                shadow_ops = OperationsFactory.get_operations(shadow_db)
+                return [
+                    (
+                        shadow_ops.upsert_sql(
+                            cls._table_name,
+                            record_columns,
+                            [cls._primary_key],
+                            len(batch),
+                        ),
+                        tuple(value for row in batch for value in row),
+                    )
+                    for batch in shadow_ops.batch_rows(shadow_rows, len(record_columns))
+                ]
+
+            failed_shadows = cls._replicate(upsert_statement)
+
+            if len(failed_shadows) > 0:
+                for record in records:
+                    cls._forget(record.get(cls._primary_key))
+                log_op(
+                    action=action,
+                    table=f"{cls._db}:{cls._table_name}",
+                    success=False,
+                    metadata={"payload": f"Failed to upsert shadows: {failed_shadows}"},
+                )
+                raise Exception(f"Failed to upsert shadows: {failed_shadows}")
+
+            # Back in row order, as far as the returned values compare equal
+            by_key = {tuple(r.get(c) for c in conflict_on): r for r in records}
+            ordered = [by_key.get(key) for key in keys[start : start + batch_size]]
+            for record in ordered if None not in ordered else records:
+                # Replace an instance of the old row held by the session
+                cls._forget(record.get(cls._primary_key))
+                instances.append(cls._remember(record))
+
+        log_op(
+            action=action,
+            table=f"{cls._db}:{cls._table_name}",
+            metadata={"payload": f"{len(instances)} records upserted"},
+        )
+        return instances
+
+    @classmethod
+    def _readable(cls, shadow_db: BaseDC, router: ReadRouter) -> bool:
+        if not shadow_health.healthy(shadow_db, cls._table_name):
+            return False
+        if cls._replicator is None:
+            return True
+
+        status = cls._replicator.replicator(shadow_db).status()
+        if status["last_error"] is not None:
+            return False
+        return router.max_lag is None or status["lag"] <= router.max_lag
+
+    @classmethod
+    def _read_db(cls) -> BaseDC:
+        """Database the next read runs on, see set_read_routing()"""
+        router = cls._read_router
+        if router is None or not cls._shadows:
+            return cls._db
+
+        session = current_session()
+        if session is not None and session.wrote_within(router.read_your_writes):
+            return cls._db
+
+        return router.choose(
+            cls._db, [db for db in cls._shadows if cls._readable(db, router)]
+        )
+
+    @classmethod
+    def _read(cls, read) -> Any:
+        """Run `read(db)` on the routed database, on the primary if a shadow fails"""
+        db = cls._read_db()
+        if cls._read_router is None:
+            return read(db)
+
+        start = time.perf_counter()
+        try:
+            result = read(db)
+        except Exception as e:
+            if db is cls._db:
+                raise
+            log(
+                f"Read from shadow {db} failed, retrying on the primary: {e}", "WARNING"
+            )
+            shadow_health.record(db, cls._table_name, e, stale=False)
+            return read(cls._db)
+        cls._read_router.observe(db, time.perf_counter() - start)
+        return result
 
     @classmethod
     def find_by_id(cls, record_id: Any) -> Optional["BaseModel"]:
-        """Find record by ID (reads from primary database only)"""
+        """Find record by ID (reads from the primary unless read routing is set)"""
         if not cls._table_name:
             log_op(
                 action="find_by_id",
@@ -265,20 +1706,36 @@ class BaseModel:
             )
             raise ValueError("Database connection not set. Use set_database() first.")
 
-        primary_ops = OperationsFactory.get_operations(cls._db)
-        query = f"SELECT * FROM {cls._table_name} WHERE {cls._primary_key} = %s"
-        result = primary_ops.execute_query(cls._db, query, (record_id,), fetch=True)
+        if cls._record_cache is not None:
+            instance = cls._cached(record_id)
+            if instance is not None:
+                return instance
+
+        def read(db: BaseDC) -> Optional[Dict[str, Any]]:
+            ops = OperationsFactory.get_operations(db)
+            query = ops.select_by_pk_sql(cls._table_name, cls._primary_key)
+            result = ops.execute_query(db, query, (record_id,), fetch=True)
+            if result["result"]:
+                return ops.row_to_dict(db, cls._table_name, result, result["result"][0])
+            return None
 
-        if result["result"]:
-            column_names = primary_ops.get_column_names(cls._db, cls._table_name)
-            instance_data = dict(zip(column_names, result["result"][0]))
-            return cls(**instance_data)
+        instance_data = cls._read(read)
+        if instance_data:
+            return cls._remember(instance_data)
 
         return None
 
     @classmethod
-    def find_all(cls, where: str = None, params: tuple = None) -> List["BaseModel"]:
-        """Find all records matching criteria (reads from primary database only)"""
+    def find_all(
+        cls, where: str = None, params: tuple = None, as_: str = "models"
+    ) -> Union[List[Any], Dict[str, Any]]:
+        """Find all records matching criteria (reads from the primary unless read routing is set)
+
+        `as_` picks the result shape: "models" (instances), "tuples", "dicts",
+        or "columns", a dict of one array per column filled batch by batch
+        from the cursor (NumPy arrays when installed, see shapes.ColumnBuilder).
+        """
+        check_shape(as_)
         if not cls._table_name:
             log_op(
                 action="find_all",
@@ -299,20 +1756,52 @@ class BaseModel:
             )
             raise ValueError("Database connection not set. Use set_database() first.")
 
-        query = f"SELECT * FROM {cls._table_name}"
-        if where:
-            query += f" WHERE {where}"
-
         primary_ops = OperationsFactory.get_operations(cls._db)
+        query = primary_ops.select_sql(cls._table_name, where=(where,) if where else ())
         results = []
 
+        def read(db: BaseDC) -> Dict[str, Any]:
+            ops = OperationsFactory.get_operations(db)
+            if ops is not primary_ops:
+                # A shadow of another kind renders the SELECT its own way
+                select = ops.select_sql(
+                    cls._table_name, where=(where,) if where else ()
+                )
+                return ops.execute_query(db, select, params, fetch=True)
+            return ops.execute_query(db, query, params, fetch=True)
+
+        def load() -> Dict[str, Any]:
+            return cls._read(read)
+
+        def read_columns(db: BaseDC) -> Dict[str, Any]:
+            ops = OperationsFactory.get_operations(db)
+            select = (
+                query
+                if ops is primary_ops
+                else ops.select_sql(cls._table_name, where=(where,) if where else ())
+            )
+            columns = collect_columns(ops.iter_query(db, select, params))
+            if columns is None:
+                return shape_rows(as_, ops.get_column_names(db, cls._table_name), [])
+            return columns
+
         try:
-            rows = primary_ops.execute_query(cls._db, query, params, fetch=True)
-            column_names = primary_ops.get_column_names(cls._db, cls._table_name)
+            if as_ == "columns" and cls._result_cache is None:
+                # Streamed, no list of rows is ever held
+                return cls._read(read_columns)
+
+            rows = cls._cached_result(query, params, load)
+            if as_ != "models":
+                columns = rows.get("columns") or primary_ops.get_column_names(
+                    cls._db, cls._table_name
+                )
+                return shape_rows(as_, columns, rows["result"])
 
-            for row in rows:
-                instance_data = dict(zip(column_names, row))
-                results.append(cls(**instance_data))
+            for row in rows["result"]:
+                instance_data = primary_ops.row_to_dict(
+                    cls._db, cls._table_name, rows, row
+                )
+                results.append(cls._remember(instance_data))
 
         except Exception as e:
             log_op(
@@ -326,6 +1815,188 @@ class BaseModel:
 
         return results
 
+    @classmethod
+    def query(cls) -> "Query":
+        """Start a chainable query, e.g. `User.query().where(age__gte=18).all()`"""
+        from .query import Query
+
+        return Query(cls)
+
+    @classmethod
+    def _cached_result(cls, query: str, params: Optional[tuple], load) -> Any:
+        if cls._result_cache is None:
+            return load()
+
+        # The generation is read before the query runs, a write landing while
+        # it runs bumps past it and the result is never served again
+        key = (
+            f"{cls.__module__}.{cls.__qualname__}",
+            f"{cls._db}",
+            query,
+            tuple(params) if params else (),
+            table_generations.get(cls._db, cls._table_name),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return load()
+        return cls._result_cache.get_or_load(key, load)
+
+    @classmethod
+    def iter_all(
+        cls,
+        where: str = None,
+        params: tuple = None,
+        batch_size: int = 1000,
+        as_: str = "models",
+    ) -> Iterator[Any]:
+        """Like find_all, but streams the rows and builds instances `batch_size` at a time
+
+        Memory stays flat whatever the result size. The stream keeps a connection
+        of its own until the iteration ends (or the generator is closed).
+        `as_` is "models", "tuples" or "dicts", see find_all().
+        """
+        check_shape(as_, SHAPES[:3])
+        if not cls._table_name:
+            log_op(
+                action="iter_all",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": "Table name not specified"},
+            )
+            raise ValueError("Table name not specified")
+
+        if not cls._db:
+            log_op(
+                action="iter_all",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={
+                    "payload": "Database connection not set. Use set_database() first."
+                },
+            )
+            raise ValueError("Database connection not set. Use set_database() first.")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        primary_ops = OperationsFactory.get_operations(cls._db)
+        query = primary_ops.select_sql(cls._table_name, where=(where,) if where else ())
+        return cls._stream(query, params, batch_size, as_)
+
+    @classmethod
+    def _stream(
+        cls, query: str, params: Optional[tuple], batch_size: int, as_: str = "models"
+    ) -> Iterator[Any]:
+        primary_ops = OperationsFactory.get_operations(cls._db)
+
+        try:
+            for columns, rows in primary_ops.iter_query(
+                cls._db, query, params, batch_size
+            ):
+                primary_ops.remember_columns(cls._db, cls._table_name, columns)
+                if as_ != "models":
+                    yield from shape_rows(as_, columns, rows)
+                    continue
+                for row in rows:
+                    yield cls._loaded(dict(zip(columns, row)))
+
+        except Exception as e:
+            log_op(
+                action="iter_all",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": f"Query execution error: {e}"},
+            )
+            log(f"Query execution error: {e}", "ERROR")
+            raise
+
+    @classmethod
+    def paginate(
+        cls,
+        order_by: Union[str, Sequence[str], None] = None,
+        after: Optional[str] = None,
+        limit: int = 50,
+        where: str = None,
+        params: tuple = None,
+    ) -> Tuple[List["BaseModel"], Optional[str]]:
+        """Read one page with keyset (seek) pagination
+
+        `order_by` is `"-created_at"`, `"created_at DESC, id"` or a list of such
+        items and defaults to the primary key, which is always added as the last
+        sort key. Pass the returned token as `after` to get the next page; it is
+        None on the last page. Sort columns should be NOT NULL and indexed.
+        """
+        if not cls._table_name:
+            log_op(
+                action="paginate",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": "Table name not specified"},
+            )
+            raise ValueError("Table name not specified")
+
+        if not cls._db:
+            log_op(
+                action="paginate",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={
+                    "payload": "Database connection not set. Use set_database() first."
+                },
+            )
+            raise ValueError("Database connection not set. Use set_database() first.")
+
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+
+        primary_ops = OperationsFactory.get_operations(cls._db)
+        order = parse_order_by(order_by, cls._primary_key)
+
+        conditions, query_params = [], []
+        if where:
+            conditions.append(where)
+            query_params.extend(params or ())
+        if after is not None:
+            predicate, predicate_params = primary_ops.keyset_predicate(
+                order, decode_cursor(after, order)
+            )
+            conditions.append(predicate)
+            query_params.extend(predicate_params)
+
+        query = primary_ops.select_sql(
+            cls._table_name, where=tuple(conditions), order=tuple(order), limit=True
+        )
+        # One row more than asked tells whether there is a next page
+        query_params.append(limit + 1)
+
+        try:
+            rows = primary_ops.execute_query(
+                cls._db, query, tuple(query_params), fetch=True
+            )
+        except Exception as e:
+            log_op(
+                action="paginate",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": f"Query execution error: {e}"},
+            )
+            log(f"Query execution error: {e}", "ERROR")
+            raise
+
+        items = [
+            cls._loaded(primary_ops.row_to_dict(cls._db, cls._table_name, rows, row))
+            for row in rows["result"][:limit]
+        ]
+
+        next_token = None
+        if len(rows["result"]) > limit:
+            last = items[-1]
+            next_token = encode_cursor(
+                order, [getattr(last, column) for column, _ in order]
+            )
+        return items, next_token
+
     def save(self) -> "BaseModel":
         """Save the current instance (create or update)"""
         if not self._table_name:
@@ -338,16 +2009,20 @@ class BaseModel:
             )
             raise ValueError("Table name not specified")
 
+        # Instances read from the table need no existence probe
+        if self._persisted:
+            return self.update()
+
         pk_value = getattr(self, self._primary_key, None)
 
         if pk_value and self.find_by_id(pk_value):
             return self.update()
         else:
-            data = {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
-            new_instance = self.__class__.update(self, **data)
+            new_instance = (self._model or type(self)).create(**self._fields())
 
-            for key, value in new_instance.__dict__.items():
+            for key, value in new_instance._fields().items():
                 setattr(self, key, value)
+            self._mark_clean()
 
             return self
 
@@ -374,19 +2049,22 @@ class BaseModel:
             )
             raise ValueError(f"No {self._primary_key} value found for update")
 
+        # Without arguments only the columns assigned since load are written
         update_data = (
             data
             if data
             else {
-                k: v
-                for k, v in self.__dict__.items()
-                if not k.startswith("_") and k != self._primary_key
+                k: getattr(self, k)
+                for k in self.dirty_fields()
+                if k != self._primary_key
             }
         )
 
         if not update_data:
             return self
 
+        refresh = self._refresh or OperationsFactory.get_operations(self._db).returning
+
         def update_operation(db: BaseDC):
             ops = OperationsFactory.get_operations(db)
             columns = list(update_data.keys())
@@ -396,16 +2074,51 @@ class BaseModel:
             query = ops.update_sql(self._table_name, columns, self._primary_key)
             result = ops.execute_query(db, query, tuple(values), fetch=True)
 
+            if not refresh:
+                # The row now holds what was sent, no read-back
+                return {**update_data, self._primary_key: pk_value}
             return ops.handle_update_result(
                 db, self._table_name, self._primary_key, pk_value, result
             )
 
+        def update_statement(db: BaseDC) -> List[Statement]:
+            ops = OperationsFactory.get_operations(db)
+            query = ops.update_sql(
+                self._table_name, list(update_data.keys()), self._primary_key
+            )
+            return [(query, (*update_data.values(), pk_value))]
+
         # Execute update operation with mirroring
-        instance_data = self._mirror_operation(update_operation)
+        try:
+            instance_data = self._mirror_operation(
+                update_operation, shadow_statement=update_statement
+            )
+        except Exception:
+            # The primary may hold the new row even though a shadow failed
+            self._forget(pk_value)
+            raise
+        finally:
+            self._written()
 
-        # Update current instance with new data
+        # Columns assigned but not written by this call stay dirty and keep
+        # their unsaved values
+        pending = (self._dirty or set()) - update_data.keys() - {self._primary_key}
         for key, value in instance_data.items():
-            setattr(self, key, value)
+            if key not in pending:
+                setattr(self, key, value)
+        self._mark_clean()
+        if pending:
+            self._dirty = pending
+
+        if self._record_cache is not None:
+            if refresh:
+                self._record_cache.set(self._table_name, pk_value, instance_data)
+            else:
+                # Only part of the row is known
+                self._record_cache.invalidate(self._table_name, pk_value)
+            session = current_session()
+            if session is not None:
+                session.put(self._model or type(self), pk_value, self)
 
         log_op(
             action="update",
@@ -441,13 +2154,21 @@ class BaseModel:
             )
             raise ValueError(f"No {self._primary_key} value found for deletion")
 
+        query = f"DELETE FROM {self._table_name} WHERE {self._primary_key} = %s"
+
         def delete_operation(db: BaseDC):
             ops = OperationsFactory.get_operations(db)
-            query = f"DELETE FROM {self._table_name} WHERE {self._primary_key} = %s"
             return ops.execute_query(db, query, (pk_value,))
 
         # Execute delete operation with mirroring
-        rows_affected = self._mirror_operation(delete_operation)["rowcount"]
+        try:
+            rows_affected = self._mirror_operation(
+                delete_operation, shadow_statement=lambda db: [(query, (pk_value,))]
+            )["rowcount"]
+        finally:
+            self._forget(pk_value)
+            self._written()
+        self._persisted = False
         return rows_affected > 0
 
     @classmethod
@@ -463,13 +2184,20 @@ class BaseModel:
             )
             raise ValueError("Table name not specified")
 
+        query = f"DELETE FROM {cls._table_name} WHERE {cls._primary_key} = %s"
+
         def delete_operation(db: BaseDC):
             ops = OperationsFactory.get_operations(db)
-            query = f"DELETE FROM {cls._table_name} WHERE {cls._primary_key} = %s"
             return ops.execute_query(db, query, (record_id,))
 
         # Execute delete operation with mirroring
-        rows_affected = cls._mirror_operation(delete_operation)
+        try:
+            rows_affected = cls._mirror_operation(
+                delete_operation, shadow_statement=lambda db: [(query, (record_id,))]
+            )["rowcount"]
+        finally:
+            cls._forget(record_id)
+            cls._written()
         log_op(
             action="delete_by_id",
             table=f"{cls._db}:{cls._table_name}",
@@ -481,6 +2209,220 @@ class BaseModel:
         )
         return rows_affected > 0
 
+    @classmethod
+    def update_where(
+        cls,
+        values: Dict[str, Any],
+        where: str,
+        params: tuple = None,
+        chunk_size: Optional[int] = None,
+    ) -> int:
+        """Set `values` on every row matching `where` in all databases
+
+        One UPDATE per database, or one per primary-key range of `chunk_size`
+        matching rows so each statement holds its locks briefly. Returns the
+        rows affected on the primary, see _write_where() for the shadows.
+        """
+        if not values:
+            log_op(
+                action="update_where",
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": "No values to update"},
+            )
+            raise ValueError("No values to update")
+        if chunk_size and cls._primary_key in values:
+            raise ValueError(
+                f"{cls._primary_key} cannot be updated while chunking by it"
+            )
+
+        columns = tuple(values)
+
+        def statement(ops: BaseOperations, fragments: tuple, args: tuple):
+            query = ops.update_where_sql(cls._table_name, columns, fragments)
+            return query, (*values.values(), *args)
+
+        return cls._write_where("update_where", statement, where, params, chunk_size)
+
+    @classmethod
+    def delete_where(
+        cls, where: str, params: tuple = None, chunk_size: Optional[int] = None
+    ) -> int:
+        """Delete every row matching `where` from all databases
+
+        Chunked like update_where(). Returns the rows deleted on the primary.
+        """
+
+        def statement(ops: BaseOperations, fragments: tuple, args: tuple):
+            return ops.delete_where_sql(cls._table_name, fragments), args
+
+        return cls._write_where("delete_where", statement, where, params, chunk_size)
+
+    @classmethod
+    def _write_where(
+        cls,
+        action: str,
+        statement,
+        where: str,
+        params: Optional[tuple],
+        chunk_size: Optional[int],
+    ) -> int:
+        """Mirror the set-based write `statement(ops, where_fragments, params)`
+
+        The affected row counts of the shadows are compared with the primary's;
+        a shadow that differs is logged and marked unhealthy for reads of the
+        table. In async replication mode the shadows are journaled and not
+        compared.
+        """
+        if not cls._table_name:
+            log_op(
+                action=action,
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": "Table name not specified"},
+            )
+            raise ValueError("Table name not specified")
+        if not where:
+            # An empty where would silently hit the whole table
+            log_op(
+                action=action,
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": "No where clause given"},
+            )
+            raise ValueError(
+                f"{action} needs a where clause, pass '1 = 1' to match every row"
+            )
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        params = tuple(params or ())
+        bounds = (
+            cls._key_bounds((where,), params, chunk_size)
+            if chunk_size
+            else [(None, None)]
+        )
+
+        total = 0
+        try:
+            for low, high in bounds:
+                fragment, bound = cls._key_range(low, high)
+                fragments = (where, fragment) if fragment else (where,)
+                args = (*params, *bound)
+                total += cls._mirror_counted(
+                    action, lambda ops: statement(ops, fragments, args)
+                )
+        except Exception as e:
+            log_op(
+                action=action,
+                table=f"{cls._db}:{cls._table_name}",
+                success=False,
+                metadata={"payload": f"Failed after {total} rows: {e}"},
+            )
+            raise
+        finally:
+            # Which rows changed is unknown, drop the whole table from the caches
+            cls._forget()
+            cls._written()
+
+        log_op(
+            action=action,
+            table=f"{cls._db}:{cls._table_name}",
+            success=True,
+            metadata={"payload": f"{total} rows affected"},
+        )
+        return total
+
+    @classmethod
+    def _mirror_counted(cls, action: str, build) -> int:
+        """Run the statement `build(ops)` everywhere, compare the row counts"""
+        counts: Dict[BaseDC, int] = {}
+
+        def operation(db: BaseDC) -> int:
+            ops = OperationsFactory.get_operations(db)
+            query, args = build(ops)
+            counts[db] = ops.execute_query(db, query, args)["rowcount"]
+            return counts[db]
+
+        def shadow_statement(db: BaseDC) -> List[Statement]:
+            return [build(OperationsFactory.get_operations(db))]
+
+        # Inline the operation itself runs on the shadows so their counts come
+        # back; statements are needed to journal or to capture for add_shadow()
+        journaled = cls._replicator is not None or cls._backfills
+        primary_count = cls._mirror_operation(
+            operation, shadow_statement=shadow_statement if journaled else None
+        )
+
+        for shadow_db in cls._shadows:
+            count = counts.get(shadow_db)
+            if count is None or count == primary_count:
+                continue
+            message = (
+                f"{action} affected {primary_count} rows of {cls._table_name} "
+                f"on the primary but {count} on {shadow_db}"
+            )
+            log(message, "WARNING")
+            shadow_health.record(shadow_db, cls._table_name, Exception(message))
+        return primary_count
+
+    @classmethod
+    def _key_bounds(
+        cls,
+        where: Tuple[str, ...],
+        params: tuple,
+        chunk_size: int,
+        start: Any = None,
+        db: Optional[BaseDC] = None,
+    ) -> Iterator[Tuple[Any, Any]]:
+        """Primary-key bounds `[low, high)` holding `chunk_size` matching rows each
+
+        None stands for an open end. Each bound is found on the primary (or
+        `db`) right before its chunk is used, by seeking `chunk_size` rows
+        past the previous one, so gaps in the keys and rows a write stops
+        matching do not matter. `start` resumes from a bound yielded earlier.
+        """
+        db = db or cls._db
+        ops = OperationsFactory.get_operations(db)
+        pk = cls._primary_key
+        low = start
+        while True:
+            fragment, bound = cls._key_range(low, None)
+            query = ops.select_sql(
+                cls._table_name,
+                columns=(pk,),
+                where=(*where, fragment) if fragment else where,
+                order=((pk, False),),
+                limit=True,
+                offset=True,
+            )
+            rows = ops.execute_query(
+                db, query, (*params, *bound, 1, chunk_size), fetch=True
+            )["result"]
+            high = rows[0][0] if rows else None
+            yield low, high
+
+            if high is None:
+                return
+            low = high
+
+    @classmethod
+    def _key_range(cls, low: Any, high: Any) -> Tuple[Optional[str], tuple]:
+        """WHERE fragment and params of the keys in `[low, high)`, None when unbounded"""
+        pk = cls._primary_key
+        clauses, params = [], []
+        if low is not None:
+            clauses.append(f"{pk} >= %s")
+            params.append(low)
+        if high is not None:
+            clauses.append(f"{pk} < %s")
+            params.append(high)
+        return " AND ".join(clauses) or None, tuple(params)
+
     def __repr__(self):
-        attrs = {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
-        return f"{self.__class__.__name__}({attrs})"
+        return f"{self.__class__.__name__}({self._fields()})"
+
+
+# Slot setters for the hot paths, skipping __setattr__
+_set_dirty = BaseModel._dirty.__set__
+_set_persisted = BaseModel._persisted.__set__
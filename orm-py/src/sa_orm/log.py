@@ -1,12 +1,17 @@
 import os
 import json
+import glob
+import queue
+import atexit
 import logging
-from typing import Any, Dict
+import threading
+import time
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
 class ColorStreamHandler(logging.StreamHandler):
-    def __init__(self, stream=None):
+    def __init__(self, stream=None, fmt: Optional[str] = None):
         class AddColor(logging.Formatter):
             def format(self, record: logging.LogRecord):
                 msg = super().format(record)
@@ -19,17 +24,269 @@ class ColorStreamHandler(logging.StreamHandler):
                 return color + record.levelname + "\033[1;0m: " + msg
 
         super().__init__(stream)
-        self.setFormatter(AddColor())
+        self.setFormatter(AddColor(fmt))
 
 
-class Logger:
-    def __init__(self, name: str = "SA_ORM", log_file: str = "log.json"):
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="%(asctime)s [%(levelname)s] [%(module)s/%(funcName)s#%(lineno)d] - %(message)s",
-            handlers=[ColorStreamHandler()],
-            force=True,
+LOG_FORMAT = (
+    "%(asctime)s [%(levelname)s] [%(module)s/%(funcName)s#%(lineno)d] - %(message)s"
+)
+
+# Silent until the application configures logging or calls setup_logging()
+logging.getLogger("SA_ORM").addHandler(logging.NullHandler())
+
+
+def setup_logging(level: int | str = logging.DEBUG, name: str = "SA_ORM"):
+    """Print the ORM's own log messages in color to stderr
+
+    Only the `name` logger is touched, the application's logging config is left
+    alone. Calling it again replaces the handler instead of adding another one.
+    """
+    logger = logging.getLogger(name)
+    for handler in list(logger.handlers):
+        if isinstance(handler, ColorStreamHandler):
+            logger.removeHandler(handler)
+
+    handler = ColorStreamHandler(fmt=LOG_FORMAT)
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+class AuditLog:
+    """Append-only JSON Lines sink for `log_op` records
+
+    Records are queued and written by a background thread, so an operation only
+    pays for serializing its record. `durability` picks when the file is fsynced:
+
+    * "always": after every record; `write()` returns once its record is on disk
+      (records queued together share one fsync)
+    * "batch": every `fsync_every` records or `fsync_interval` seconds
+    * "never": flushed to the OS only, left to the page cache
+
+    The file is rotated to `<name>.<timestamp><ext>` once it exceeds `max_bytes`
+    or is older than `rotate_interval` seconds, keeping `backup_count` old files.
+    When more than `queue_size` records are pending, `on_full="block"` makes the
+    caller wait (up to `block_timeout` seconds) and `on_full="drop"` discards the
+    record; dropped records are counted in `stats()`.
+    """
+
+    DURABILITY = ("always", "batch", "never")
+
+    def __init__(
+        self,
+        path: str,
+        durability: str = "batch",
+        fsync_every: int = 1000,
+        fsync_interval: float = 1.0,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        rotate_interval: Optional[float] = None,
+        backup_count: int = 10,
+        queue_size: int = 10000,
+        on_full: str = "block",
+        block_timeout: Optional[float] = None,
+    ):
+        if durability not in self.DURABILITY:
+            raise ValueError(f"durability must be one of {self.DURABILITY}")
+        if on_full not in ("block", "drop"):
+            raise ValueError('on_full must be "block" or "drop"')
+
+        self.path = path
+        self.durability = durability
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.on_full = on_full
+        self.block_timeout = block_timeout
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._stats = {"written": 0, "dropped": 0, "fsyncs": 0, "rotations": 0}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._file = None
+        self._opened_at = 0.0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        self._writer = threading.Thread(
+            target=self._run, name="sa_orm-audit", daemon=True
+        )
+        self._writer.start()
+
+    def write(self, record: Dict[str, Any]) -> bool:
+        """Queue one record, returns False if it was dropped"""
+        if self._closed:
+            return False
+
+        line = json.dumps(record, default=str) + "\n"
+        done = threading.Event() if self.durability == "always" else None
+        try:
+            if self.on_full == "drop":
+                self._queue.put_nowait((line, done))
+            else:
+                self._queue.put((line, done), timeout=self.block_timeout)
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+            return False
+
+        # Stop waiting if the writer went away (closed concurrently)
+        while done is not None and not done.wait(1.0):
+            if not self._writer.is_alive():
+                return False
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued record is written and fsynced"""
+        if self._closed or not self._writer.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put((None, done))
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Write out what is queued, fsync and stop the writer thread"""
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+        self._queue.put((None, None))
+        self._writer.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"path": self.path, "pending": self._queue.qsize(), **self._stats}
+
+    def _run(self):
+        while True:
+            try:
+                # Wake up to honour fsync_interval even when no new record arrives
+                wait = self.fsync_interval if self._unsynced else None
+                batch = [self._queue.get(timeout=wait)]
+            except queue.Empty:
+                self._sync()
+                continue
+
+            # Drain whatever else is pending so one write/fsync covers all of it
+            while len(batch) < 1000:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logging.getLogger("SA_ORM").error(f"Audit log write failed: {e}")
+            finally:
+                for line, done in batch:
+                    if done is not None:
+                        done.set()
+
+            if any(line is None and done is None for line, done in batch):
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                return
+
+    def _write_batch(self, batch: List[tuple]):
+        lines = [line for line, _ in batch if line is not None]
+        if lines:
+            self._maybe_rotate()
+            f = self._open()
+            f.write("".join(lines))
+            f.flush()
+            self._stats["written"] += len(lines)
+            self._unsynced += len(lines)
+
+        if (
+            self.durability == "always"
+            or len(lines) < len(batch)  # flush() or close() asked for it
+            or self._unsynced >= self.fsync_every
+            or time.monotonic() - self._last_sync >= self.fsync_interval
+        ):
+            self._sync()
+
+    def _sync(self):
+        if self._file is not None and self._unsynced:
+            if self.durability != "never":
+                os.fsync(self._file.fileno())
+                self._stats["fsyncs"] += 1
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._opened_at = time.time()
+        return self._file
+
+    def _maybe_rotate(self):
+        f = self._open()
+        too_big = self.max_bytes is not None and f.tell() >= self.max_bytes
+        too_old = (
+            self.rotate_interval is not None
+            and time.time() - self._opened_at >= self.rotate_interval
         )
+        if not (too_big or too_old) or f.tell() == 0:
+            return
+
+        if self.durability != "never":
+            os.fsync(f.fileno())
+        f.close()
+        self._file = None
+
+        root, ext = os.path.splitext(self.path)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        os.replace(self.path, f"{root}.{stamp}{ext}")
+        self._stats["rotations"] += 1
+
+        backups = sorted(glob.glob(f"{glob.escape(root)}.*{ext}"))
+        for old in backups[: max(0, len(backups) - self.backup_count)]:
+            os.remove(old)
+
+
+# One sink per file, shared by every Logger writing to it
+_audit_logs: Dict[str, AuditLog] = {}
+_audit_options: Dict[str, Any] = {}
+_audit_lock = threading.Lock()
+
+
+def configure_audit_log(**options):
+    """Set the AuditLog options (durability, rotation, queue policy) for new sinks
+
+    Sinks that are already open are flushed and reopened with the new options.
+    """
+    with _audit_lock:
+        _audit_options.clear()
+        _audit_options.update(options)
+        sinks = list(_audit_logs.values())
+        _audit_logs.clear()
+    for sink in sinks:
+        sink.close()
+
+
+def get_audit_log(path: str) -> AuditLog:
+    with _audit_lock:
+        sink = _audit_logs.get(path)
+        if sink is None:
+            sink = _audit_logs[path] = AuditLog(path, **_audit_options)
+        return sink
+
+
+@atexit.register
+def close_audit_logs():
+    """Flush and close every audit sink, runs at interpreter shutdown"""
+    with _audit_lock:
+        sinks = list(_audit_logs.values())
+        _audit_logs.clear()
+    for sink in sinks:
+        sink.close()
+
+
+class Logger:
+    def __init__(self, name: str = "SA_ORM", log_file: str = "log.jsonl"):
         self.logpath = os.path.join(os.getcwd(), log_file)
         self.logger = logging.getLogger(name)
 
@@ -49,21 +306,7 @@ class Logger:
             "success": success,
             "metadata": metadata or {},
         }
-        if os.path.isfile(self.logpath) and os.path.getsize(self.logpath) > 0:
-            with open(self.logpath, "r", encoding="utf-8") as f:
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
-                    data = []
-        else:
-            data = []
-
-        data.append(log_data)
-
-        with open(self.logpath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-            f.flush()
-            os.fsync(f.fileno())
+        get_audit_log(self.logpath).write(log_data)
 
     def log(self, message: object, level: str = "debug") -> None:
         severity_methods = {
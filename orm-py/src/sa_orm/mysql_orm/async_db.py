@@ -0,0 +1,51 @@
+import aiomysql
+from typing import Any
+from ..base.declare import AsyncBaseDC, DatabaseType
+from ..log import Logger
+
+Log = Logger()
+log = Log.log
+
+
+class AsyncDatabaseConnection(AsyncBaseDC):
+    """Manages MySQL connections using aiomysql"""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 3306,
+        database: str = "mysql",
+        user: str = "root",
+        password: str = "password",
+        pool_size: int = 1,
+    ):
+        super().__init__(DatabaseType.MYSQL, pool_size)
+        self.connection_params = {
+            "host": host,
+            "port": port,
+            "db": database,
+            "user": user,
+            "password": password,
+        }
+
+    async def open_connection(self) -> Any:
+        try:
+            conn = await aiomysql.connect(autocommit=False, **self.connection_params)
+            log(f"Connected to MySQL database: {self.connection_params['db']}")
+            return conn
+        except Exception as e:
+            log(f"Error connecting to database: {e}", "ERROR")
+            raise
+
+    async def close_connection(self, conn: Any):
+        conn.close()
+
+    def is_usable(self, conn: Any) -> bool:
+        return not conn.closed
+
+    async def disconnect(self):
+        await super().disconnect()
+        log(f"{self} Database connection closed")
+
+    def __repr__(self) -> str:
+        return f"{self.connection_params['host']}:{self.connection_params['port']}@{self.connection_params['db']}"
@@ -0,0 +1,103 @@
+from typing import Any, Dict, List, Tuple
+from ..base.async_ops import AsyncBaseOperations
+from ..base.declare import AsyncBaseDC, DatabaseType
+from .ops import MySQLOperations
+
+
+class AsyncMySQLOperations(AsyncBaseOperations):
+    """MySQL-specific database operations on aiomysql connections"""
+
+    dialect = MySQLOperations()
+
+    async def execute_query(
+        self,
+        db: AsyncBaseDC,
+        query: str,
+        params: tuple = (),
+        fetch: bool = False,
+    ) -> Any:
+        if db.db_type != DatabaseType.MYSQL:
+            raise ValueError(f"Expected MySQL connection, got {db.db_type}")
+
+        async with db.checkout() as conn:
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(query, params or None)
+                    columns = (
+                        [desc[0] for desc in cursor.description]
+                        if cursor.description
+                        else None
+                    )
+                    result = None
+                    if fetch and cursor.description:
+                        if query.strip().upper().startswith("SELECT"):
+                            result = await cursor.fetchall()
+                        else:
+                            result = await cursor.fetchone()
+                    await conn.commit()
+                    return {
+                        "result": result,
+                        "lastrowid": cursor.lastrowid,
+                        "rowcount": cursor.rowcount,
+                        "columns": columns,
+                    }
+
+            except Exception as e:
+                await conn.rollback()
+                raise Exception from e
+
+    async def execute_batch(
+        self, db: AsyncBaseDC, statements: List[Tuple[str, tuple]]
+    ) -> List[int]:
+        if db.db_type != DatabaseType.MYSQL:
+            raise ValueError(f"Expected MySQL connection, got {db.db_type}")
+
+        async with db.checkout() as conn:
+            try:
+                rowcounts = []
+                async with conn.cursor() as cursor:
+                    for query, params in statements:
+                        await cursor.execute(query, params or None)
+                        rowcounts.append(cursor.rowcount)
+                await conn.commit()
+                return rowcounts
+
+            except Exception as e:
+                await conn.rollback()
+                raise Exception from e
+
+    async def handle_insert_result(
+        self,
+        db: AsyncBaseDC,
+        table_name: str,
+        primary_key: str,
+        insert_result: Any,
+        insert_params: tuple,
+    ) -> Dict[str, Any]:
+        """For MySQL, we need to fetch the created record using the lastrowid"""
+        last_id = insert_result.get("lastrowid")
+        if not last_id:
+            raise Exception("Failed to get inserted record ID")
+
+        select_query = self.dialect.select_by_pk_sql(table_name, primary_key)
+        result = await self.execute_query(db, select_query, (last_id,), fetch=True)
+
+        if not result["result"]:
+            raise Exception(f"Failed to retrieve created record with ID {last_id}")
+        return self.row_to_dict(db, table_name, result, result["result"][0])
+
+    async def handle_update_result(
+        self,
+        db: AsyncBaseDC,
+        table_name: str,
+        primary_key: str,
+        pk_value: Any,
+        update_result: Any,
+    ) -> Dict[str, Any]:
+        """For MySQL, we need to fetch the updated record"""
+        select_query = self.dialect.select_by_pk_sql(table_name, primary_key)
+        result = await self.execute_query(db, select_query, (pk_value,), fetch=True)
+
+        if not result["result"]:
+            raise Exception(f"Failed to retrieve updated record with ID {pk_value}")
+        return self.row_to_dict(db, table_name, result, result["result"][0])
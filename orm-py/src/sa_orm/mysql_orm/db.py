@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Dict, Optional
 from mysql.connector import connect
 from mysql.connector import Error
 from ..base.declare import BaseDC, DatabaseType
@@ -19,8 +19,12 @@ class DatabaseConnection(BaseDC):
         database: str = "mysql",
         user: str = "root",
         password: str = "password",
+        pool: Optional[Dict[str, Any]] = None,
+        prepared: Optional[Dict[str, Any]] = None,
+        ping_after: Optional[float] = 60.0,
     ):
         super().__init__(DatabaseType.MYSQL)
+        self.ping_after = ping_after
         self.connection_params = {
             "host": host,
             "port": port,
@@ -29,10 +33,20 @@ class DatabaseConnection(BaseDC):
             "password": password,
         }
         self._connection = None
+        if pool is not None:
+            self.enable_pool(**pool)
+        if prepared is not None:
+            self.enable_prepared_statements(**prepared)
+
+    def open_connection(self) -> Any:
+        return connect(**self.connection_params)
+
+    def is_usable(self, conn: Any) -> bool:
+        return conn.is_connected()
 
     def connect(self) -> Any:
         try:
-            self._connection = connect(**self.connection_params)
+            self._connection = self.open_connection()
             if self._connection.is_connected():
                 log(
                     f"Connected to MySQL database: {self.connection_params['database']}"
@@ -45,6 +59,8 @@ class DatabaseConnection(BaseDC):
             raise
 
     def disconnect(self):
+        if self._pool is not None:
+            self._pool.close()
         if self._connection and self._connection.is_connected():
             self._connection.close()
             log(
@@ -53,7 +69,9 @@ class DatabaseConnection(BaseDC):
 
     @property
     def connection(self):
-        if not self._connection or not self._connection.is_connected():
+        # is_connected() pings the server, checkout() only calls it after a
+        # failure or once the connection sat idle for ping_after seconds
+        if not self._connection:
             self.connect()
         return self._connection
 
@@ -1,11 +1,41 @@
-from typing import Dict, List, Any
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from ..base.declare import BaseDC, DatabaseType
-from ..base.ops import BaseOperations
+from ..base.ops import BaseOperations, cached_sql
+from ..base.prepared import StatementCache
+from ..base.schema import TableSchema
+
+# Client errors of a connection the server closed. "Gone away" is raised while
+# sending, so the statement never ran; after "lost" it may have, so only reads
+# are run again.
+CR_SERVER_GONE_ERROR = 2006
+CR_SERVER_LOST = (2013, 2055)
+
+_READS = ("SELECT", "SHOW", "DESCRIBE")
+
+
+def _connection_lost(error: BaseException) -> Optional[int]:
+    """Client error number if `error` comes from a lost connection
+
+    Cleaning up after the first error (rollback, close) fails as well on a dead
+    connection, so the earliest lost-connection error in the chain counts.
+    """
+    errno, seen = None, set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        code = getattr(error, "errno", None)
+        if code == CR_SERVER_GONE_ERROR or code in CR_SERVER_LOST:
+            errno = code
+        error = error.__cause__ or error.__context__
+    return errno
 
 
 class MySQLOperations(BaseOperations):
     """MySQL-specific database operations"""
 
+    def __init__(self):
+        super().__init__()
+        self._auto_increment_steps: Dict[BaseDC, int] = {}
+
     def create_table_sql(
         self,
         table_name: str,
@@ -31,6 +61,7 @@ class MySQLOperations(BaseOperations):
         )
         """
 
+    @cached_sql
     def insert_sql(self, table_name: str, columns: List[str]) -> str:
         placeholders = ["%s"] * len(columns)
         return f"""
@@ -38,6 +69,98 @@ class MySQLOperations(BaseOperations):
         VALUES ({", ".join(placeholders)})
         """
 
+    def bulk_insert(
+        self,
+        db: BaseDC,
+        table_name: str,
+        primary_key: str,
+        columns: List[str],
+        rows: List[tuple],
+    ) -> List[Dict[str, Any]]:
+        """For MySQL, the keys of a multi-row INSERT run from LAST_INSERT_ID() in auto_increment steps"""
+        step = self._auto_increment_step(db)
+        records = []
+        for batch in self.batch_rows(rows, len(columns)):
+            query = self.bulk_insert_sql(table_name, columns, len(batch))
+            params = tuple(value for row in batch for value in row)
+            first_id = self.execute_query(db, query, params).get("lastrowid")
+            if not first_id:
+                raise Exception("Failed to get inserted record IDs")
+
+            for i, row in enumerate(batch):
+                record = dict(zip(columns, row))
+                record[primary_key] = first_id + i * step
+                records.append(record)
+
+        return records
+
+    def bulk_copy(
+        self, db: BaseDC, table_name: str, columns: List[str], rows: List[tuple]
+    ) -> int:
+        if db.db_type != DatabaseType.MYSQL:
+            raise ValueError(f"Expected MySQL connection, got {db.db_type}")
+
+        with db.checkout() as conn:
+            cursor = conn.cursor()
+
+            try:
+                # executemany rewrites a plain INSERT into multi-row VALUES
+                cursor.executemany(self.insert_sql(table_name, columns), rows)
+                conn.commit()
+                rowcount = cursor.rowcount
+                cursor.close()
+                return rowcount
+
+            except Exception as e:
+                conn.rollback()
+                if cursor:
+                    cursor.close()
+                raise Exception from e
+
+    def _auto_increment_step(self, db: BaseDC) -> int:
+        if db not in self._auto_increment_steps:
+            result = self.execute_query(
+                db, "SELECT @@auto_increment_increment", fetch=True
+            )
+            self._auto_increment_steps[db] = int(result["result"][0][0])
+        return self._auto_increment_steps[db]
+
+    @cached_sql
+    def upsert_sql(
+        self,
+        table_name: str,
+        columns: List[str],
+        conflict_on: List[str],
+        row_count: int = 1,
+    ) -> str:
+        """For MySQL, ON DUPLICATE KEY UPDATE fires on any unique key of the table
+
+        `conflict_on` only picks the columns left alone on update; VALUES()
+        keeps the statement valid on MariaDB and MySQL before 8.0.19.
+        """
+        updates = [c for c in columns if c not in conflict_on] or conflict_on[:1]
+        return f"""
+        {self.bulk_insert_sql(table_name, columns, row_count)}
+        ON DUPLICATE KEY UPDATE {", ".join(f"{c} = VALUES({c})" for c in updates)}
+        """
+
+    def row_hash_sql(self, columns: Tuple[str, ...]) -> str:
+        """For MySQL, values are length-prefixed so a '|' inside one is no separator
+
+        CONCAT_WS skips NULLs, so a flag per column tells them apart.
+        """
+        values = ", ".join(f"CONCAT(CHAR_LENGTH({c}), ':', {c})" for c in columns)
+        nulls = f"CONCAT({', '.join(f'ISNULL({c})' for c in columns)})"
+        return f"MD5(CONCAT_WS('|', {values}, {nulls}))"
+
+    def hash_sum_sql(self, row_hash: str) -> str:
+        # SUM of UNSIGNED values is DECIMAL, no overflow on large tables
+        return (
+            f"COALESCE(SUM(CAST(CONV(SUBSTRING({row_hash}, 1, 15), 16, 10) "
+            f"AS UNSIGNED)), 0)"
+        )
+
+    @cached_sql
     def update_sql(self, table_name: str, columns: List[str], primary_key: str) -> str:
         placeholders = [f"{col} = %s" for col in columns]
         return f"""
@@ -46,6 +169,12 @@ class MySQLOperations(BaseOperations):
         WHERE {primary_key} = %s
         """
 
+    def limit_sql(self, limit: bool, offset: bool) -> str:
+        """For MySQL, OFFSET needs a LIMIT, the largest one stands for none"""
+        if offset and not limit:
+            return "LIMIT 18446744073709551615 OFFSET %s"
+        return super().limit_sql(limit, offset)
+
     def execute_query(
         self,
         db: BaseDC,
@@ -56,60 +185,207 @@ class MySQLOperations(BaseOperations):
         if db.db_type != DatabaseType.MYSQL:
             raise ValueError(f"Expected MySQL connection, got {db.db_type}")
 
-        conn = db.connection
-        cursor = conn.cursor()
+        return self._retrying(
+            db,
+            query.lstrip().upper().startswith(_READS),
+            lambda conn: self._execute(conn, query, params, fetch, db.statement_cache),
+        )
+
+    def _retrying(self, db: BaseDC, read: bool, run: Callable[[Any], Any]) -> Any:
+        """`run` on a checked-out connection, once more if the server closed it
+
+        The failed checkout drops the dead connection, so the retry gets a new
+        one. Inside `pinned()` or a `transaction()` nothing is retried, the
+        work done earlier on the connection was lost with it.
+        """
+        try:
+            with db.checkout() as conn:
+                return run(conn)
+        except Exception as e:
+            errno = _connection_lost(e)
+            if errno is None or db.is_pinned():
+                raise
+            if errno != CR_SERVER_GONE_ERROR and not read:
+                raise
+        with db.checkout() as conn:
+            return run(conn)
+
+    def _prepared(
+        self,
+        conn: Any,
+        query: str,
+        params: tuple,
+        statements: Optional[StatementCache],
+    ) -> Optional[Tuple[Any, str]]:
+        """Prepared cursor kept for `query` on `conn`, with the string it was prepared from"""
+        # Statements without parameters (DDL, server variables) are not worth it
+        if statements is None or not params:
+            return None
+        return statements.get(
+            conn,
+            query,
+            lambda sql: (conn.cursor(prepared=True), sql),
+            lambda handle: handle[0].close(),
+        )
+
+    def _execute(
+        self,
+        conn: Any,
+        query: str,
+        params: tuple,
+        fetch: bool,
+        statements: Optional[StatementCache] = None,
+    ) -> Any:
+        prepared = self._prepared(conn, query, params, statements)
+        if prepared:
+            # The cursor only reuses its statement when handed the very same
+            # string object, anything else is prepared again
+            cursor, query = prepared
+        else:
+            cursor = conn.cursor()
 
         try:
             cursor.execute(query, params)
 
             if fetch:
+                columns = (
+                    [desc[0] for desc in cursor.description]
+                    if cursor.description
+                    else None
+                )
                 if query.strip().upper().startswith("SELECT"):
                     result = cursor.fetchall()
-                    lastrowid = cursor.lastrowid
-                    rowsAff = cursor.rowcount
-                    cursor.close()
-                    return {
-                        "result": result,
-                        "lastrowid": lastrowid,
-                        "rowcount": rowsAff,
-                    }
                 else:
                     result = cursor.fetchone() if cursor.rowcount > 0 else None
-                    lastrowid = cursor.lastrowid
-                    rowsAff = cursor.rowcount
+                lastrowid = cursor.lastrowid
+                rowsAff = cursor.rowcount
+                conn.commit()
+                if not prepared:
                     cursor.close()
-                    return {
-                        "result": result,
-                        "lastrowid": lastrowid,
-                        "rowcount": rowsAff,
-                    }
+                return {
+                    "result": result,
+                    "lastrowid": lastrowid,
+                    "rowcount": rowsAff,
+                    "columns": columns,
+                }
 
             conn.commit()
             rowcount = cursor.rowcount
             last_id = cursor.lastrowid
-            cursor.close()
+            if not prepared:
+                cursor.close()
 
             # Return both rowcount and last_id for insert operations
             return {"rowcount": rowcount, "lastrowid": last_id}
 
         except Exception as e:
             conn.rollback()
+            if prepared:
+                statements.discard(conn, query)
             if cursor:
                 cursor.close()
             raise Exception from e
 
-    def get_column_names(self, db: BaseDC, table_name: str) -> List[str]:
-        cursor = db.connection.cursor()
+    def iter_query(
+        self, db: BaseDC, query: str, params: tuple = (), batch_size: int = 1000
+    ) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """For MySQL, an unbuffered cursor reads rows off the socket as they are fetched"""
+        if db.db_type != DatabaseType.MYSQL:
+            raise ValueError(f"Expected MySQL connection, got {db.db_type}")
+
+        with db.streaming() as conn:
+            borrowed = db.is_pinned()
+            cursor = conn.cursor(buffered=False)
+            finished = False
+            try:
+                cursor.execute(query, params)
+                columns = [desc[0] for desc in cursor.description]
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield columns, rows
+                finished = True
+                cursor.close()
+                conn.commit()
+            except BaseException as e:
+                if not finished and not borrowed:
+                    # The rest of the result is still on the wire, dropping the
+                    # connection is cheaper than reading it to the end
+                    conn.close()
+                elif not finished:
+                    # A pin or transaction goes on using the connection, read the
+                    # rest off the wire; a failed statement dooms the transaction
+                    self._drain(cursor, batch_size)
+                    if isinstance(e, Exception):
+                        conn.rollback()
+                if isinstance(e, Exception):
+                    raise Exception from e
+                raise
+
+    @staticmethod
+    def _drain(cursor: Any, batch_size: int):
+        """Read and drop the unread rows of an unbuffered cursor, then close it"""
         try:
-            cursor.execute(f"DESCRIBE {table_name}")
-            column_info = cursor.fetchall()
-            column_names = [col[0] for col in column_info]
+            while cursor.fetchmany(batch_size):
+                pass
             cursor.close()
-            return column_names
+        except Exception:
+            # The connection is broken, its next statement reports that
+            pass
+
+    def execute_batch(
+        self, db: BaseDC, statements: List[Tuple[str, tuple]]
+    ) -> List[int]:
+        if db.db_type != DatabaseType.MYSQL:
+            raise ValueError(f"Expected MySQL connection, got {db.db_type}")
+
+        return self._retrying(
+            db, False, lambda conn: self._execute_batch(conn, statements)
+        )
+
+    def _execute_batch(
+        self, conn: Any, statements: List[Tuple[str, tuple]]
+    ) -> List[int]:
+        cursor = conn.cursor()
+
+        try:
+            rowcounts = []
+            for query, params in statements:
+                cursor.execute(query, params)
+                if cursor.with_rows:
+                    cursor.fetchall()
+                rowcounts.append(cursor.rowcount)
+            conn.commit()
+            cursor.close()
+            return rowcounts
+
         except Exception as e:
+            conn.rollback()
             if cursor:
                 cursor.close()
-            raise e
+            raise Exception from e
+
+    def describe_table(self, db: BaseDC, table_name: str) -> TableSchema:
+        with db.checkout() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(f"DESCRIBE {table_name}")
+                column_info = cursor.fetchall()
+                cursor.close()
+            except Exception as e:
+                if cursor:
+                    cursor.close()
+                raise e
+
+        # DESCRIBE rows are (Field, Type, Null, Key, Default, Extra)
+        primary_key = next((col[0] for col in column_info if col[3] == "PRI"), None)
+        return TableSchema(
+            table_name,
+            [col[0] for col in column_info],
+            {col[0]: col[1] for col in column_info},
+            primary_key,
+        )
 
     def handle_insert_result(
         self,
@@ -125,15 +401,14 @@ class MySQLOperations(BaseOperations):
             raise Exception("Failed to get inserted record ID")
 
         # Fetch the created record
-        select_query = f"SELECT * FROM {table_name} WHERE {primary_key} = %s"
+        select_query = self.select_by_pk_sql(table_name, primary_key)
         result = self.execute_query(db, select_query, (last_id,), fetch=True)
 
-        if not result:
+        if not result or not result["result"]:
             raise Exception(f"Failed to retrieve created record with ID {last_id}")
 
-        # Get column names and create instance data
-        column_names = self.get_column_names(db, table_name)
-        return dict(zip(column_names, result["result"][0]))
+        # Column names come from the SELECT itself, no DESCRIBE round trip
+        return self.row_to_dict(db, table_name, result, result["result"][0])
 
     def handle_update_result(
         self,
@@ -145,12 +420,11 @@ class MySQLOperations(BaseOperations):
     ) -> Dict[str, Any]:
         """For MySQL, we need to fetch the updated record"""
         # Fetch the updated record
-        select_query = f"SELECT * FROM {table_name} WHERE {primary_key} = %s"
+        select_query = self.select_by_pk_sql(table_name, primary_key)
         result = self.execute_query(db, select_query, (pk_value,), fetch=True)
 
-        if not result:
+        if not result or not result["result"]:
             raise Exception(f"Failed to retrieve updated record with ID {pk_value}")
 
-        # Get column names and create instance data
-        column_names = self.get_column_names(db, table_name)
-        return dict(zip(column_names, result["result"][0]))
+        # Column names come from the SELECT itself, no DESCRIBE round trip
+        return self.row_to_dict(db, table_name, result, result["result"][0])
@@ -0,0 +1,51 @@
+import psycopg
+from typing import Any
+from ..base.declare import AsyncBaseDC, DatabaseType
+from ..log import Logger
+
+Log = Logger()
+log = Log.log
+
+
+class AsyncDatabaseConnection(AsyncBaseDC):
+    """Manages PostgreSQL connections using psycopg3's AsyncConnection"""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 5432,
+        database: str = "postgres",
+        user: str = "postgres",
+        password: str = "password",
+        pool_size: int = 1,
+    ):
+        super().__init__(DatabaseType.POSTGRESQL, pool_size)
+        self.connection_params = {
+            "host": host,
+            "port": port,
+            "dbname": database,
+            "user": user,
+            "password": password,
+        }
+
+    async def open_connection(self) -> Any:
+        try:
+            conn = await psycopg.AsyncConnection.connect(**self.connection_params)
+            log(
+                f"Connected to PostgreSQL database: {self.connection_params['dbname']}",
+                "DEBUG",
+            )
+            return conn
+        except Exception as e:
+            log(f"Error connecting to database: {e}", "ERROR")
+            raise
+
+    async def close_connection(self, conn: Any):
+        await conn.close()
+
+    async def disconnect(self):
+        await super().disconnect()
+        log(f"{self} Database connection closed", "DEBUG")
+
+    def __repr__(self) -> str:
+        return f"{self.connection_params['host']}:{self.connection_params['port']}@{self.connection_params['dbname']}"
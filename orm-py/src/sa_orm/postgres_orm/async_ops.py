@@ -0,0 +1,92 @@
+from typing import Any, Dict, List, Tuple
+from ..base.async_ops import AsyncBaseOperations
+from ..base.declare import AsyncBaseDC, DatabaseType
+from .ops import PostgreSQLOperations
+
+
+class AsyncPostgreSQLOperations(AsyncBaseOperations):
+    """PostgreSQL-specific database operations on psycopg AsyncConnection"""
+
+    dialect = PostgreSQLOperations()
+
+    async def execute_query(
+        self, db: AsyncBaseDC, query: str, params: tuple = (), fetch: bool = False
+    ) -> Any:
+        if db.db_type != DatabaseType.POSTGRESQL:
+            raise ValueError(f"Expected PostgreSQL connection, got {db.db_type}")
+
+        async with db.checkout() as conn:
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(query, params)
+                    columns = (
+                        [desc[0] for desc in cursor.description]
+                        if cursor.description
+                        else None
+                    )
+                    result, lastrowid = None, None
+                    if fetch and cursor.description:
+                        result = await cursor.fetchall()
+                        lastrowid = result[-1][0] if result else None
+                    rowcount = cursor.rowcount
+                await conn.commit()
+                return {
+                    "result": result,
+                    "lastrowid": lastrowid,
+                    "rowcount": rowcount,
+                    "columns": columns,
+                }
+
+            except Exception as e:
+                await conn.rollback()
+                raise Exception from e
+
+    async def execute_batch(
+        self, db: AsyncBaseDC, statements: List[Tuple[str, tuple]]
+    ) -> List[int]:
+        if db.db_type != DatabaseType.POSTGRESQL:
+            raise ValueError(f"Expected PostgreSQL connection, got {db.db_type}")
+
+        async with db.checkout() as conn:
+            try:
+                rowcounts = []
+                async with conn.cursor() as cursor:
+                    for query, params in statements:
+                        await cursor.execute(query, params)
+                        rowcounts.append(cursor.rowcount)
+                await conn.commit()
+                return rowcounts
+
+            except Exception as e:
+                await conn.rollback()
+                raise Exception from e
+
+    async def handle_insert_result(
+        self,
+        db: AsyncBaseDC,
+        table_name: str,
+        primary_key: str,
+        insert_result: Any,
+        insert_params: tuple,
+    ) -> Dict[str, Any]:
+        """For PostgreSQL, the RETURNING clause gives us the created record directly"""
+        if not insert_result["result"]:
+            raise Exception("Failed to create record")
+        return self.row_to_dict(
+            db, table_name, insert_result, insert_result["result"][0]
+        )
+
+    async def handle_update_result(
+        self,
+        db: AsyncBaseDC,
+        table_name: str,
+        primary_key: str,
+        pk_value: Any,
+        update_result: Any,
+    ) -> Dict[str, Any]:
+        """For PostgreSQL, the RETURNING clause gives us the updated record directly"""
+        if not update_result["result"]:
+            raise Exception(f"Failed to update record with ID {pk_value}")
+        return self.row_to_dict(
+            db, table_name, update_result, update_result["result"][0]
+        )
@@ -1,5 +1,5 @@
 import psycopg
-from typing import Any
+from typing import Any, Dict, Optional
 from ..base.declare import BaseDC, DatabaseType
 from ..log import Logger
 
@@ -18,6 +18,8 @@ class DatabaseConnection(BaseDC):
         database: str = "postgres",
         user: str = "postgres",
         password: str = "password",
+        pool: Optional[Dict[str, Any]] = None,
+        prepared: Optional[Dict[str, Any]] = None,
     ):
         super().__init__(DatabaseType.POSTGRESQL)
         self.connection_params = {
@@ -28,11 +30,19 @@ class DatabaseConnection(BaseDC):
             "password": password,
         }
         self._connection = None
+        if pool is not None:
+            self.enable_pool(**pool)
+        if prepared is not None:
+            self.enable_prepared_statements(**prepared)
+
+    def open_connection(self) -> Any:
+        conn = psycopg.connect(**self.connection_params)
+        conn.autocommit = False
+        return conn
 
     def connect(self) -> Any:
         try:
-            self._connection = psycopg.connect(**self.connection_params)
-            self._connection.autocommit = False
+            self._connection = self.open_connection()
             log(
                 f"Connected to PostgreSQL database: {self.connection_params['dbname']}",
                 "DEBUG",
@@ -52,6 +62,8 @@ class DatabaseConnection(BaseDC):
             raise
 
     def disconnect(self):
+        if self._pool is not None:
+            self._pool.close()
         if self._connection:
             self._connection.close()
             log(
@@ -1,9 +1,17 @@
-from typing import Dict, List, Any
-from ..base.ops import BaseOperations
+import uuid
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from ..base.ops import BaseOperations, cached_sql
 from ..base.declare import BaseDC, DatabaseType
+from ..base.keyset import SortKey
+from ..base.prepared import StatementCache
+from ..base.schema import TableSchema
 
 
 class PostgreSQLOperations(BaseOperations):
+    # The extended query protocol caps bind parameters at 65535
+    max_bind_params = 65535
+    returning = True
+
     def create_table_sql(
         self,
         table_name: str,
@@ -29,6 +37,7 @@ class PostgreSQLOperations(BaseOperations):
         )
         """
 
+    @cached_sql
     def insert_sql(self, table_name: str, columns: List[str]) -> str:
         placeholders = ["%s"] * len(columns)
         return f"""
@@ -37,6 +46,100 @@ class PostgreSQLOperations(BaseOperations):
         RETURNING *
         """
 
+    @cached_sql
+    def bulk_insert_sql(
+        self, table_name: str, columns: List[str], row_count: int
+    ) -> str:
+        return f"""
+        {super().bulk_insert_sql(table_name, columns, row_count)}
+        RETURNING *
+        """
+
+    def keyset_predicate(
+        self, order: List[SortKey], values: List[Any]
+    ) -> Tuple[str, tuple]:
+        """For PostgreSQL, a row comparison when every key sorts the same way
+
+        `(a, b) > (x, y)` matches a composite index as a single range condition.
+        """
+        directions = {descending for _, descending in order}
+        if len(directions) > 1 or len(order) == 1:
+            return super().keyset_predicate(order, values)
+
+        columns = ", ".join(column for column, _ in order)
+        placeholders = ", ".join(["%s"] * len(order))
+        operator = "<" if directions.pop() else ">"
+        return f"(({columns}) {operator} ({placeholders}))", tuple(values)
+
+    def bulk_insert(
+        self,
+        db: BaseDC,
+        table_name: str,
+        primary_key: str,
+        columns: List[str],
+        rows: List[tuple],
+    ) -> List[Dict[str, Any]]:
+        """For PostgreSQL, a multi-row INSERT ... RETURNING * gives back every created record"""
+        records = []
+        for batch in self.batch_rows(rows, len(columns)):
+            query = self.bulk_insert_sql(table_name, columns, len(batch))
+            params = tuple(value for row in batch for value in row)
+            result = self.execute_query(db, query, params, fetch=True)
+            records.extend(
+                self.row_to_dict(db, table_name, result, row)
+                for row in result["result"]
+            )
+        return records
+
+    def bulk_copy(
+        self, db: BaseDC, table_name: str, columns: List[str], rows: List[tuple]
+    ) -> int:
+        """For PostgreSQL, rows are streamed with COPY ... FROM STDIN"""
+        if db.db_type != DatabaseType.POSTGRESQL:
+            raise ValueError(f"Expected PostgreSQL connection, got {db.db_type}")
+
+        query = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN"
+
+        with db.checkout() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    with cursor.copy(query) as copy:
+                        for row in rows:
+                            copy.write_row(row)
+                conn.commit()
+                return len(rows)
+
+            except Exception as e:
+                conn.rollback()
+                raise Exception from e
+
+    @cached_sql
+    def upsert_sql(
+        self,
+        table_name: str,
+        columns: List[str],
+        conflict_on: List[str],
+        row_count: int = 1,
+    ) -> str:
+        return f"""
+        {super().upsert_sql(table_name, columns, conflict_on, row_count)}
+        RETURNING *
+        """
+
+    def row_hash_sql(self, columns: Tuple[str, ...]) -> str:
+        """For PostgreSQL, values are length-prefixed so a '|' inside one is no separator
+
+        A flag per column tells NULLs apart from empty strings.
+        """
+        values = ", ".join(f"CONCAT(LENGTH({c}::text), ':', {c})" for c in columns)
+        nulls = f"CONCAT({', '.join(f'({c} IS NULL)::int' for c in columns)})"
+        return f"MD5(CONCAT_WS('|', {values}, {nulls}))"
+
+    def hash_sum_sql(self, row_hash: str) -> str:
+        # SUM of BIGINT is NUMERIC, no overflow on large tables
+        return f"COALESCE(SUM(('x' || SUBSTR({row_hash}, 1, 15))::bit(60)::bigint), 0)"
+
+    @cached_sql
     def update_sql(self, table_name: str, columns: List[str], primary_key: str) -> str:
         placeholders = [f"{col} = %s" for col in columns]
         return f"""
@@ -46,19 +149,60 @@ class PostgreSQLOperations(BaseOperations):
         RETURNING *
         """
 
+    def condition_sql(self, column: str, lookup: str, arity: int) -> str:
+        if lookup == "ilike":
+            return f"{column} ILIKE %s"
+        return super().condition_sql(column, lookup, arity)
+
     def execute_query(
         self, db: BaseDC, query: str, params: tuple = (), fetch: bool = False
     ) -> Any:
         if db.db_type != DatabaseType.POSTGRESQL:
             raise ValueError(f"Expected PostgreSQL connection, got {db.db_type}")
 
-        conn = db.connection
+        with db.checkout() as conn:
+            return self._execute(conn, query, params, fetch, db.statement_cache)
+
+    def _prepare_flag(
+        self,
+        conn: Any,
+        query: str,
+        params: tuple,
+        statements: Optional[StatementCache],
+    ) -> Optional[bool]:
+        """`prepare` argument of cursor.execute(), None leaves it to psycopg"""
+        if statements is None:
+            return None
+        if not params:
+            return False
+
+        def prepare(sql: str) -> bool:
+            # psycopg keeps the prepared statements itself, with the same LRU
+            # bound it evicts the same ones as the cache does
+            conn.prepared_max = statements.max_size
+            return True
 
+        return statements.get(conn, query, prepare) is not None
+
+    def _execute(
+        self,
+        conn: Any,
+        query: str,
+        params: tuple,
+        fetch: bool,
+        statements: Optional[StatementCache] = None,
+    ) -> Any:
+        prepare = self._prepare_flag(conn, query, params, statements)
         try:
             with conn.cursor() as cursor:
-                cursor.execute(query, params)
+                cursor.execute(query, params, prepare=prepare)
 
                 if fetch:
+                    columns = (
+                        [desc[0] for desc in cursor.description]
+                        if cursor.description
+                        else None
+                    )
                     if (
                         query.strip().upper().startswith("SELECT")
                         or "RETURNING" in query.upper()
@@ -70,19 +214,23 @@ class PostgreSQLOperations(BaseOperations):
                             else None
                         )
                         rowsAff = cursor.rowcount
+                        conn.commit()
                         return {
                             "result": result,
                             "lastrowid": lastrowid,
                             "rowcount": rowsAff,
+                            "columns": columns,
                         }
                     else:
                         result = cursor.fetchone() if cursor.rowcount > 0 else None
                         lastrowid = result[0] if result is not None else None
                         rowsAff = cursor.rowcount
+                        conn.commit()
                         return {
                             "result": result,
                             "lastrowid": lastrowid,
                             "rowcount": rowsAff,
+                            "columns": columns,
                         }
 
                 conn.commit()
@@ -91,13 +239,90 @@ class PostgreSQLOperations(BaseOperations):
 
         except Exception as e:
             conn.rollback()
+            if statements is not None:
+                # psycopg deallocates every prepared statement on rollback
+                statements.forget(conn)
             raise Exception from e
 
-    def get_column_names(self, db: BaseDC, table_name: str) -> List[str]:
-        with db.connection.cursor() as cursor:
-            # Use a simple SELECT to get column names from cursor description
-            cursor.execute(f"SELECT * FROM {table_name} LIMIT 0")
-            return [desc[0] for desc in cursor.description]
+    def iter_query(
+        self, db: BaseDC, query: str, params: tuple = (), batch_size: int = 1000
+    ) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """For PostgreSQL, a named (server-side) cursor sends `batch_size` rows per round trip"""
+        if db.db_type != DatabaseType.POSTGRESQL:
+            raise ValueError(f"Expected PostgreSQL connection, got {db.db_type}")
+
+        with db.streaming() as conn:
+            borrowed = db.is_pinned()
+            try:
+                with conn.cursor(name=f"sa_orm_iter_{uuid.uuid4().hex}") as cursor:
+                    cursor.itersize = batch_size
+                    cursor.execute(query, params)
+                    columns = [desc[0] for desc in cursor.description]
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        yield columns, rows
+                conn.commit()
+
+            except BaseException as e:
+                if isinstance(e, Exception) or not borrowed:
+                    # Also ends the transaction of a stream that was not read to
+                    # the end. A stream abandoned on the connection of a pin or
+                    # transaction only closes its cursor, their transaction goes on
+                    conn.rollback()
+                if isinstance(e, Exception):
+                    raise Exception from e
+                raise
+
+    def execute_batch(
+        self, db: BaseDC, statements: List[Tuple[str, tuple]]
+    ) -> List[int]:
+        if db.db_type != DatabaseType.POSTGRESQL:
+            raise ValueError(f"Expected PostgreSQL connection, got {db.db_type}")
+
+        with db.checkout() as conn:
+            try:
+                rowcounts = []
+                with conn.cursor() as cursor:
+                    for query, params in statements:
+                        cursor.execute(query, params)
+                        rowcounts.append(cursor.rowcount)
+                conn.commit()
+                return rowcounts
+
+            except Exception as e:
+                conn.rollback()
+                raise Exception from e
+
+    def describe_table(self, db: BaseDC, table_name: str) -> TableSchema:
+        query = """
+        SELECT c.column_name, c.data_type, kcu.column_name IS NOT NULL
+        FROM information_schema.columns c
+        LEFT JOIN information_schema.table_constraints tc
+            ON tc.table_schema = c.table_schema
+            AND tc.table_name = c.table_name
+            AND tc.constraint_type = 'PRIMARY KEY'
+        LEFT JOIN information_schema.key_column_usage kcu
+            ON kcu.constraint_name = tc.constraint_name
+            AND kcu.table_schema = tc.table_schema
+            AND kcu.column_name = c.column_name
+        WHERE c.table_schema = current_schema() AND c.table_name = %s
+        ORDER BY c.ordinal_position
+        """
+        with db.checkout() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, (table_name,))
+                column_info = cursor.fetchall()
+            conn.commit()
+
+        primary_key = next((col[0] for col in column_info if col[2]), None)
+        return TableSchema(
+            table_name,
+            [col[0] for col in column_info],
+            {col[0]: col[1] for col in column_info},
+            primary_key,
+        )
 
     def handle_insert_result(
         self,
@@ -111,9 +336,9 @@ class PostgreSQLOperations(BaseOperations):
         if not insert_result["result"]:
             raise Exception("Failed to create record")
 
-        # Get column names
-        column_names = self.get_column_names(db, table_name)
-        return dict(zip(column_names, insert_result["result"][0]))
+        return self.row_to_dict(
+            db, table_name, insert_result, insert_result["result"][0]
+        )
 
     def handle_update_result(
         self,
@@ -127,6 +352,6 @@ class PostgreSQLOperations(BaseOperations):
         if not update_result["result"]:
             raise Exception(f"Failed to update record with ID {pk_value}")
 
-        # Get column names
-        column_names = self.get_column_names(db, table_name)
-        return dict(zip(column_names, update_result["result"][0]))
+        return self.row_to_dict(
+            db, table_name, update_result, update_result["result"][0]
+        )
@@ -0,0 +1,287 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .base.keyset import SortKey, is_identifier, parse_sort_keys
+from .base.ops import BaseOperations, Condition
+from .base.shapes import SHAPES, check_shape, collect_columns, shape_rows
+from .base_model import OperationsFactory, log, log_op
+
+if TYPE_CHECKING:
+    from .base_model import BaseModel
+
+# Lookups accepted by Query.where(), e.g. age__gte=18 or name__in=["a", "b"]
+LOOKUPS = (
+    "eq",
+    "ne",
+    "gt",
+    "gte",
+    "lt",
+    "lte",
+    "in",
+    "not_in",
+    "like",
+    "ilike",
+    "isnull",
+)
+
+
+class Query:
+    """Chainable SELECT on a model's table (reads from primary database only)
+
+    Every method returns a new Query, so a partial query can be reused:
+
+        adults = User.query().where(age__gte=18)
+        names = adults.select("u_id", "name").order_by("-age").limit(100).all()
+
+    The SQL is generated by the database's operations class and cached by the
+    shape of the query (table, columns, lookups, ordering), so repeating a query
+    with other values reuses the compiled statement.
+    """
+
+    def __init__(self, model: Type["BaseModel"]):
+        self.model = model
+        self._columns: Optional[Tuple[str, ...]] = None
+        self._conditions: Tuple[Condition, ...] = ()
+        self._where: Tuple[str, ...] = ()
+        self._params: Tuple[Any, ...] = ()
+        self._raw_params: Tuple[Any, ...] = ()
+        self._order: Tuple[SortKey, ...] = ()
+        self._limit: Optional[int] = None
+        self._offset: Optional[int] = None
+
+    def _copy(self, **changes) -> "Query":
+        query = Query.__new__(Query)
+        query.__dict__.update(self.__dict__)
+        query.__dict__.update(changes)
+        return query
+
+    def select(self, *columns: str) -> "Query":
+        """Only read these columns, instances get just these attributes"""
+        for column in columns:
+            if not is_identifier(column):
+                raise ValueError(f"Invalid column name: {column!r}")
+        return self._copy(_columns=tuple(columns) or None)
+
+    def where(self, raw: Optional[str] = None, *params: Any, **lookups: Any) -> "Query":
+        """Add conditions, all ANDed with the ones already there
+
+        `raw` is an SQL fragment with `%s` placeholders for `params`. Keyword
+        lookups are `column=value` or `column__<lookup>=value` with lookup in
+        LOOKUPS; `=None`/`__ne=None` become IS NULL/IS NOT NULL.
+        """
+        conditions, values = list(self._conditions), list(self._params)
+        where, raw_params = self._where, self._raw_params
+        if raw is not None:
+            where, raw_params = where + (raw,), raw_params + params
+        elif params:
+            raise ValueError("Parameters given without a raw condition")
+
+        for key, value in lookups.items():
+            column, _, lookup = key.partition("__")
+            lookup = lookup or "eq"
+            if not is_identifier(column):
+                raise ValueError(f"Invalid column name: {column!r}")
+            if lookup not in LOOKUPS:
+                raise ValueError(
+                    f"Unsupported lookup {lookup!r}, expected one of {LOOKUPS}"
+                )
+
+            if lookup in ("eq", "ne") and value is None:
+                lookup, value = "isnull", lookup == "eq"
+            if lookup == "isnull":
+                conditions.append((column, "isnull" if value else "notnull", 0))
+            elif lookup in ("in", "not_in"):
+                value = list(value)
+                conditions.append((column, lookup, len(value)))
+                values.extend(value)
+            else:
+                conditions.append((column, lookup, 1))
+                values.append(value)
+
+        return self._copy(
+            _conditions=tuple(conditions),
+            _params=tuple(values),
+            _where=where,
+            _raw_params=raw_params,
+        )
+
+    def order_by(self, *keys: str) -> "Query":
+        """Sort by `"col"`, `"-col"` or `"col DESC"` keys, replacing any earlier order"""
+        return self._copy(_order=tuple(parse_sort_keys(list(keys))))
+
+    def limit(self, count: int) -> "Query":
+        if count < 0:
+            raise ValueError("limit must not be negative")
+        return self._copy(_limit=count)
+
+    def offset(self, count: int) -> "Query":
+        if count < 0:
+            raise ValueError("offset must not be negative")
+        return self._copy(_offset=count)
+
+    def all(self, as_: str = "models") -> Union[List[Any], Dict[str, Any]]:
+        """Run the query and return the matching instances, or rows shaped by `as_`
+
+        See BaseModel.find_all() for the "tuples", "dicts" and "columns" shapes.
+        """
+        check_shape(as_)
+        ops = self._ops("query")
+        query, params = self.compile(ops)
+        if as_ == "columns":
+            return self._columns_of(ops, query, params)
+
+        result = self._execute(ops, query, params)
+        if as_ != "models":
+            return shape_rows(as_, result["columns"], result["result"])
+        return [self._instance(ops, result["columns"], row) for row in result["result"]]
+
+    def first(self) -> Optional["BaseModel"]:
+        """First matching instance, or None"""
+        rows = self.limit(1).all()
+        return rows[0] if rows else None
+
+    def count(self) -> int:
+        """Number of matching rows (ordering, limit and offset are ignored)"""
+        ops = self._ops("count")
+        query = ops.select_sql(
+            self.model._table_name, ("COUNT(*)",), self._conditions, self._where
+        )
+        result = self._execute(ops, query, self._params + self._raw_params)
+        return int(result["result"][0][0])
+
+    def iter(self, batch_size: int = 1000, as_: str = "models") -> Iterator[Any]:
+        """Stream the matching instances (or "tuples"/"dicts") like BaseModel.iter_all()"""
+        check_shape(as_, SHAPES[:3])
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        ops = self._ops("query")
+        query, params = self.compile(ops)
+        return self._stream(ops, query, params, batch_size, as_)
+
+    def __iter__(self) -> Iterator["BaseModel"]:
+        return iter(self.all())
+
+    def compile(self, ops: Optional[BaseOperations] = None) -> Tuple[str, tuple]:
+        """The SQL and parameters the query runs, on the primary unless `ops` is given"""
+        ops = ops or OperationsFactory.get_operations(self.model._db)
+        query = ops.select_sql(
+            self.model._table_name,
+            self._columns,
+            self._conditions,
+            self._where,
+            self._order,
+            self._limit is not None,
+            self._offset is not None,
+        )
+        # Same order as the clauses: lookups, raw fragments, LIMIT, OFFSET
+        params = self._params + self._raw_params
+        if self._limit is not None:
+            params += (self._limit,)
+        if self._offset is not None:
+            params += (self._offset,)
+        return query, params
+
+    def _ops(self, action: str) -> BaseOperations:
+        model = self.model
+        if not model._table_name:
+            log_op(
+                action=action,
+                table=f"{model._db}:{model._table_name}",
+                success=False,
+                metadata={"payload": "Table name not specified"},
+            )
+            raise ValueError("Table name not specified")
+
+        if not model._db:
+            log_op(
+                action=action,
+                table=f"{model._db}:{model._table_name}",
+                success=False,
+                metadata={
+                    "payload": "Database connection not set. Use set_database() first."
+                },
+            )
+            raise ValueError("Database connection not set. Use set_database() first.")
+
+        return OperationsFactory.get_operations(model._db)
+
+    def _execute(self, ops: BaseOperations, query: str, params: tuple) -> Dict:
+        try:
+            return ops.execute_query(self.model._db, query, params, fetch=True)
+        except Exception as e:
+            log_op(
+                action="query",
+                table=f"{self.model._db}:{self.model._table_name}",
+                success=False,
+                metadata={"payload": f"Query execution error: {e}"},
+            )
+            log(f"Query execution error: {e}", "ERROR")
+            raise
+
+    def _instance(self, ops: BaseOperations, columns: List[str], row: tuple):
+        # Only a full SELECT * may seed the table's cached column list
+        if self._columns is None:
+            ops.remember_columns(self.model._db, self.model._table_name, columns)
+        return self.model._loaded(dict(zip(columns, row)))
+
+    def _columns_of(
+        self, ops: BaseOperations, query: str, params: tuple
+    ) -> Dict[str, Any]:
+        try:
+            columns = collect_columns(ops.iter_query(self.model._db, query, params))
+        except Exception as e:
+            log_op(
+                action="query",
+                table=f"{self.model._db}:{self.model._table_name}",
+                success=False,
+                metadata={"payload": f"Query execution error: {e}"},
+            )
+            log(f"Query execution error: {e}", "ERROR")
+            raise
+
+        if columns is None:
+            names = self._columns or ops.get_column_names(
+                self.model._db, self.model._table_name
+            )
+            columns = shape_rows("columns", names, [])
+        return columns
+
+    def _stream(
+        self,
+        ops: BaseOperations,
+        query: str,
+        params: tuple,
+        batch_size: int,
+        as_: str = "models",
+    ) -> Iterator[Any]:
+        try:
+            for columns, rows in ops.iter_query(
+                self.model._db, query, params, batch_size
+            ):
+                if as_ != "models":
+                    yield from shape_rows(as_, columns, rows)
+                    continue
+                for row in rows:
+                    yield self._instance(ops, columns, row)
+
+        except Exception as e:
+            log_op(
+                action="query",
+                table=f"{self.model._db}:{self.model._table_name}",
+                success=False,
+                metadata={"payload": f"Query execution error: {e}"},
+            )
+            log(f"Query execution error: {e}", "ERROR")
+            raise
+
+    def __repr__(self) -> str:
+        return f"Query({self.model.__name__}, {self._conditions}, {self._where})"
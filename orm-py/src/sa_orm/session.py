@@ -0,0 +1,82 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple, Type
+
+
+class Session:
+    """Identity map: at most one instance per (model, primary key)
+
+    Only models with a record cache (`enable_record_cache()`) take part.
+    Repeated `find_by_id()` calls inside a session return the very same
+    instance without a query; `find_all()` and `create()` add to the map.
+
+    The session also remembers when it last wrote, read routing keeps its
+    reads on the primary for a while after that (read-your-writes).
+    """
+
+    def __init__(self):
+        self._identities: Dict[Tuple[type, Hashable], Any] = {}
+        self.hits = 0
+        self.last_write: Optional[float] = None
+
+    def mark_write(self):
+        self.last_write = time.monotonic()
+
+    def wrote_within(self, seconds: float) -> bool:
+        return (
+            self.last_write is not None and time.monotonic() - self.last_write < seconds
+        )
+
+    def get(self, model: Type, pk: Hashable) -> Optional[Any]:
+        instance = self._identities.get((model, pk))
+        if instance is not None:
+            self.hits += 1
+        return instance
+
+    def add(self, model: Type, pk: Hashable, instance: Any) -> Any:
+        """Register `instance`, an instance already mapped to the key wins"""
+        return self._identities.setdefault((model, pk), instance)
+
+    def put(self, model: Type, pk: Hashable, instance: Any):
+        self._identities[(model, pk)] = instance
+
+    def discard(self, model: Type, pk: Hashable):
+        self._identities.pop((model, pk), None)
+
+    def discard_model(self, model: Type):
+        for key in [key for key in self._identities if key[0] is model]:
+            del self._identities[key]
+
+    def clear(self):
+        self._identities.clear()
+
+    def __len__(self) -> int:
+        return len(self._identities)
+
+
+_current: ContextVar[Optional[Session]] = ContextVar("sa_orm_session", default=None)
+
+
+def current_session() -> Optional[Session]:
+    return _current.get()
+
+
+@contextmanager
+def session() -> Iterator[Session]:
+    """Open an identity map for the block, e.g. one per request
+
+    Context variables keep sessions of different threads and asyncio tasks
+    apart; a nested `session()` joins the one already open.
+    """
+    existing = _current.get()
+    if existing is not None:
+        yield existing
+        return
+
+    new_session = Session()
+    token = _current.set(new_session)
+    try:
+        yield new_session
+    finally:
+        _current.reset(token)
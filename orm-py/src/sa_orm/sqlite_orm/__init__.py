@@ -0,0 +1,3 @@
+from .ops import SQLiteOperations
+
+__all__ = ["SQLiteOperations"]
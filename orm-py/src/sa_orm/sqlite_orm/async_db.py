@@ -0,0 +1,57 @@
+import asyncio
+from typing import Any
+from ..base.declare import AsyncBaseDC, DatabaseType
+from ..log import Logger
+from .db import MEMORY, SQLiteSettings
+
+Log = Logger()
+log = Log.log
+
+
+class AsyncDatabaseConnection(AsyncBaseDC):
+    """Manages SQLite connections for AsyncBaseModel
+
+    sqlite3 has no asyncio interface, statements run on worker threads with
+    `asyncio.to_thread` so the event loop is never blocked.
+    """
+
+    def __init__(
+        self,
+        database: str = MEMORY,
+        pool_size: int = 1,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        cache_size: int = -64000,
+        mmap_size: int = 256 * 1024 * 1024,
+        busy_timeout: float = 5.0,
+    ):
+        super().__init__(DatabaseType.SQLITE, pool_size)
+        self.settings = SQLiteSettings(
+            database, journal_mode, synchronous, cache_size, mmap_size, busy_timeout
+        )
+
+    async def open_connection(self) -> Any:
+        try:
+            conn = await asyncio.to_thread(self.settings.open)
+            log(f"Connected to SQLite database: {self.settings.database}", "DEBUG")
+            return conn
+        except Exception as e:
+            log(f"Error connecting to database: {e}", "ERROR")
+            raise
+
+    async def close_connection(self, conn: Any):
+        await asyncio.to_thread(conn.close)
+
+    def is_usable(self, conn: Any) -> bool:
+        try:
+            conn.total_changes
+            return True
+        except Exception:
+            return False
+
+    async def disconnect(self):
+        await super().disconnect()
+        log(f"{self} Database connection closed", "DEBUG")
+
+    def __repr__(self) -> str:
+        return f"sqlite@{self.settings.name}"
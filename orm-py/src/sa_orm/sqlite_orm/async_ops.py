@@ -0,0 +1,82 @@
+import asyncio
+from typing import Any, Dict, List, Tuple
+from ..base.async_ops import AsyncBaseOperations
+from ..base.declare import AsyncBaseDC, DatabaseType
+from .ops import SQLiteOperations
+
+
+class AsyncSQLiteOperations(AsyncBaseOperations):
+    """SQLite-specific database operations, run on worker threads"""
+
+    dialect = SQLiteOperations()
+
+    async def execute_query(
+        self,
+        db: AsyncBaseDC,
+        query: str,
+        params: tuple = (),
+        fetch: bool = False,
+    ) -> Any:
+        if db.db_type != DatabaseType.SQLITE:
+            raise ValueError(f"Expected SQLite connection, got {db.db_type}")
+
+        async with db.checkout() as conn:
+            return await asyncio.to_thread(
+                self.dialect._execute, conn, query, params, fetch
+            )
+
+    async def execute_batch(
+        self, db: AsyncBaseDC, statements: List[Tuple[str, tuple]]
+    ) -> List[int]:
+        if db.db_type != DatabaseType.SQLITE:
+            raise ValueError(f"Expected SQLite connection, got {db.db_type}")
+
+        async with db.checkout() as conn:
+            return await asyncio.to_thread(
+                self.dialect._execute_batch, conn, statements
+            )
+
+    async def handle_insert_result(
+        self,
+        db: AsyncBaseDC,
+        table_name: str,
+        primary_key: str,
+        insert_result: Any,
+        insert_params: tuple,
+    ) -> Dict[str, Any]:
+        """For SQLite, the RETURNING clause gives us the created record directly"""
+        if insert_result["result"]:
+            return self.row_to_dict(
+                db, table_name, insert_result, insert_result["result"][0]
+            )
+        if not insert_result.get("lastrowid"):
+            raise Exception("Failed to create record")
+        return await self._select_by_pk(
+            db, table_name, primary_key, insert_result["lastrowid"]
+        )
+
+    async def handle_update_result(
+        self,
+        db: AsyncBaseDC,
+        table_name: str,
+        primary_key: str,
+        pk_value: Any,
+        update_result: Any,
+    ) -> Dict[str, Any]:
+        """For SQLite, the RETURNING clause gives us the updated record directly"""
+        if update_result["result"]:
+            return self.row_to_dict(
+                db, table_name, update_result, update_result["result"][0]
+            )
+        return await self._select_by_pk(db, table_name, primary_key, pk_value)
+
+    async def _select_by_pk(
+        self, db: AsyncBaseDC, table_name: str, primary_key: str, pk_value: Any
+    ) -> Dict[str, Any]:
+        select_query = self.dialect.select_by_pk_sql(table_name, primary_key)
+        result = await self.execute_query(db, select_query, (pk_value,), fetch=True)
+
+        if not result["result"]:
+            raise Exception(f"Failed to retrieve record with ID {pk_value}")
+
+        return self.row_to_dict(db, table_name, result, result["result"][0])
@@ -0,0 +1,165 @@
+import hashlib
+import itertools
+import sqlite3
+from typing import Any, Dict, Optional
+from ..base.declare import BaseDC, DatabaseType
+from ..log import Logger
+
+Log = Logger()
+log = Log.log
+
+MEMORY = ":memory:"
+
+_memory_ids = itertools.count(1)
+
+
+def row_hash(*values: Any) -> str:
+    """sa_orm_row_hash(): MD5 of the values like MySQL/PostgreSQL row_hash_sql()"""
+    present = [str(value) for value in values if value is not None]
+    text = "|".join(f"{len(value)}:{value}" for value in present)
+    nulls = "".join("1" if value is None else "0" for value in values)
+    return hashlib.md5(f"{text}|{nulls}".encode()).hexdigest()
+
+
+class HashSum:
+    """sa_orm_hash_sum(): sum of the leading 60 bits of row hashes
+
+    Returned as text, the sum outgrows SQLite's 64-bit integers.
+    """
+
+    def __init__(self):
+        self.total = 0
+
+    def step(self, value: Optional[str]):
+        if value is not None:
+            self.total += int(value[:15], 16)
+
+    def finalize(self) -> str:
+        return str(self.total)
+
+
+class SQLiteSettings:
+    """Where a SQLite database lives and the pragmas every connection to it gets
+
+    `:memory:` is turned into a named in-memory database with a shared cache, so
+    every connection of one DatabaseConnection (pooled or not) sees the same
+    data while two `:memory:` connections stay separate databases.
+    """
+
+    def __init__(
+        self,
+        database: str = MEMORY,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        cache_size: int = -64000,
+        mmap_size: int = 256 * 1024 * 1024,
+        busy_timeout: float = 5.0,
+    ):
+        self.database = database
+        self.in_memory = database == MEMORY
+        if self.in_memory:
+            self.name = f"memory_{next(_memory_ids)}"
+            self.uri = f"file:sa_orm_{self.name}?mode=memory&cache=shared"
+        else:
+            self.name = self.uri = database
+        self.pragmas = {
+            # WAL needs a file, in-memory databases always journal in memory
+            "journal_mode": "MEMORY" if self.in_memory else journal_mode,
+            "synchronous": synchronous,
+            "cache_size": cache_size,
+            "mmap_size": mmap_size,
+        }
+        self.busy_timeout = busy_timeout
+
+    def open(self) -> sqlite3.Connection:
+        # Connections are handed between threads (pool, fan-out) but only ever
+        # used by one of them at a time
+        conn = sqlite3.connect(
+            self.uri,
+            uri=self.in_memory,
+            timeout=self.busy_timeout,
+            check_same_thread=False,
+        )
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}").fetchall()
+        # SQLite has no MD5, the checksums of the shadow verifier use these
+        conn.create_function("sa_orm_row_hash", -1, row_hash, deterministic=True)
+        conn.create_aggregate("sa_orm_hash_sum", 1, HashSum)
+        return conn
+
+
+class DatabaseConnection(BaseDC):
+    """Manages SQLite database connections using the standard library sqlite3
+
+    `database` is a file path or `:memory:`. `synchronous`, `cache_size`
+    (pages, or KiB when negative) and `mmap_size` (bytes) are set as pragmas
+    on every connection; file databases use WAL unless `journal_mode` says
+    otherwise.
+    """
+
+    def __init__(
+        self,
+        database: str = MEMORY,
+        pool: Optional[Dict[str, Any]] = None,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        cache_size: int = -64000,
+        mmap_size: int = 256 * 1024 * 1024,
+        busy_timeout: float = 5.0,
+    ):
+        super().__init__(DatabaseType.SQLITE)
+        self.settings = SQLiteSettings(
+            database, journal_mode, synchronous, cache_size, mmap_size, busy_timeout
+        )
+        self._connection = None
+        if pool is not None:
+            # A shared-cache in-memory database disappears with its last
+            # connection, keep one open while the pool reaps idle ones
+            if self.settings.in_memory:
+                self.connect()
+            self.enable_pool(**pool)
+
+    def open_connection(self) -> Any:
+        return self.settings.open()
+
+    def enable_prepared_statements(self, max_size: int = 128, threshold: int = 5):
+        raise ValueError(
+            "SQLite has no server-side prepared statements, sqlite3 already "
+            "reuses compiled statements per connection"
+        )
+
+    def is_usable(self, conn: Any) -> bool:
+        try:
+            conn.total_changes
+            return True
+        except sqlite3.ProgrammingError:
+            return False
+
+    def connect(self) -> Any:
+        try:
+            self._connection = self.open_connection()
+            log(
+                f"Connected to SQLite database: {self.settings.database} "
+                f"(SQLite {sqlite3.sqlite_version})",
+                "DEBUG",
+            )
+            return self._connection
+        except Exception as e:
+            log(f"Error connecting to database: {e}", "ERROR")
+            raise
+
+    def disconnect(self):
+        if self._pool is not None:
+            self._pool.close()
+        if self._connection is not None and self.is_usable(self._connection):
+            self._connection.close()
+            log(f"{self} Database connection closed", "DEBUG")
+
+    @property
+    def connection(self):
+        if self._connection is None or not self.is_usable(self._connection):
+            self.connect()
+        return self._connection
+
+    def __repr__(self) -> str:
+        return f"sqlite@{self.settings.name}"
@@ -0,0 +1,335 @@
+import re
+import sqlite3
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Tuple
+from ..base.ops import BaseOperations, cached_sql
+from ..base.declare import BaseDC, DatabaseType
+from ..base.schema import TableSchema
+
+# RETURNING arrived in SQLite 3.35, older versions read the row back instead
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_PLACEHOLDERS = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|%s|%%")
+
+
+@lru_cache(maxsize=1024)
+def to_qmark(query: str) -> str:
+    """Rewrite the `%s` placeholders used across the ORM to sqlite3's `?`
+
+    Quoted strings and identifiers are left as they are.
+    """
+
+    def replace(match: re.Match) -> str:
+        token = match.group()
+        if token == "%s":
+            return "?"
+        if token == "%%":
+            return "%"
+        return token
+
+    return _PLACEHOLDERS.sub(replace, query)
+
+
+class SQLiteOperations(BaseOperations):
+    """SQLite-specific database operations"""
+
+    # SQLITE_MAX_VARIABLE_NUMBER default since SQLite 3.32
+    max_bind_params = 32766
+    returning = HAS_RETURNING
+
+    def create_table_sql(
+        self,
+        table_name: str,
+        columns: Dict[str, str],
+        primary_key: str,
+        if_not_exists: bool = True,
+    ) -> str:
+        if_not_exists_clause = "IF NOT EXISTS" if if_not_exists else ""
+
+        column_defs = []
+        for col_name, col_type in columns.items():
+            column_defs.append(f"{col_name} {col_type}")
+
+        # Add primary key if not specified in columns. AUTOINCREMENT keeps ids of
+        # deleted rows from being handed out again, like SERIAL/AUTO_INCREMENT
+        if primary_key not in columns:
+            column_defs.insert(0, f"{primary_key} INTEGER PRIMARY KEY AUTOINCREMENT")
+
+        columns_str = ", ".join(column_defs)
+
+        return f"""
+        CREATE TABLE {if_not_exists_clause} {table_name} (
+            {columns_str}
+        )
+        """
+
+    @cached_sql
+    def insert_sql(self, table_name: str, columns: List[str]) -> str:
+        placeholders = ["%s"] * len(columns)
+        return f"""
+        INSERT INTO {table_name} ({", ".join(columns)})
+        VALUES ({", ".join(placeholders)})
+        {"RETURNING *" if HAS_RETURNING else ""}
+        """
+
+    @cached_sql
+    def bulk_insert_sql(
+        self, table_name: str, columns: List[str], row_count: int
+    ) -> str:
+        return f"""
+        {super().bulk_insert_sql(table_name, columns, row_count)}
+        {"RETURNING *" if HAS_RETURNING else ""}
+        """
+
+    def bulk_insert(
+        self,
+        db: BaseDC,
+        table_name: str,
+        primary_key: str,
+        columns: List[str],
+        rows: List[tuple],
+    ) -> List[Dict[str, Any]]:
+        """For SQLite, a multi-row INSERT ... RETURNING * gives back every created record"""
+        records = []
+        for batch in self.batch_rows(rows, len(columns)):
+            query = self.bulk_insert_sql(table_name, columns, len(batch))
+            params = tuple(value for row in batch for value in row)
+            result = self.execute_query(db, query, params, fetch=True)
+
+            if not HAS_RETURNING:
+                # Keys of one INSERT are consecutive and end at last_insert_rowid()
+                first_id = result["lastrowid"] - len(batch) + 1
+                for i, row in enumerate(batch):
+                    record = dict(zip(columns, row))
+                    record[primary_key] = first_id + i
+                    records.append(record)
+                continue
+
+            # RETURNING does not promise row order, the keys ascend with it
+            batch_records = [
+                self.row_to_dict(db, table_name, result, row)
+                for row in result["result"]
+            ]
+            batch_records.sort(key=lambda record: record[primary_key])
+            records.extend(batch_records)
+        return records
+
+    def bulk_copy(
+        self, db: BaseDC, table_name: str, columns: List[str], rows: List[tuple]
+    ) -> int:
+        """For SQLite, rows are loaded with executemany in one transaction"""
+        if db.db_type != DatabaseType.SQLITE:
+            raise ValueError(f"Expected SQLite connection, got {db.db_type}")
+
+        query = f"""
+        INSERT INTO {table_name} ({", ".join(columns)})
+        VALUES ({", ".join(["?"] * len(columns))})
+        """
+
+        with db.checkout() as conn:
+            cursor = conn.cursor()
+
+            try:
+                cursor.executemany(query, rows)
+                conn.commit()
+                rowcount = cursor.rowcount
+                cursor.close()
+                return rowcount
+
+            except Exception as e:
+                conn.rollback()
+                cursor.close()
+                raise Exception from e
+
+    def row_hash_sql(self, columns: Tuple[str, ...]) -> str:
+        """For SQLite, hashed by a function every connection registers (see db.py)"""
+        return f"sa_orm_row_hash({', '.join(columns)})"
+
+    def hash_sum_sql(self, row_hash: str) -> str:
+        return f"sa_orm_hash_sum({row_hash})"
+
+    @cached_sql
+    def upsert_sql(
+        self,
+        table_name: str,
+        columns: List[str],
+        conflict_on: List[str],
+        row_count: int = 1,
+    ) -> str:
+        return f"""
+        {super().upsert_sql(table_name, columns, conflict_on, row_count)}
+        {"RETURNING *" if HAS_RETURNING else ""}
+        """
+
+    @cached_sql
+    def update_sql(self, table_name: str, columns: List[str], primary_key: str) -> str:
+        placeholders = [f"{col} = %s" for col in columns]
+        return f"""
+        UPDATE {table_name}
+        SET {", ".join(placeholders)}
+        WHERE {primary_key} = %s
+        {"RETURNING *" if HAS_RETURNING else ""}
+        """
+
+    def limit_sql(self, limit: bool, offset: bool) -> str:
+        """For SQLite, OFFSET needs a LIMIT, a negative one stands for none"""
+        if offset and not limit:
+            return "LIMIT -1 OFFSET %s"
+        return super().limit_sql(limit, offset)
+
+    def execute_query(
+        self,
+        db: BaseDC,
+        query: str,
+        params: tuple = (),
+        fetch: bool = False,
+    ) -> Any:
+        if db.db_type != DatabaseType.SQLITE:
+            raise ValueError(f"Expected SQLite connection, got {db.db_type}")
+
+        with db.checkout() as conn:
+            return self._execute(conn, query, params, fetch)
+
+    def _execute(self, conn: Any, query: str, params: tuple, fetch: bool) -> Any:
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(to_qmark(query), params or ())
+
+            # Statements returning rows (SELECT, RETURNING) are only finished,
+            # and their rowcount known, once every row was stepped through
+            columns = (
+                [desc[0] for desc in cursor.description] if cursor.description else None
+            )
+            result = cursor.fetchall() if columns is not None else None
+            rowcount = cursor.rowcount
+            lastrowid = cursor.lastrowid
+            conn.commit()
+            cursor.close()
+
+            if fetch:
+                return {
+                    "result": result,
+                    "lastrowid": lastrowid,
+                    "rowcount": rowcount,
+                    "columns": columns,
+                }
+
+            # Return both rowcount and last_id for insert operations
+            return {"rowcount": rowcount, "lastrowid": lastrowid}
+
+        except Exception as e:
+            conn.rollback()
+            cursor.close()
+            raise Exception from e
+
+    def iter_query(
+        self, db: BaseDC, query: str, params: tuple = (), batch_size: int = 1000
+    ) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """For SQLite, the cursor steps through the result as rows are fetched"""
+        if db.db_type != DatabaseType.SQLITE:
+            raise ValueError(f"Expected SQLite connection, got {db.db_type}")
+
+        with db.streaming() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(to_qmark(query), params or ())
+                columns = [desc[0] for desc in cursor.description]
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield columns, rows
+            finally:
+                cursor.close()
+
+    def execute_batch(
+        self, db: BaseDC, statements: List[Tuple[str, tuple]]
+    ) -> List[int]:
+        if db.db_type != DatabaseType.SQLITE:
+            raise ValueError(f"Expected SQLite connection, got {db.db_type}")
+
+        with db.checkout() as conn:
+            return self._execute_batch(conn, statements)
+
+    def _execute_batch(
+        self, conn: Any, statements: List[Tuple[str, tuple]]
+    ) -> List[int]:
+        cursor = conn.cursor()
+
+        try:
+            rowcounts = []
+            for query, params in statements:
+                cursor.execute(to_qmark(query), params or ())
+                if cursor.description:
+                    cursor.fetchall()
+                rowcounts.append(cursor.rowcount)
+            conn.commit()
+            cursor.close()
+            return rowcounts
+
+        except Exception as e:
+            conn.rollback()
+            cursor.close()
+            raise Exception from e
+
+    def describe_table(self, db: BaseDC, table_name: str) -> TableSchema:
+        with db.checkout() as conn:
+            column_info = conn.execute(f"PRAGMA table_info({table_name})").fetchall()
+
+        # table_info rows are (cid, name, type, notnull, dflt_value, pk)
+        primary_key = next((col[1] for col in column_info if col[5] == 1), None)
+        return TableSchema(
+            table_name,
+            [col[1] for col in column_info],
+            {col[1]: col[2] for col in column_info},
+            primary_key,
+        )
+
+    def handle_insert_result(
+        self,
+        db: BaseDC,
+        table_name: str,
+        primary_key: str,
+        insert_result: Any,
+        insert_params: tuple,
+    ) -> Dict[str, Any]:
+        """For SQLite, the RETURNING clause gives us the created record directly"""
+        if insert_result["result"]:
+            return self.row_to_dict(
+                db, table_name, insert_result, insert_result["result"][0]
+            )
+
+        last_id = insert_result.get("lastrowid")
+        if HAS_RETURNING or not last_id:
+            raise Exception("Failed to create record")
+        return self._select_by_pk(db, table_name, primary_key, last_id)
+
+    def handle_update_result(
+        self,
+        db: BaseDC,
+        table_name: str,
+        primary_key: str,
+        pk_value: Any,
+        update_result: Any,
+    ) -> Dict[str, Any]:
+        """For SQLite, the RETURNING clause gives us the updated record directly"""
+        if update_result["result"]:
+            return self.row_to_dict(
+                db, table_name, update_result, update_result["result"][0]
+            )
+
+        if HAS_RETURNING:
+            raise Exception(f"Failed to update record with ID {pk_value}")
+        return self._select_by_pk(db, table_name, primary_key, pk_value)
+
+    def _select_by_pk(
+        self, db: BaseDC, table_name: str, primary_key: str, pk_value: Any
+    ) -> Dict[str, Any]:
+        select_query = self.select_by_pk_sql(table_name, primary_key)
+        result = self.execute_query(db, select_query, (pk_value,), fetch=True)
+
+        if not result["result"]:
+            raise Exception(f"Failed to retrieve record with ID {pk_value}")
+
+        return self.row_to_dict(db, table_name, result, result["result"][0])
@@ -0,0 +1,66 @@
+"""Fixtures running the models against in-memory SQLite databases"""
+
+import pytest
+
+from sa_orm.base.conn import createConnection
+from sa_orm.base.declare import DatabaseType
+from sa_orm.base_model import BaseModel
+
+COLUMNS = {"name": "VARCHAR(100) NOT NULL", "email": "VARCHAR(255)", "age": "INTEGER"}
+
+
+def sqlite_db(database=":memory:", **options):
+    return createConnection(database=database, db_type=DatabaseType.SQLITE, **options)
+
+
+@pytest.fixture
+def make_db():
+    """New databases, in memory unless a file is given, disconnected after the test"""
+    dbs = []
+
+    def make(**options):
+        db = sqlite_db(**options)
+        dbs.append(db)
+        return db
+
+    yield make
+    for db in dbs:
+        db.disconnect()
+
+
+@pytest.fixture
+def make_model(make_db):
+    """A fresh model class per call, its table created on every database
+
+    `shadows` adds that many shadow databases behind the primary, extra
+    keyword arguments become class attributes.
+    """
+
+    def make(shadows=0, columns=COLUMNS, dbs=None, **attrs):
+        model = type("User", (BaseModel,), {"_table_name": "users", **attrs})
+        model.set_database(dbs or [make_db() for _ in range(shadows + 1)])
+        model.create_table(columns)
+        return model
+
+    return make
+
+
+@pytest.fixture
+def User(make_model):
+    return make_model()
+
+
+@pytest.fixture
+def read_rows():
+    """Every row of a table on one database, read behind the ORM's back"""
+
+    def read(db, table="users", order_by="id"):
+        conn = db.settings.open()
+        try:
+            cursor = conn.execute(f"SELECT * FROM {table} ORDER BY {order_by}")
+            names = [d[0] for d in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+    return read
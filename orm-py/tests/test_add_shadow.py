@@ -0,0 +1,135 @@
+import json
+import os
+import threading
+
+import pytest
+
+from sa_orm.base_model import OperationsFactory
+
+
+@pytest.fixture
+def User(make_model):
+    model = make_model()
+    model.bulk_create([{"name": f"user{i}", "age": i} for i in range(50)])
+    return model
+
+
+def test_add_shadow_copies_and_attaches(User, make_db, read_rows):
+    shadow = make_db()
+    stats = User.add_shadow(shadow, chunk_size=8, fsync=False)
+    assert stats["rows"] == 50
+    assert stats["captured"] == 0
+    assert User._shadows == [shadow]
+    assert User._backfills == {}
+    assert read_rows(shadow) == read_rows(User._db)
+
+    User.find_by_id(3).update(age=99)
+    assert read_rows(shadow)[2]["age"] == 99
+
+
+def test_writes_during_the_copy_are_replayed(User, make_db, read_rows, monkeypatch):
+    shadow = make_db()
+    copy_rows = User._copy_rows
+
+    def copy_then_write(*args):
+        copied = copy_rows(*args)
+        User.create(name="new")
+        User.find_by_id(1).update(age=-1)
+        User.delete_by_id(2)
+        User.update_where({"email": "x"}, "age > %s", (40,))
+        return copied
+
+    monkeypatch.setattr(User, "_copy_rows", copy_then_write)
+    stats = User.add_shadow(shadow, chunk_size=16, fsync=False)
+    assert stats["captured"] == 4
+    assert read_rows(shadow) == read_rows(User._db)
+
+
+def test_failed_backfill_resumes_from_its_checkpoint(
+    User, make_db, read_rows, tmp_path, monkeypatch
+):
+    shadow = make_db()
+    ops = OperationsFactory.get_operations(shadow)
+    bulk_copy = ops.bulk_copy
+    calls = []
+
+    def fail_third_chunk(db, *args):
+        calls.append(db)
+        if len(calls) == 3:
+            raise RuntimeError("shadow went away")
+        return bulk_copy(db, *args)
+
+    monkeypatch.setattr(ops, "bulk_copy", fail_third_chunk)
+    with pytest.raises(RuntimeError, match="went away"):
+        User.add_shadow(
+            shadow, chunk_size=10, checkpoint_dir=str(tmp_path), fsync=False
+        )
+    assert User._shadows == []
+    assert User._backfills == {}
+    with open(tmp_path / "copy.json", encoding="utf-8") as f:
+        assert json.load(f)["finished"] is False
+    assert len(read_rows(shadow)) == 20
+
+    stats = User.add_shadow(
+        shadow, chunk_size=10, checkpoint_dir=str(tmp_path), fsync=False
+    )
+    assert stats["rows"] == 30
+    assert User._shadows == [shadow]
+    assert read_rows(shadow) == read_rows(User._db)
+    assert not os.path.exists(tmp_path / "copy.json")
+
+
+def test_checkpoint_belongs_to_one_shadow(User, make_db, tmp_path):
+    other = make_db()
+    (tmp_path / "copy.json").write_text(
+        json.dumps({"owner": f"{other}:users", "low": 5, "finished": False})
+    )
+    with pytest.raises(ValueError, match="belongs to"):
+        User.add_shadow(make_db(), checkpoint_dir=str(tmp_path), fsync=False)
+    assert User._shadows == []
+
+
+def test_add_shadow_validation(User, make_db):
+    shadow = make_db()
+    User.add_shadow(shadow, fsync=False)
+    with pytest.raises(ValueError, match="already a database"):
+        User.add_shadow(shadow)
+    with pytest.raises(ValueError, match="already a database"):
+        User.add_shadow(User._db)
+    with pytest.raises(ValueError, match="positive"):
+        User.add_shadow(make_db(), chunk_size=0)
+
+
+def test_transaction_committed_after_attach_reaches_the_shadow(
+    make_model, make_db, read_rows, tmp_path, monkeypatch
+):
+    pool = {"max_size": 4}
+    User = make_model(dbs=[make_db(database=str(tmp_path / "primary.db"), pool=pool)])
+    User.bulk_create([{"name": f"user{i}"} for i in range(10)])
+    shadow = make_db(database=str(tmp_path / "shadow.db"), pool=pool)
+
+    written, attached = threading.Event(), threading.Event()
+
+    def write_in_transaction():
+        # The capture is decided while copying, the commit comes after attach
+        with User.transaction():
+            User.create(name="late")
+            written.set()
+            attached.wait(10)
+
+    writer = threading.Thread(target=write_in_transaction)
+    copy_rows = User._copy_rows
+
+    def copy_then_write(*args):
+        copied = copy_rows(*args)
+        writer.start()
+        written.wait(10)
+        return copied
+
+    monkeypatch.setattr(User, "_copy_rows", copy_then_write)
+    User.add_shadow(shadow, chunk_size=4, fsync=False)
+    attached.set()
+    writer.join()
+
+    assert read_rows(shadow) == read_rows(User._db)
+    assert read_rows(shadow)[-1]["name"] == "late"
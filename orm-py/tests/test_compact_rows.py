@@ -0,0 +1,97 @@
+import gc
+import pickle
+import weakref
+
+import pytest
+
+from conftest import COLUMNS
+from sa_orm.base_model import BaseModel
+
+
+class Account(BaseModel):
+    """Module level, so pickle can find it by name"""
+
+    _table_name = "accounts"
+    _compact_rows = True
+
+
+@pytest.fixture
+def accounts(make_db):
+    Account.set_database([make_db()])
+    Account.create_table(COLUMNS)
+    Account.bulk_create([{"name": "a", "age": 1}, {"name": "b", "age": 2}])
+    return Account
+
+
+def test_compact_instances_have_no_dict(accounts):
+    row = accounts.find_by_id(1)
+    assert type(row).__slots__ == ("id", "name", "email", "age")
+    assert not hasattr(row, "__dict__")
+    assert isinstance(row, Account)
+    assert repr(row) == "Account({'id': 1, 'name': 'a', 'email': None, 'age': 1})"
+
+
+def test_compact_instances_reject_other_attributes(accounts):
+    row = accounts.find_by_id(1)
+    with pytest.raises(AttributeError):
+        row.nickname = "x"
+    assert row.dirty_fields() == []
+
+
+def test_compact_instances_save_changes(accounts):
+    row = accounts.find_by_id(1)
+    row.age = 5
+    assert row.dirty_fields() == ["age"]
+    row.save()
+    assert row.dirty_fields() == []
+    assert accounts.find_by_id(1).age == 5
+
+
+def test_compact_instances_pickle(accounts):
+    row = accounts.find_by_id(1)
+    row.age = 5
+    copy = pickle.loads(pickle.dumps(row))
+    assert type(copy) is type(row)
+    assert copy._fields() == row._fields()
+    assert copy.dirty_fields() == ["age"]
+    assert copy._persisted
+
+
+def test_regular_instances_keep_their_dict(accounts):
+    account = Account(name="c")
+    assert isinstance(account, Account)
+    assert type(account) is Account
+    account.nickname = "x"
+    assert account.__dict__ == {"name": "c", "nickname": "x"}
+    assert weakref.ref(account)() is account
+
+
+def test_saved_instances_load_compact(accounts):
+    account = Account(name="c")
+    account.save()
+    assert hasattr(account, "__dict__")
+    assert not hasattr(accounts.find_by_id(account.id), "__dict__")
+
+
+def test_regular_instances_pickle(accounts):
+    account = Account(name="c", nickname="x")
+    copy = pickle.loads(pickle.dumps(account))
+    assert type(copy) is Account
+    assert copy.__dict__ == account.__dict__
+    assert copy.dirty_fields() == ["name", "nickname"]
+    assert not copy._persisted
+
+
+def test_rows_of_other_models_are_of_the_model(User):
+    assert type(User.create(name="c")) is User
+    assert type(User.find_by_id(1)) is User
+
+
+def test_compact_classes_go_away_with_their_model(make_model):
+    model = make_model(_compact_rows=True)
+    model.create(name="a")
+    compact = weakref.ref(type(model.find_by_id(1)))
+    model.disconnect()
+    del model
+    gc.collect()
+    assert compact() is None
@@ -0,0 +1,67 @@
+def test_loaded_instance_is_clean(User):
+    user = User.create(name="a", email="a@x", age=1)
+    assert user.dirty_fields() == []
+    assert User.find_by_id(user.id).dirty_fields() == []
+
+
+def test_assignment_marks_changed_columns(User):
+    user = User.create(name="a", email="a@x", age=1)
+    user.name = "a"
+    assert user.dirty_fields() == []
+    user.name = "b"
+    user.age = 2
+    assert user.dirty_fields() == ["age", "name"]
+
+
+def test_save_writes_only_dirty_columns(User, read_rows):
+    user = User.create(name="a", email="a@x", age=1)
+    user.age = 2
+    user.save()
+    assert user.dirty_fields() == []
+    assert read_rows(User._db) == [
+        {"id": user.id, "name": "a", "email": "a@x", "age": 2}
+    ]
+
+
+def test_save_without_changes_is_a_noop(User, monkeypatch):
+    user = User.create(name="a", email="a@x", age=1)
+    monkeypatch.setattr(User, "_mirror_operation", None)
+    assert user.save() is user
+
+
+def test_update_keeps_unwritten_columns_dirty(User, read_rows):
+    user = User.create(name="a", email="a@x", age=1)
+    user.name = "changed"
+    user.update(email="y")
+
+    assert user.dirty_fields() == ["name"]
+    assert user.name == "changed"
+    assert user.email == "y"
+    assert read_rows(User._db)[0]["name"] == "a"
+
+    user.save()
+    assert user.dirty_fields() == []
+    assert read_rows(User._db)[0] == {
+        "id": user.id,
+        "name": "changed",
+        "email": "y",
+        "age": 1,
+    }
+
+
+def test_update_of_a_dirty_column_cleans_it(User):
+    user = User.create(name="a", email="a@x", age=1)
+    user.name = "changed"
+    user.age = 5
+    user.update(name="other")
+    assert user.name == "other"
+    assert user.dirty_fields() == ["age"]
+
+
+def test_update_without_refresh_keeps_unwritten_columns_dirty(make_model):
+    User = make_model(_refresh=False)
+    user = User.create(name="a", email="a@x", age=1)
+    user.age = 7
+    user.update(email="y")
+    assert user.dirty_fields() == ["age"]
+    assert user.age == 7
@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+from sa_orm.base.fanout import ShadowFanout, _get_executor, _shadow_slots
+from sa_orm.base.transaction import transaction
+
+
+def test_parallel_writes_reach_every_shadow(make_model, read_rows):
+    User = make_model(shadows=2)
+    User.set_shadow_fanout(parallel=True, timeout=5)
+    user = User.create(name="a")
+    user.update(age=3)
+    for shadow in User._shadows:
+        assert read_rows(shadow) == read_rows(User._db)
+
+
+def test_executor_per_max_workers():
+    small, large = _get_executor(2), _get_executor(5)
+    assert small is not large
+    assert small._max_workers == 2
+    assert large._max_workers == 5
+    assert _get_executor(2) is small
+    assert _get_executor(None) is _get_executor(32)
+
+
+def test_failures_and_timeouts_are_reported_per_shadow():
+    def write(shadow):
+        if shadow == "slow":
+            time.sleep(0.5)
+        if shadow == "broken":
+            raise RuntimeError("down")
+        return shadow
+
+    fanout = ShadowFanout(parallel=True, timeout=0.2, max_workers=3)
+    results, failures = fanout.run(write, ["ok", "broken", "slow"])
+    assert results == ["ok", None, None]
+    assert isinstance(failures[0]["broken"], RuntimeError)
+    assert isinstance(failures[1]["slow"], TimeoutError)
+
+
+def test_serial_mode_keeps_shadow_order():
+    seen = []
+    results, failures = ShadowFanout().run(seen.append, ["a", "b"])
+    assert seen == ["a", "b"]
+    assert failures == []
+
+
+def test_shadow_failure_raises_after_the_primary_wrote(make_model, read_rows):
+    User = make_model(shadows=1)
+    User.set_shadow_fanout(parallel=True)
+    conn = User._shadows[0].settings.open()
+    conn.execute("DROP TABLE users")
+    conn.close()
+
+    with pytest.raises(Exception, match="Failed to create shadows"):
+        User.create(name="a")
+    assert [row["name"] for row in read_rows(User._db)] == ["a"]
+
+
+def test_timeout_starts_once_the_shadow_is_free():
+    held = threading.Event()
+
+    def hold(shadow):
+        held.set()
+        time.sleep(0.3)
+
+    holder = threading.Thread(
+        target=ShadowFanout(parallel=True).run, args=(hold, ["busy", "idle"])
+    )
+    holder.start()
+    held.wait(5)
+    fanout = ShadowFanout(parallel=True, timeout=0.2)
+    results, failures = fanout.run(lambda shadow: time.sleep(0.05) or shadow, ["busy"])
+    holder.join()
+    assert (results, failures) == (["busy"], [])
+
+
+def test_timed_out_write_blocks_the_shadow_until_it_finished():
+    release, applied = threading.Event(), []
+
+    def stuck(shadow):
+        release.wait(5)
+        applied.append(shadow)
+
+    fanout = ShadowFanout(parallel=True, timeout=0.05)
+    _, failures = fanout.run(stuck, ["stuck"])
+    assert isinstance(failures[0]["stuck"], TimeoutError)
+
+    _, failures = fanout.run(applied.append, ["stuck"])
+    assert "timed out" in str(failures[0]["stuck"])
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while _shadow_slots["stuck"].holder is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert fanout.run(applied.append, ["stuck"])[1] == []
+    # The write that timed out was still applied
+    assert applied == ["stuck", "stuck"]
+
+
+def test_timed_out_write_in_transaction_finishes_before_returning():
+    applied = []
+
+    def slow(shadow):
+        time.sleep(0.2)
+        applied.append(shadow)
+
+    with transaction():
+        _, failures = ShadowFanout(parallel=True, timeout=0.05).run(slow, ["txn"])
+        assert applied == ["txn"]
+    assert isinstance(failures[0]["txn"], TimeoutError)
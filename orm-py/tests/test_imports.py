@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+# Only imported by the features using them, see benchmarks/import_time.py
+DEFERRED = [
+    "sa_orm.base.backfill",
+    "sa_orm.base.journal",
+    "concurrent.futures",
+    "shutil",
+    "tempfile",
+]
+DRIVERS = ["mysql", "psycopg", "psycopg_pool", "aiomysql"]
+
+
+def imported_after(code):
+    """Modules of DEFERRED and DRIVERS loaded by `code` in a fresh interpreter"""
+    check = f"{code}; import json, sys; print(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-c", check],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": SRC},
+    )
+    modules = set(json.loads(proc.stdout.splitlines()[-1]))
+    return sorted(m for m in modules if m in DEFERRED or m.split(".")[0] in DRIVERS)
+
+
+def test_base_model_defers_feature_modules():
+    assert imported_after("import sa_orm.base_model, sa_orm.base.conn") == []
+
+
+def test_sqlite_connection_defers_feature_modules():
+    code = (
+        "from sa_orm.base.conn import createConnection; "
+        "from sa_orm.base.declare import DatabaseType; "
+        "createConnection(database=':memory:', db_type=DatabaseType.SQLITE)"
+    )
+    assert imported_after(code) == []
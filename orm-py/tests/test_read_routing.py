@@ -0,0 +1,119 @@
+import pytest
+
+from sa_orm.base.routing import ReadRouter, shadow_health
+from sa_orm.base_model import OperationsFactory
+from sa_orm.session import session
+
+
+@pytest.fixture
+def User(make_model):
+    model = make_model(shadows=2)
+    model.bulk_create([{"name": f"user{i}", "age": 1} for i in range(4)])
+    model.set_read_routing("round_robin")
+    return model
+
+
+@pytest.fixture
+def fail_on(User, monkeypatch):
+    """Make statements starting with `prefix` fail once on `db`"""
+    ops = OperationsFactory.get_operations(User._db)
+    execute_query = ops.execute_query
+    failing = {}
+
+    def spy(db, query, *args, **kwargs):
+        if failing.get(db) and query.lstrip().startswith(failing[db]):
+            del failing[db]
+            raise RuntimeError(f"{db} is down")
+        return execute_query(db, query, *args, **kwargs)
+
+    monkeypatch.setattr(ops, "execute_query", spy)
+
+    def fail(db, prefix):
+        failing[db] = prefix
+
+    return fail
+
+
+def reads(User):
+    return User.read_routing_stats()["reads"]
+
+
+def test_round_robin_over_the_shadows(User):
+    for _ in range(4):
+        assert User.find_by_id(1).age == 1
+    assert reads(User) == {f"{db}": 2 for db in User._shadows}
+    assert User.read_routing_stats()["skipped"] == []
+
+
+def test_missed_write_keeps_the_shadow_unreadable(User, fail_on):
+    stale = User._shadows[0]
+    fail_on(stale, "UPDATE")
+    with pytest.raises(Exception):
+        User.find_by_id(1).update(age=2)
+    User.create(name="unrelated")
+
+    served = reads(User)[f"{stale}"]
+    for _ in range(4):
+        assert User.find_by_id(1).age == 2
+    assert reads(User)[f"{stale}"] == served
+    assert User.read_routing_stats()["skipped"] == [f"{stale}"]
+
+
+def test_verify_shadows_makes_a_repaired_shadow_readable(User, fail_on):
+    stale = User._shadows[0]
+    fail_on(stale, "UPDATE")
+    with pytest.raises(Exception):
+        User.find_by_id(1).update(age=2)
+
+    User.verify_shadows()
+    assert not shadow_health.healthy(stale, "users")
+
+    stats = User.verify_shadows(repair=True)
+    assert stats["shadows"][f"{stale}"]["repaired"] == 1
+    assert shadow_health.healthy(stale, "users")
+    served = reads(User)[f"{stale}"]
+    assert [User.find_by_id(1).age for _ in range(2)] == [2, 2]
+    assert reads(User)[f"{stale}"] == served + 1
+
+
+def test_reset_shadow_health(User, fail_on):
+    stale = User._shadows[0]
+    fail_on(stale, "UPDATE")
+    with pytest.raises(Exception):
+        User.find_by_id(1).update(age=2)
+
+    User.reset_shadow_health(stale)
+    assert User.read_routing_stats()["skipped"] == []
+
+
+def test_failed_read_falls_back_until_the_next_write(User, fail_on):
+    first = User._shadows[0]
+    fail_on(first, "SELECT")
+    assert User.find_by_id(1).age == 1
+    assert User.read_routing_stats()["skipped"] == [f"{first}"]
+
+    User.create(name="next")
+    assert User.read_routing_stats()["skipped"] == []
+
+
+def test_session_reads_its_own_writes_on_the_primary(User):
+    with session():
+        User.find_by_id(1).update(age=5)
+        assert User.find_by_id(1).age == 5
+    # Only the read before the session's first write went to a shadow
+    assert reads(User) == {f"{User._shadows[0]}": 1, f"{User._db}": 1}
+
+
+def test_router_choices(User):
+    primary, shadows = User._db, User._shadows
+    router = ReadRouter("round_robin", include_primary=True)
+    assert [router.choose(primary, shadows) for _ in range(3)] == [primary, *shadows]
+    assert ReadRouter("round_robin").choose(primary, []) is primary
+
+    weighted = ReadRouter("weighted", weights={shadows[1]: 1, primary: 0})
+    assert {weighted.choose(primary, shadows) for _ in range(10)} == {shadows[1]}
+
+    with pytest.raises(ValueError, match="Unknown routing strategy"):
+        ReadRouter("random")
+    with pytest.raises(ValueError, match="needs weights"):
+        ReadRouter("weighted")
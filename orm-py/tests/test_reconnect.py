@@ -0,0 +1,164 @@
+import time
+
+import pytest
+
+from sa_orm.base.declare import BaseDC, DatabaseType
+from sa_orm.mysql_orm.ops import MySQLOperations
+
+
+class ClientError(Exception):
+    """Stands in for mysql.connector's errors, which carry the client errno"""
+
+    def __init__(self, errno):
+        super().__init__(f"client error {errno}")
+        self.errno = errno
+
+
+class FakeCursor:
+    description = None
+    lastrowid = 0
+    rowcount = 1
+    with_rows = False
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, query, params=()):
+        self.conn.attempts.append(query)
+        if self.conn.drop_with is not None:
+            errno, self.conn.drop_with = self.conn.drop_with, None
+            self.conn.connected = errno not in (2006, 2013)
+            raise ClientError(errno)
+        if not self.conn.connected:
+            raise ClientError(2006)
+        self.conn.statements.append(query)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.connected = True
+        self.drop_with = None  # errno the next statement fails with
+        self.attempts = []
+        self.statements = []
+        self.pings = 0
+
+    def cursor(self, **options):
+        return FakeCursor(self)
+
+    def is_connected(self):
+        self.pings += 1
+        return self.connected
+
+    def commit(self):
+        if not self.connected:
+            raise ClientError(2006)
+
+    rollback = commit
+
+
+class FakeDC(BaseDC):
+    """Opens a new fake connection whenever the shared one was dropped"""
+
+    def __init__(self, ping_after=None):
+        super().__init__(DatabaseType.MYSQL)
+        self.ping_after = ping_after
+        self._connection = None
+        self.opened = []
+
+    def open_connection(self):
+        self.opened.append(FakeConnection())
+        return self.opened[-1]
+
+    def connect(self):
+        self._connection = self.open_connection()
+
+    def disconnect(self):
+        self._connection = None
+
+    def close_connection(self, conn):
+        pass
+
+    def is_usable(self, conn):
+        return conn.is_connected()
+
+    @property
+    def connection(self):
+        if not self._connection:
+            self.connect()
+        return self._connection
+
+
+@pytest.fixture
+def ops():
+    return MySQLOperations()
+
+
+@pytest.fixture
+def db(ops):
+    db = FakeDC()
+    ops.execute_query(db, "SELECT 1")
+    return db
+
+
+def test_gone_away_is_retried_on_a_new_connection(ops, db):
+    db.opened[0].drop_with = 2006
+    ops.execute_query(db, "UPDATE users SET age = 1")
+    assert len(db.opened) == 2
+    assert db.opened[1].statements == ["UPDATE users SET age = 1"]
+
+
+def test_lost_read_is_retried(ops, db):
+    db.opened[0].drop_with = 2013
+    ops.execute_query(db, "\n  SELECT * FROM users", fetch=False)
+    assert db.opened[1].statements == ["\n  SELECT * FROM users"]
+
+
+def test_lost_write_is_not_retried(ops, db):
+    db.opened[0].drop_with = 2013
+    with pytest.raises(Exception):
+        ops.execute_query(db, "UPDATE users SET age = 1")
+    assert len(db.opened) == 1
+
+    # The dead connection was still dropped
+    ops.execute_query(db, "SELECT 1")
+    assert len(db.opened) == 2
+
+
+def test_batch_is_retried_when_gone_away(ops, db):
+    db.opened[0].drop_with = 2006
+    statements = [("UPDATE users SET age = 1", ()), ("DELETE FROM users", ())]
+    assert ops.execute_batch(db, statements) == [1, 1]
+    assert db.opened[1].statements == [query for query, _ in statements]
+
+
+def test_pinned_connection_is_not_retried(ops, db):
+    with db.pinned():
+        db.opened[0].drop_with = 2006
+        with pytest.raises(Exception):
+            ops.execute_query(db, "SELECT 1")
+    assert len(db.opened) == 1
+
+
+def test_other_errors_are_not_retried(ops, db):
+    db.opened[0].drop_with = 1064
+    with pytest.raises(Exception):
+        ops.execute_query(db, "SELECT 1")
+    assert db.opened[0].attempts == ["SELECT 1", "SELECT 1"]
+
+
+def test_idle_connection_is_pinged_before_use(ops):
+    db = FakeDC(ping_after=0.05)
+    ops.execute_query(db, "SELECT 1")
+    ops.execute_query(db, "SELECT 2")
+    first = db.opened[0]
+    assert first.pings == 0
+
+    # The server closed it while idle, nothing was sent to it
+    first.connected = False
+    time.sleep(0.1)
+    ops.execute_query(db, "UPDATE users SET age = 1")
+    assert first.attempts == ["SELECT 1", "SELECT 2"]
+    assert db.opened[1].statements == ["UPDATE users SET age = 1"]
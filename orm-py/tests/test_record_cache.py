@@ -0,0 +1,105 @@
+import time
+
+import pytest
+
+from sa_orm.base.cache import RecordCache
+from sa_orm.session import session
+
+
+@pytest.fixture
+def User(make_model):
+    model = make_model()
+    model.bulk_create([{"name": f"user{i}", "age": i} for i in range(5)])
+    model.enable_record_cache(max_entries=100, ttl=60)
+    return model
+
+
+def change(User, query):
+    """Write behind the ORM's back"""
+    conn = User._db.settings.open()
+    try:
+        conn.execute(query)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_find_by_id_is_served_from_the_cache(User):
+    first = User.find_by_id(1)
+    change(User, "UPDATE users SET age = 99 WHERE id = 1")
+    second = User.find_by_id(1)
+    assert second.age == 0
+    assert second is not first
+    stats = User.record_cache_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_cached_rows_are_copies(User):
+    user = User.find_by_id(1)
+    user.age = 50
+    assert User.find_by_id(1).age == 0
+
+
+def test_session_returns_one_instance_per_row(User):
+    with session():
+        assert User.find_by_id(2) is User.find_by_id(2)
+    assert User.find_by_id(2) is not User.find_by_id(2)
+
+
+def test_writes_refresh_or_drop_the_row(User):
+    User.find_by_id(1).update(age=7)
+    change(User, "UPDATE users SET age = 99 WHERE id = 1")
+    assert User.find_by_id(1).age == 7
+
+    User.delete_by_id(1)
+    assert User.find_by_id(1) is None
+
+    User.find_by_id(2)
+    User.update_where({"age": 8}, "id = %s", (2,))
+    assert User.find_by_id(2).age == 8
+
+
+def test_find_all_and_create_fill_the_cache(User):
+    User.find_all()
+    created = User.create(name="new", age=1)
+    misses = User.record_cache_stats()["misses"]
+    assert User.find_by_id(3).name == "user2"
+    assert User.find_by_id(created.id).name == "new"
+    assert User.record_cache_stats()["misses"] == misses
+
+
+def test_rows_expire_after_ttl(User):
+    User.enable_record_cache(ttl=0.05)
+    User.find_by_id(1)
+    change(User, "UPDATE users SET age = 99 WHERE id = 1")
+    time.sleep(0.1)
+    assert User.find_by_id(1).age == 99
+    assert User.record_cache_stats()["expirations"] == 1
+
+
+def test_least_recently_used_rows_are_evicted(User):
+    User.enable_record_cache(max_entries=2)
+    for record_id in (1, 2, 1, 3):
+        User.find_by_id(record_id)
+    stats = User.record_cache_stats()
+    assert (stats["size"], stats["evictions"]) == (2, 1)
+    misses = stats["misses"]
+    User.find_by_id(1)
+    assert User.record_cache_stats()["misses"] == misses
+    User.find_by_id(2)
+    assert User.record_cache_stats()["misses"] == misses + 1
+
+
+def test_disabled_cache_reads_the_database(User):
+    User.disable_record_cache()
+    User.find_by_id(1)
+    change(User, "UPDATE users SET age = 99 WHERE id = 1")
+    assert User.find_by_id(1).age == 99
+    assert User.record_cache_stats() is None
+
+
+def test_record_cache_validation():
+    with pytest.raises(ValueError, match="max_entries"):
+        RecordCache(max_entries=0)
+    with pytest.raises(ValueError, match="ttl"):
+        RecordCache(ttl=0)
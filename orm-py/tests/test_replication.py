@@ -0,0 +1,91 @@
+import pytest
+
+from sa_orm.base.journal import ShadowReplicator, WriteBehindReplicator
+from sa_orm.base_model import OperationsFactory
+
+
+@pytest.fixture
+def async_model(make_model, tmp_path):
+    models = []
+
+    def make(**options):
+        model = make_model(shadows=1)
+        model.set_replication("async", journal_dir=str(tmp_path), **options)
+        models.append(model)
+        return model
+
+    yield make
+    for model in models:
+        if model._replicator is not None:
+            model._replicator.close()
+
+
+def test_async_writes_reach_the_shadow(async_model, read_rows):
+    User = async_model(fsync=False)
+    user = User.create(name="a")
+    user.update(age=2)
+    User.create(name="b").delete()
+    assert User.flush_replication(10)
+    assert read_rows(User._shadows[0]) == read_rows(User._db)
+    assert User.replication_status()[f"{User._shadows[0]}"]["lag"] == 0
+
+
+def test_shared_journal_dir_needs_the_same_options(async_model):
+    async_model(fsync=False)
+    async_model(fsync=False)
+    with pytest.raises(ValueError):
+        async_model(fsync=False, batch_size=10)
+
+
+def test_journal_names_keep_distinct_shadows_apart():
+    class Named:
+        def __init__(self, name):
+            self.name = name
+
+        def __str__(self):
+            return self.name
+
+    names = {
+        WriteBehindReplicator.journal_name(Named(name))
+        for name in ["db:1/a", "db:1_a", "db_1/a"]
+    }
+    assert len(names) == 3
+    assert WriteBehindReplicator.journal_name(
+        Named("db:1/a")
+    ) == WriteBehindReplicator.journal_name(Named("db:1/a"))
+
+
+def test_two_connections_to_one_shadow_cannot_share_a_journal(make_db, tmp_path):
+    path = str(tmp_path / "shadow.db")
+    first, second = make_db(database=path), make_db(database=path)
+    replicator = WriteBehindReplicator(
+        str(tmp_path / "journal"), OperationsFactory.get_operations, fsync=False
+    )
+    try:
+        replicator.replicator(first)
+        with pytest.raises(ValueError):
+            replicator.replicator(second)
+    finally:
+        replicator.close()
+
+
+def test_ddl_records_are_applied_in_a_batch_of_their_own():
+    def record(*queries):
+        return {"statements": [[query, []] for query in queries]}
+
+    insert = record("INSERT INTO users (name) VALUES (%s)")
+    ddl = record("  create table if not exists users (id INTEGER)")
+    assert ShadowReplicator._batch_length([insert, insert, ddl, insert]) == 2
+    assert ShadowReplicator._batch_length([ddl, insert]) == 1
+    assert ShadowReplicator._batch_length([record("DROP TABLE users"), ddl]) == 1
+    assert ShadowReplicator._batch_length([insert, insert]) == 2
+
+
+def test_async_table_changes_reach_the_shadow(async_model, read_rows):
+    User = async_model(fsync=False)
+    User.create(name="a")
+    User.drop_table()
+    User.create_table({"name": "VARCHAR(100)"})
+    User.create(name="b")
+    assert User.flush_replication(10)
+    assert read_rows(User._shadows[0]) == read_rows(User._db)
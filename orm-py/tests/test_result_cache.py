@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+from sa_orm.base.cache import MemoryStore, ResultCache
+
+
+@pytest.fixture
+def User(make_model):
+    model = make_model()
+    model.bulk_create([{"name": f"user{i}", "age": i} for i in range(5)])
+    model.enable_result_cache(ttl=60)
+    return model
+
+
+def change(User, query):
+    """Write behind the ORM's back"""
+    conn = User._db.settings.open()
+    try:
+        conn.execute(query)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_repeated_query_is_served_from_memory(User):
+    assert len(User.find_all("age > %s", (1,))) == 3
+    change(User, "DELETE FROM users")
+    assert len(User.find_all("age > %s", (1,))) == 3
+    stats = User.result_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_params_are_part_of_the_key(User):
+    assert len(User.find_all("age > %s", (1,))) == 3
+    assert len(User.find_all("age > %s", (3,))) == 1
+    assert User.result_cache_stats()["misses"] == 2
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda User: User.create(name="new", age=9),
+        lambda User: User.bulk_create([{"name": "new", "age": 9}]),
+        lambda User: User.find_by_id(1).update(age=9),
+        lambda User: User.delete_by_id(1),
+        lambda User: User.update_where({"age": 9}, "id = %s", (1,)),
+    ],
+)
+def test_writes_retire_cached_results(User, write):
+    before = [(u.id, u.age) for u in User.find_all()]
+    write(User)
+    after = [(u.id, u.age) for u in User.find_all()]
+    assert after != before
+    assert User.result_cache_stats()["hits"] == 0
+
+
+def test_instances_are_not_shared(User):
+    User.find_all()[0].age = 50
+    assert User.find_all()[0].age == 0
+
+
+def test_concurrent_misses_load_once():
+    cache = ResultCache(ttl=60)
+    started, release = threading.Event(), threading.Event()
+    loads = []
+
+    def load():
+        loads.append(1)
+        started.set()
+        release.wait(10)
+        return ["row"]
+
+    results = []
+
+    def read():
+        results.append(cache.get_or_load("k", load))
+
+    leader = threading.Thread(target=read)
+    leader.start()
+    started.wait(10)
+    followers = [threading.Thread(target=read) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    deadline = time.monotonic() + 10
+    while cache.stats()["waits"] < 3 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert loads == [1]
+    assert results == [["row"]] * 4
+    assert cache.stats()["loading"] == 0
+
+
+def test_failed_load_is_not_cached():
+    cache = ResultCache(ttl=60)
+    with pytest.raises(ZeroDivisionError):
+        cache.get_or_load("k", lambda: 1 / 0)
+    assert cache.get_or_load("k", lambda: ["row"]) == ["row"]
+
+
+def test_memory_store_evicts_by_size():
+    store = MemoryStore(max_bytes=2000)
+    for key in range(10):
+        store.set(key, ["x" * 200], None)
+    stats = store.stats()
+    assert stats["bytes"] <= 2000
+    assert stats["evictions"] > 0
+    assert store.get(9) == ["x" * 200]
+    assert store.get(0) is None
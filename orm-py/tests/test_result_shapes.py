@@ -0,0 +1,99 @@
+import array
+from decimal import Decimal
+
+import pytest
+
+from sa_orm.base import shapes
+from sa_orm.base.shapes import ColumnBuilder
+
+ROWS = [(1, "a", None, 10), (2, "b", "b@x", 20), (3, "c", None, 30)]
+
+
+@pytest.fixture(autouse=True)
+def without_numpy(monkeypatch):
+    """The array/list columns, whether or not NumPy is installed"""
+    monkeypatch.setattr(shapes, "_numpy", False)
+
+
+@pytest.fixture
+def User(make_model):
+    model = make_model()
+    model.bulk_create(
+        [{"name": n, "email": e, "age": a} for _, n, e, a in ROWS],
+    )
+    return model
+
+
+def test_tuples_and_dicts(User):
+    assert User.find_all(as_="tuples") == ROWS
+    assert User.find_all("age > %s", (15,), as_="dicts") == [
+        {"id": 2, "name": "b", "email": "b@x", "age": 20},
+        {"id": 3, "name": "c", "email": None, "age": 30},
+    ]
+
+
+def test_columns(User):
+    columns = User.find_all(as_="columns")
+    assert list(columns) == ["id", "name", "email", "age"]
+    assert columns["id"] == array.array("q", [1, 2, 3])
+    assert columns["age"] == array.array("q", [10, 20, 30])
+    assert columns["name"] == ["a", "b", "c"]
+    assert columns["email"] == [None, "b@x", None]
+
+
+def test_columns_of_an_empty_result(User):
+    assert User.find_all("age > %s", (99,), as_="columns") == {
+        "id": [],
+        "name": [],
+        "email": [],
+        "age": [],
+    }
+
+
+def test_columns_through_the_result_cache(User):
+    User.enable_result_cache()
+    try:
+        for _ in range(2):
+            assert User.find_all(as_="columns")["age"] == array.array("q", [10, 20, 30])
+        assert User.result_cache_stats()["hits"] == 1
+    finally:
+        User.disable_result_cache()
+
+
+def test_query_shapes(User):
+    query = User.query().select("name", "age").where("age < %s", 25)
+    assert query.all(as_="tuples") == [("a", 10), ("b", 20)]
+    assert query.all(as_="columns") == {
+        "name": ["a", "b"],
+        "age": array.array("q", [10, 20]),
+    }
+    assert list(query.iter(batch_size=1, as_="dicts")) == [
+        {"name": "a", "age": 10},
+        {"name": "b", "age": 20},
+    ]
+
+
+def test_iter_all_shapes(User):
+    assert list(User.iter_all(batch_size=2, as_="tuples")) == ROWS
+    with pytest.raises(ValueError, match="Unknown result shape"):
+        list(User.iter_all(as_="columns"))
+    with pytest.raises(ValueError, match="Unknown result shape"):
+        User.find_all(as_="frames")
+
+
+def test_column_falls_back_to_a_list_keeping_earlier_batches():
+    builder = ColumnBuilder(["n", "x"])
+    builder.add([(1, 0.5), (2, 1.5)])
+    builder.add([(None, 2)])
+    builder.add([(2**70, Decimal("1.1"))])
+    result = builder.result()
+    assert result["n"] == [1, 2, None, 2**70]
+    assert result["x"] == [0.5, 1.5, 2, Decimal("1.1")]
+
+
+def test_columns_with_numpy(User, monkeypatch):
+    numpy = pytest.importorskip("numpy")
+    monkeypatch.setattr(shapes, "_numpy", numpy)
+    columns = User.find_all(as_="columns")
+    assert isinstance(columns["age"], numpy.ndarray)
+    assert columns["age"].tolist() == [10, 20, 30]
@@ -0,0 +1,182 @@
+import pytest
+
+from sa_orm.base.declare import BaseDC, DatabaseType
+from sa_orm.base.transaction import transaction
+from sa_orm.mysql_orm.ops import MySQLOperations
+from sa_orm.postgres_orm.ops import PostgreSQLOperations
+
+
+def test_commit_writes_primary_and_shadows_once(make_model, read_rows):
+    User = make_model(shadows=1)
+    with User.transaction() as txn:
+        User.create(name="a")
+        User.create(name="b")
+    for db in [User._db, *User._shadows]:
+        assert [row["name"] for row in read_rows(db)] == ["a", "b"]
+    assert txn.stats()["commits"] == 2
+    assert txn.stats()["commits_saved"] > 0
+
+
+def test_exception_rolls_back_every_database(make_model, read_rows):
+    User = make_model(shadows=1)
+    User.create(name="kept")
+    with pytest.raises(RuntimeError):
+        with User.transaction():
+            User.create(name="a")
+            User.find_all()[0].update(name="changed")
+            raise RuntimeError("abort")
+    for db in [User._db, *User._shadows]:
+        assert [row["name"] for row in read_rows(db)] == ["kept"]
+
+
+def test_rollback_retires_cached_reads(make_model):
+    User = make_model()
+    User.enable_record_cache()
+    user = User.create(name="a")
+    with pytest.raises(RuntimeError):
+        with User.transaction():
+            user.update(name="b")
+            raise RuntimeError("abort")
+    assert User.find_by_id(user.id).name == "a"
+
+
+def test_failed_statement_dooms_the_transaction(User, read_rows):
+    with pytest.raises(Exception):
+        with User.transaction():
+            User.create(name="a")
+            with pytest.raises(Exception):
+                User.create(email="no name")
+    assert read_rows(User._db) == []
+
+
+def test_nested_transaction_joins_the_outer_one(User):
+    with User.transaction() as outer:
+        with User.transaction() as inner:
+            User.create(name="a")
+    assert inner is outer
+    assert len(User.find_all()) == 1
+
+
+def test_abandoned_stream_keeps_the_transaction(User, read_rows):
+    User.bulk_create([{"name": f"user{i}"} for i in range(10)])
+    with User.transaction():
+        for user in User.iter_all(batch_size=2):
+            break
+        User.create(name="after")
+    assert len(read_rows(User._db)) == 11
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.description = [("id",)]
+        self.closed = False
+
+    def execute(self, query, params=()):
+        pass
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.cursors = []
+        self.calls = []
+
+    def cursor(self, **options):
+        self.cursors.append(FakeCursor(self.rows))
+        return self.cursors[-1]
+
+    def commit(self):
+        self.calls.append("commit")
+
+    def rollback(self):
+        self.calls.append("rollback")
+
+    def close(self):
+        self.calls.append("close")
+
+
+class FakeDC(BaseDC):
+    """Hands out one fake driver connection, enough to drive iter_query()"""
+
+    def __init__(self, db_type):
+        super().__init__(db_type)
+        self.conn = FakeConnection([(i,) for i in range(10)])
+
+    def connect(self):
+        return self.conn
+
+    def disconnect(self):
+        pass
+
+    def open_connection(self):
+        return self.conn
+
+    def close_connection(self, conn):
+        pass
+
+    @property
+    def connection(self):
+        return self.conn
+
+
+STREAMS = [
+    (DatabaseType.MYSQL, MySQLOperations),
+    (DatabaseType.POSTGRESQL, PostgreSQLOperations),
+]
+
+
+def abandon(ops, db):
+    stream = ops.iter_query(db, "SELECT id FROM users", batch_size=2)
+    next(stream)
+    stream.close()
+
+
+@pytest.mark.parametrize("db_type, operations", STREAMS)
+def test_abandoned_stream_in_transaction_leaves_connection_usable(db_type, operations):
+    db = FakeDC(db_type)
+    with transaction() as txn:
+        abandon(operations(), db)
+        assert not txn.failed
+    assert db.conn.calls == ["commit"]
+    assert db.conn.cursors[0].closed
+
+
+def test_abandoned_mysql_stream_in_transaction_is_drained():
+    db = FakeDC(DatabaseType.MYSQL)
+    with transaction():
+        abandon(MySQLOperations(), db)
+    assert db.conn.cursors[0].rows == []
+
+
+@pytest.mark.parametrize("db_type, operations", STREAMS)
+def test_abandoned_stream_on_pinned_connection_leaves_it_open(db_type, operations):
+    db = FakeDC(db_type)
+    with db.pinned():
+        abandon(operations(), db)
+    assert "close" not in db.conn.calls
+    assert "rollback" not in db.conn.calls
+    assert db.conn.cursors[0].closed
+
+
+def test_abandoned_stream_of_its_own_drops_the_connection():
+    mysql = FakeDC(DatabaseType.MYSQL)
+    abandon(MySQLOperations(), mysql)
+    assert mysql.conn.calls == ["close"]
+
+    postgres = FakeDC(DatabaseType.POSTGRESQL)
+    abandon(PostgreSQLOperations(), postgres)
+    assert postgres.conn.calls == ["rollback"]
@@ -0,0 +1,69 @@
+import pytest
+
+COLUMNS = {
+    "name": "VARCHAR(100) NOT NULL",
+    "email": "VARCHAR(255) UNIQUE",
+    "age": "INTEGER",
+}
+
+
+@pytest.fixture
+def User(make_model):
+    model = make_model(shadows=1, columns=COLUMNS)
+    model.bulk_create(
+        [{"name": f"user{i}", "email": f"{i}@x", "age": i} for i in range(3)]
+    )
+    return model
+
+
+def assert_mirrored(User, read_rows):
+    assert read_rows(User._shadows[0]) == read_rows(User._db)
+
+
+def test_upsert_inserts_then_updates(User, read_rows):
+    created = User.upsert(email="new@x", name="Ann", age=30, conflict_on="email")
+    assert created.id == 4
+    updated = User.upsert(email="new@x", name="Anna", age=31, conflict_on="email")
+    assert (updated.id, updated.name, updated.age) == (4, "Anna", 31)
+    assert updated.dirty_fields() == []
+    assert len(read_rows(User._db)) == 4
+    assert_mirrored(User, read_rows)
+
+
+def test_upsert_on_the_primary_key_by_default(User, read_rows):
+    user = User.upsert(id=2, name="renamed", email="1@x", age=1)
+    assert (user.id, user.name) == (2, "renamed")
+    assert read_rows(User._db)[1]["name"] == "renamed"
+    assert_mirrored(User, read_rows)
+
+
+def test_bulk_upsert_merges_and_batches(User, read_rows):
+    users = User.bulk_upsert(
+        [
+            {"email": "0@x", "name": "zero", "age": 10},
+            {"email": "a@x", "name": "a"},
+            {"email": "b@x", "name": "b", "age": 2},
+            {"email": "a@x", "name": "a again", "age": 5},
+        ],
+        conflict_on=["email"],
+        batch_size=2,
+    )
+    assert {u.email: (u.name, u.age) for u in users} == {
+        "0@x": ("zero", 10),
+        "a@x": ("a again", 5),
+        "b@x": ("b", 2),
+    }
+    rows = {row["email"]: row for row in read_rows(User._db)}
+    assert len(rows) == 5
+    assert rows["0@x"]["id"] == 1
+    assert rows["a@x"]["name"] == "a again"
+    assert_mirrored(User, read_rows)
+
+
+def test_bulk_upsert_writes_columns_missing_from_a_row_as_null(User, read_rows):
+    User.bulk_upsert(
+        [{"email": "0@x", "name": "zero"}, {"email": "1@x", "name": "one", "age": 9}],
+        conflict_on="email",
+    )
+    assert [row["age"] for row in read_rows(User._db)] == [None, 9, 2]
+    assert_mirrored(User, read_rows)
@@ -0,0 +1,75 @@
+import pytest
+
+from sa_orm.sqlite_orm.db import row_hash
+
+
+def change(db, query, params=()):
+    """Write to one database behind the ORM's back"""
+    conn = db.settings.open()
+    try:
+        conn.execute(query, params)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def User(make_model):
+    User = make_model(shadows=2)
+    User.bulk_create([{"name": f"user{i}", "age": i % 7} for i in range(200)])
+    return User
+
+
+def test_clean_shadows(User):
+    stats = User.verify_shadows(chunk_size=50, leaf_size=10)
+    assert stats["rows"] == 200
+    assert stats["chunks"] == 4
+    for found in stats["shadows"].values():
+        assert found["chunks"] == 0
+        assert found["diverged"] == 0
+
+
+def test_reports_changed_missing_and_extra_rows(User):
+    shadow = User._shadows[0]
+    change(shadow, "UPDATE users SET age = 99 WHERE id = 7")
+    change(shadow, "UPDATE users SET email = 'x' WHERE id = 120")
+    change(shadow, "DELETE FROM users WHERE id = 50")
+    change(User._db, "DELETE FROM users WHERE id = 150")
+
+    stats = User.verify_shadows(chunk_size=50, leaf_size=10)
+    found = stats["shadows"][f"{shadow}"]
+    assert found["keys"] == [7, 50, 120, 150]
+    assert found["diverged"] == 4
+    assert found["repaired"] == 0
+    assert stats["shadows"][f"{User._shadows[1]}"]["diverged"] == 1
+
+
+def test_repair_copies_the_primary_rows(User, read_rows):
+    shadow = User._shadows[1]
+    change(shadow, "UPDATE users SET name = 'drift' WHERE id BETWEEN 10 AND 19")
+    change(shadow, "DELETE FROM users WHERE id = 180")
+
+    stats = User.verify_shadows(chunk_size=64, leaf_size=8, repair=True)
+    assert stats["shadows"][f"{shadow}"]["repaired"] == 11
+    assert read_rows(shadow) == read_rows(User._db)
+    again = User.verify_shadows(chunk_size=64, leaf_size=8)
+    assert all(found["diverged"] == 0 for found in again["shadows"].values())
+
+
+def test_values_containing_the_separator_do_not_collide(make_model):
+    assert row_hash("a|", "b") != row_hash("a", "|b")
+    assert row_hash("1:a", None) != row_hash("1", ":a")
+
+    User = make_model(shadows=1)
+    User.create(name="a|", email="b")
+    change(User._shadows[0], "UPDATE users SET name = 'a', email = '|b'")
+    stats = User.verify_shadows()
+    assert stats["shadows"][f"{User._shadows[0]}"]["keys"] == [1]
+
+
+def test_null_and_empty_string_differ(make_model):
+    User = make_model(shadows=1)
+    User.create(name="a", email="")
+    change(User._shadows[0], "UPDATE users SET email = NULL")
+    stats = User.verify_shadows()
+    assert stats["shadows"][f"{User._shadows[0]}"]["keys"] == [1]
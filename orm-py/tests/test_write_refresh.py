@@ -0,0 +1,46 @@
+import pytest
+
+from sa_orm.base_model import OperationsFactory
+
+
+@pytest.fixture
+def no_returning(User, monkeypatch):
+    """Like MySQL: no RETURNING, so refresh decides whether rows are read back"""
+    monkeypatch.setattr(OperationsFactory.get_operations(User._db), "returning", False)
+    User.set_write_refresh(False)
+    return User
+
+
+def test_create_without_refresh_has_every_column(no_returning):
+    user = no_returning.create(name="a")
+    assert user.email is None
+    assert user.age is None
+    assert user.dirty_fields() == []
+    assert user._fields() == {"id": user.id, "name": "a", "email": None, "age": None}
+
+
+def test_save_after_create_without_refresh_writes_unsent_columns(no_returning):
+    user = no_returning.create(name="a")
+    user.age = 3
+    user.save()
+    assert no_returning.find_by_id(user.id).age == 3
+
+
+def test_bulk_create_without_refresh_has_every_column(no_returning):
+    users = no_returning.bulk_create([{"name": "a"}, {"name": "b", "age": 2}])
+    assert [(u.name, u.email, u.age) for u in users] == [
+        ("a", None, None),
+        ("b", None, 2),
+    ]
+
+
+def test_compact_rows_without_refresh(no_returning):
+    no_returning._compact_rows = True
+    user = no_returning.create(name="a")
+    assert (user.name, user.email, user.age) == ("a", None, None)
+
+
+def test_update_without_refresh_keeps_loaded_columns(no_returning):
+    user = no_returning.create(name="a", age=1)
+    user.update(email="e")
+    assert (user.name, user.email, user.age) == ("a", "e", 1)
@@ -0,0 +1,92 @@
+import pytest
+
+from sa_orm.base.routing import shadow_health
+from sa_orm.base_model import OperationsFactory
+
+
+@pytest.fixture
+def User(make_model):
+    model = make_model(shadows=1)
+    model.bulk_create([{"name": f"user{i}", "age": i % 10} for i in range(100)])
+    return model
+
+
+@pytest.fixture
+def statements(User, monkeypatch):
+    """Write statements run on each database, as (db, query)"""
+    ops = OperationsFactory.get_operations(User._db)
+    execute_query = ops.execute_query
+    seen = []
+
+    def spy(db, query, params=None, *args, **kwargs):
+        if query.startswith(("UPDATE", "DELETE")):
+            seen.append((db, query))
+        return execute_query(db, query, params, *args, **kwargs)
+
+    monkeypatch.setattr(ops, "execute_query", spy)
+    return seen
+
+
+def primary_statements(User, statements):
+    return [query for db, query in statements if db is User._db]
+
+
+def test_update_where_without_chunks_is_one_statement(User, statements, read_rows):
+    assert User.update_where({"email": "x"}, "age < %s", (5,)) == 50
+    assert len(primary_statements(User, statements)) == 1
+    for db in [User._db, *User._shadows]:
+        assert sum(row["email"] == "x" for row in read_rows(db)) == 50
+
+
+def test_update_where_in_chunks(User, statements, read_rows):
+    assert User.update_where({"email": "x"}, "age < %s", (5,), chunk_size=20) == 50
+    assert len(primary_statements(User, statements)) == 3
+    for db in [User._db, *User._shadows]:
+        rows = read_rows(db)
+        assert [r["id"] for r in rows if r["email"] == "x"] == [
+            r["id"] for r in rows if r["age"] < 5
+        ]
+
+
+def test_update_where_chunks_rows_that_stop_matching(User, read_rows):
+    assert User.update_where({"age": 0}, "age > %s", (0,), chunk_size=7) == 90
+    for db in [User._db, *User._shadows]:
+        assert {row["age"] for row in read_rows(db)} == {0}
+
+
+def test_delete_where_in_chunks_over_gaps(User, statements, read_rows):
+    User.delete_where("id %% 3 = %s", (0,))
+    statements.clear()
+
+    assert User.delete_where("age >= %s", (5,), chunk_size=10) == 33
+    assert len(primary_statements(User, statements)) == 4
+    for db in [User._db, *User._shadows]:
+        rows = read_rows(db)
+        assert len(rows) == 34
+        assert all(row["age"] < 5 and row["id"] % 3 for row in rows)
+
+
+def test_write_where_reports_shadow_count_mismatch(User):
+    shadow = User._shadows[0]
+    conn = shadow.settings.open()
+    try:
+        conn.execute("DELETE FROM users WHERE id <= 10")
+        conn.commit()
+    finally:
+        conn.close()
+
+    assert User.update_where({"email": "x"}, "1 = 1") == 100
+    assert not shadow_health.healthy(shadow, "users")
+    assert shadow_health.healthy(User._db, "users")
+
+
+def test_write_where_validation(User):
+    with pytest.raises(ValueError, match="where clause"):
+        User.delete_where("")
+    with pytest.raises(ValueError, match="chunk_size"):
+        User.delete_where("1 = 1", chunk_size=0)
+    with pytest.raises(ValueError, match="cannot be updated"):
+        User.update_where({"id": 1}, "1 = 1", chunk_size=10)
+    with pytest.raises(ValueError, match="No values"):
+        User.update_where({}, "1 = 1")
+    assert len(User.find_all()) == 100